@@ -1,9 +1,26 @@
 """
 AIs used to determine which move to pick in a battle.
+
+Every AI is created with the battle creature it picks moves for and the
+battle's source of randomness, select_move is then called each turn with
+the creature it is fighting.
 """
 
 import random
 
+import CreatureRogue.battle_calculations as battle_calculations
+import CreatureRogue.battle_probabilities as battle_probabilities
+from CreatureRogue.data_layer.data import HP_STAT, SPEED_STAT
+from CreatureRogue.data_layer.move_data import MoveData
+from CreatureRogue.data_layer.species import Species
+from CreatureRogue.models.battle_creature import BattleCreature
+from CreatureRogue.models.move import Move
+
+# Move scores are in units of the opponent's max hp.
+KO_BONUS = 1.0
+STAT_STAGE_VALUE = 0.1
+REPLY_WEIGHT = 1.0
+
 
 class RandomMoveAi:
     """
@@ -11,10 +28,11 @@ class RandomMoveAi:
     ones (i.e. those with PP > 0).
     """
 
-    def __init__(self, battle_creature):
+    def __init__(self, battle_creature, rng=random):
         self.battle_creature = battle_creature
+        self.rng = rng
 
-    def select_move(self):
+    def select_move(self, opponent=None):
         """
         Should use struggle if the creature has no moves. Just doesn't
         select a move for now.
@@ -23,4 +41,247 @@ class RandomMoveAi:
         if len(pp_moves) == 0:
             return None
 
-        return random.choice(pp_moves)
+        return self.rng.choice(pp_moves)
+
+
+class ExpectedDamageCache:
+    """
+    Per battle memo of how much damage a move is expected to do, keyed on
+    the move and everything about the two creatures that goes into
+    hit_calculation and damage_calculation (their species for the type
+    modifiers, the attacker's level and the in battle stat values).
+
+    Stat values only change when a move changes them so most turns re-use
+    the previous turn's entries.
+    """
+
+    def __init__(self, type_chart):
+        self.type_chart = type_chart
+        self.hits = 0
+        self.misses = 0
+        self._memo = {}  # type: dict[tuple, tuple[float, float, int, int]]
+
+    def expected_damage(
+        self,
+        move_data: MoveData,
+        attacker_species: Species,
+        attacker_level: int,
+        defender_species: Species,
+        attack_value: float,
+        defence_value: float,
+        accuracy_value: float,
+        evasion_value: float,
+    ) -> tuple[float, float, int, int]:
+        """
+        :return: The chance the move hits, the mean damage if it hits
+        (including critical hits) and the damage of a non-critical and a
+        critical hit.
+        """
+        key = (
+            move_data,
+            attacker_species,
+            attacker_level,
+            defender_species,
+            attack_value,
+            defence_value,
+            accuracy_value,
+            evasion_value,
+        )
+        expected = self._memo.get(key)
+        if expected is not None:
+            self.hits += 1
+            return expected
+
+        self.misses += 1
+        hit = battle_calculations.hit_chance(move_data.base_accuracy, accuracy_value, evasion_value)
+        if move_data.damage_move():
+            distribution = battle_calculations.damage_distributions(
+                attacker_level,
+                attack_value,
+                defence_value,
+                move_data.base_attack,
+                move_data.type in attacker_species.types,
+                self.type_chart.combined_modifier(move_data.type, defender_species.types),
+            )
+            expected = (
+                hit,
+                float(distribution.mean),
+                int(distribution.damage),
+                int(distribution.critical_damage),
+            )
+        else:
+            expected = (hit, 0.0, 0, 0)
+
+        self._memo[key] = expected
+        return expected
+
+
+class GreedyMoveAi(RandomMoveAi):
+    """
+    AI which picks the move with the best expected result this turn.
+
+    Moves are scored by the expected fraction of the opponent's max hp
+    they remove (a bonus is added for the chance of a knock out) plus the
+    expected value of any stat changes. Stat changes are valued at
+    STAT_STAGE_VALUE per stage in the creature's favour.
+    """
+
+    def __init__(self, battle_creature: BattleCreature, rng=random):
+        super().__init__(battle_creature, rng)
+        self.static_game_data = battle_creature.static_game_data
+        self.hp_stat = self.static_game_data.stats[HP_STAT]
+        self.cache = ExpectedDamageCache(self.static_game_data.type_chart)
+
+    def select_move(self, opponent: BattleCreature | None = None) -> Move | None:
+        """
+        :param opponent: The creature being fought, a random move is picked
+        if this isn't passed.
+        """
+        if opponent is None:
+            return super().select_move()
+
+        best_move, best_score = None, None
+        for move in self.battle_creature.creature.moves:
+            if move.pp > 0:
+                score = self.score_move(move, opponent)
+                if best_score is None or score > best_score:
+                    best_move, best_score = move, score
+
+        return best_move
+
+    def _expected_damage(
+        self,
+        move_data: MoveData,
+        attacker: BattleCreature,
+        defender: BattleCreature,
+        attacker_adjusts: dict[int, int] | None = None,
+        defender_adjusts: dict[int, int] | None = None,
+    ) -> tuple[float, float, int, int]:
+        """
+        Expected damage of the move with optional changes to the stat
+        adjustments (by stat id) of either creature, without changing them.
+        """
+        attacker_adjusts = attacker_adjusts or {}
+        defender_adjusts = defender_adjusts or {}
+
+        def attacker_value(stat):
+            return attacker.adjusted_stat_value(stat, attacker_adjusts.get(stat.stat_id, 0))
+
+        def defender_value(stat):
+            return defender.adjusted_stat_value(stat, defender_adjusts.get(stat.stat_id, 0))
+
+        return self.cache.expected_damage(
+            move_data,
+            attacker.creature.species,
+            attacker.creature.level,
+            defender.creature.species,
+            attacker_value(move_data.attack_stat) if move_data.damage_move() else 0,
+            defender_value(move_data.defence_stat) if move_data.damage_move() else 0,
+            attacker_value(move_data.accuracy_stat) if move_data.base_accuracy else 0,
+            defender_value(move_data.evasion_stat) if move_data.base_accuracy else 0,
+        )
+
+    def _stat_changes(self, move: Move, opponent: BattleCreature) -> tuple[bool, dict[int, int]]:
+        """
+        The stat adjustments the move would make if it hit.
+
+        :return: Whether they apply to this creature (rather than the
+        opponent) and the capped change to each stat by stat id.
+        """
+        target = battle_calculations.move_target(move, self.battle_creature, opponent)
+        if target is None or not move.move_data.stat_change_move():
+            return False, {}
+
+        adjusts = target.stat_adjusts
+        changes = {}
+        for stat, value in move.move_data.stat_changes.items():
+            if value != 0:
+                change = max(-6, min(6, adjusts[stat] + value)) - adjusts[stat]
+                if change != 0:
+                    changes[stat.stat_id] = change
+
+        return target is self.battle_creature, changes
+
+    def _ko_chance(self, move: Move, opponent: BattleCreature) -> float:
+        if opponent.creature.current_stat(self.hp_stat) <= 0:
+            return 0.0
+
+        return battle_probabilities.ko_chance(
+            move, self.battle_creature, opponent, self.static_game_data.type_chart
+        )
+
+    def score_move(self, move: Move, opponent: BattleCreature) -> float:
+        hit, mean_damage, _, _ = self._expected_damage(
+            move.move_data, self.battle_creature, opponent
+        )
+        opponent_hp = opponent.creature.current_stat(self.hp_stat)
+        opponent_max_hp = max(1, opponent.creature.max_stat(self.hp_stat))
+
+        score = hit * min(mean_damage, opponent_hp) / opponent_max_hp
+        score += KO_BONUS * self._ko_chance(move, opponent)
+
+        on_self, changes = self._stat_changes(move, opponent)
+        stages = sum(changes.values())
+        score += hit * STAT_STAGE_VALUE * (stages if on_self else -stages)
+
+        return score
+
+
+class LookaheadAi(GreedyMoveAi):
+    """
+    AI which also looks one move ahead at the opponent's best reply.
+
+    Each move's greedy score has the expected damage of the opponent's
+    most damaging reply taken off, worked out with the move's stat
+    changes applied. If this creature moves first and the move could
+    knock the opponent out the reply is scaled by the chance that it
+    doesn't.
+    """
+
+    def _best_reply(
+        self,
+        opponent: BattleCreature,
+        own_adjusts: dict[int, int] | None = None,
+        opponent_adjusts: dict[int, int] | None = None,
+    ) -> float:
+        """
+        The expected damage of the opponent's most damaging move against
+        this creature, capped at this creature's hp.
+        """
+        hp = self.battle_creature.creature.current_stat(self.hp_stat)
+        reply = 0.0
+        for reply_move in opponent.creature.moves:
+            if reply_move.pp > 0:
+                hit, mean_damage, _, _ = self._expected_damage(
+                    reply_move.move_data,
+                    opponent,
+                    self.battle_creature,
+                    opponent_adjusts,
+                    own_adjusts,
+                )
+                reply = max(reply, hit * min(mean_damage, hp))
+
+        return reply
+
+    def score_move(self, move: Move, opponent: BattleCreature) -> float:
+        score = super().score_move(move, opponent)
+
+        hit, _, _, _ = self._expected_damage(move.move_data, self.battle_creature, opponent)
+        reply = self._best_reply(opponent)
+
+        # The stat changes only apply if the move hits.
+        on_self, changes = self._stat_changes(move, opponent)
+        if changes:
+            changed_reply = (
+                self._best_reply(opponent, own_adjusts=changes)
+                if on_self
+                else self._best_reply(opponent, opponent_adjusts=changes)
+            )
+            reply = hit * changed_reply + (1 - hit) * reply
+
+        speed_stat = self.static_game_data.stats[SPEED_STAT]
+        if self.battle_creature.stat_value(speed_stat) > opponent.stat_value(speed_stat):
+            reply *= 1 - self._ko_chance(move, opponent)
+
+        own_max_hp = max(1, self.battle_creature.creature.max_stat(self.hp_stat))
+        return score - REPLY_WEIGHT * reply / own_max_hp
@@ -4,6 +4,9 @@ essentially all of the game logic for battles.
 """
 
 import random
+from dataclasses import dataclass
+
+import numpy as np
 
 import CreatureRogue.data_layer.data as data
 from CreatureRogue.data_layer.data import StaticGameData
@@ -12,18 +15,28 @@ from CreatureRogue.data_layer.stat import Stat
 from CreatureRogue.models.battle_creature import BattleCreature
 from CreatureRogue.models.move import Move
 
+# TODO: Incomplete - should use items and check whether this is a high critical move etc
+CRITICAL_HIT_PERCENT = 6.25
+CRITICAL_HIT_MODIFIER = 2
+SAME_TYPE_ATTACK_BONUS = 1.5
+NUMBER_CATCH_CHECKS = 4
+
 
 def perform_move(
     move: Move,
     attacking_creature: BattleCreature,
     defending_creature: BattleCreature,
     static_game_data: StaticGameData,
+    rng=random,
 ):
     """
     Performs the move by the attacking creature on the defending_creature.
 
     This can change both the attacking creature, the defending creature and
     cause messages to be returned.
+
+    :param rng: Source of randomness (anything with the random.Random
+    interface), defaults to the random module.
     """
     messages = []
 
@@ -36,32 +49,15 @@ def perform_move(
         move.pp -= 1
 
         # Check if the move misses
-        if not hit_calculation(move, attacking_creature, defending_creature):
+        if not hit_calculation(move, attacking_creature, defending_creature, rng):
             messages.append(f"{attacking_creature.creature.in_battle_name()}'s attack missed!")
         else:
-            # TODO: Missing the "specific-move" target and only considering 1v1 battles.
-            target = None
-            if move.move_data.target.identifier in [
-                "user",
-                "users-field",
-                "user-or-ally",
-                "entire-field",
-            ]:
-                target = attacking_creature
-            if move.move_data.target.identifier in [
-                "selected-pokemon",
-                "random-opponent",
-                "all-other-pokemon",
-                "opponents-field",
-                "all-opponents",
-                "entire-field",
-            ]:
-                target = defending_creature
+            target = move_target(move, attacking_creature, defending_creature)
 
             if target:
                 if move.move_data.damage_move():
                     new_messages, hp_loss = damage_calculation(
-                        move, attacking_creature, target, static_game_data.type_chart
+                        move, attacking_creature, target, static_game_data.type_chart, rng
                     )
 
                     messages.extend(new_messages)
@@ -85,21 +81,61 @@ def perform_move(
     return messages
 
 
-def hit_calculation(
+def move_target(
     move: Move, attacking_creature: BattleCreature, defending_creature: BattleCreature
+) -> BattleCreature | None:
+    """
+    The creature which the move's damage and stat changes apply to.
+
+    TODO: Missing the "specific-move" target and only considering 1v1 battles.
+    """
+    target = None
+    if move.move_data.target.identifier in [
+        "user",
+        "users-field",
+        "user-or-ally",
+        "entire-field",
+    ]:
+        target = attacking_creature
+    if move.move_data.target.identifier in [
+        "selected-pokemon",
+        "random-opponent",
+        "all-other-pokemon",
+        "opponents-field",
+        "all-opponents",
+        "entire-field",
+    ]:
+        target = defending_creature
+
+    return target
+
+
+def hit_chance(base_accuracy: int, accuracy_value: float, evasion_value: float) -> float:
+    """
+    The probability that a move with the given base accuracy hits, given
+    the attacker's in battle accuracy and the defender's in battle evasion.
+    """
+    if not base_accuracy:
+        return 0.0
+
+    return min(1.0, base_accuracy / 100 * (accuracy_value / evasion_value))
+
+
+def hit_calculation(
+    move: Move,
+    attacking_creature: BattleCreature,
+    defending_creature: BattleCreature,
+    rng=random,
 ) -> bool:
     """
     Determines whether the move will hit the defending creature.
     This is based on a random check.
     """
     if move.move_data.base_accuracy:
-        return random.random() < (
-            move.move_data.base_accuracy
-            / 100
-            * (
-                attacking_creature.stat_value(move.move_data.accuracy_stat)
-                / defending_creature.stat_value(move.move_data.evasion_stat)
-            )
+        return rng.random() < hit_chance(
+            move.move_data.base_accuracy,
+            attacking_creature.stat_value(move.move_data.accuracy_stat),
+            defending_creature.stat_value(move.move_data.evasion_stat),
         )
 
     return False
@@ -110,6 +146,7 @@ def damage_calculation(
     attacking_creature: BattleCreature,
     defending_creature: BattleCreature,
     type_chart,
+    rng=random,
 ) -> tuple[list[str], int]:
     """
     To calculate the damage that a move does we need to know which
@@ -121,17 +158,15 @@ def damage_calculation(
     defence_stat_value = defending_creature.stat_value(move.move_data.defence_stat)
 
     # Modifiers
-    critical_modifier = (
-        2 if random.uniform(0, 100) < 6.25 else 1
-    )  # TODO: Incomplete - should use items and check whether this is a high critical move etc
+    critical_modifier = CRITICAL_HIT_MODIFIER if rng.uniform(0, 100) < CRITICAL_HIT_PERCENT else 1
     same_type_attack_bonus = (
-        1.5 if move.move_data.type in attacking_creature.creature.species.types else 1
+        SAME_TYPE_ATTACK_BONUS
+        if move.move_data.type in attacking_creature.creature.species.types
+        else 1
+    )
+    type_modifier = type_chart.combined_modifier(
+        move.move_data.type, defending_creature.creature.species.types
     )
-    type_modifier = 1
-    for defending_type in defending_creature.creature.species.types:
-        type_modifier = (
-            type_modifier * type_chart.damage_modifier(move.move_data.type, defending_type) / 100
-        )
 
     modifier = (
         same_type_attack_bonus * type_modifier * critical_modifier
@@ -158,19 +193,170 @@ def damage_calculation(
     )
 
 
-def num_catch_checks_passed(creature: BattleCreature, pokeball: Pokeball, num_shakes: int):
+@dataclass(frozen=True)
+class DamageDistribution:
+    """
+    The possible damage done by attacks. The only random element of the
+    damage calculation is whether the attack is a critical hit, so each
+    attack does either damage or critical_damage.
+
+    Each field is an integer array with one element per attack.
+    """
+
+    damage: np.ndarray
+    critical_damage: np.ndarray
+
+    @property
+    def minimum(self) -> np.ndarray:
+        return np.minimum(self.damage, self.critical_damage)
+
+    @property
+    def maximum(self) -> np.ndarray:
+        return np.maximum(self.damage, self.critical_damage)
+
+    @property
+    def mean(self) -> np.ndarray:
+        critical_chance = CRITICAL_HIT_PERCENT / 100
+        return (1 - critical_chance) * self.damage + critical_chance * self.critical_damage
+
+
+def damage_distributions(
+    levels,
+    attack_stats,
+    defence_stats,
+    base_powers,
+    same_type,
+    type_modifiers,
+) -> DamageDistribution:
+    """
+    The batched form of damage_calculation. Every argument is an array (or
+    anything which broadcasts against the others) with one element per
+    attack, giving exactly the damage that damage_calculation would for
+    the same inputs.
+
+    :param levels: Level of the attacking creature.
+    :param attack_stats: Attacking creature's in battle value of the
+    move's attack stat.
+    :param defence_stats: Defending creature's in battle value of the
+    move's defence stat.
+    :param base_powers: The move's base attack.
+    :param same_type: Whether the move has one of the attacker's types.
+    :param type_modifiers: The type chart modifier (so 1 is default) of
+    the move against the defender's types, see
+    TypeChart.combined_modifiers.
+    """
+    levels = np.asarray(levels, dtype=np.float64)
+    base_damage = ((2 * levels + 10) / 250) * (
+        np.asarray(attack_stats, dtype=np.float64) / np.asarray(defence_stats, dtype=np.float64)
+    ) * np.asarray(base_powers, dtype=np.float64) + 2
+    modifier = np.where(same_type, SAME_TYPE_ATTACK_BONUS, 1.0) * np.asarray(
+        type_modifiers, dtype=np.float64
+    )
+
+    return DamageDistribution(
+        damage=np.trunc(base_damage * modifier).astype(np.int64),
+        critical_damage=np.trunc(base_damage * (modifier * CRITICAL_HIT_MODIFIER)).astype(np.int64),
+    )
+
+
+def move_damage_distribution(
+    move: Move,
+    attacking_creature: BattleCreature,
+    defending_creature: BattleCreature,
+    type_chart,
+) -> DamageDistribution:
+    """
+    The damage that damage_calculation could do for this move between
+    these creatures, as 0-d arrays.
+    """
+    return damage_distributions(
+        attacking_creature.creature.level,
+        attacking_creature.stat_value(move.move_data.attack_stat),
+        defending_creature.stat_value(move.move_data.defence_stat),
+        move.move_data.base_attack,
+        move.move_data.type in attacking_creature.creature.species.types,
+        type_chart.combined_modifier(
+            move.move_data.type, defending_creature.creature.species.types
+        ),
+    )
+
+
+def turn_order(
+    move_a: Move | None,
+    creature_a: BattleCreature,
+    move_b: Move | None,
+    creature_b: BattleCreature,
+    speed_stat: Stat,
+    rng=random,
+) -> list[tuple[Move | None, BattleCreature, BattleCreature]]:
+    """
+    Each turn both creatures select a move and the faster creature goes
+    first. If they are equally fast then a coin is tossed.
+
+    :return: The (move, aggressor, defender) for each creature in the order
+    that the moves are performed.
+    """
+    a_first = (move_a, creature_a, creature_b)
+    b_first = (move_b, creature_b, creature_a)
+    speed_a = creature_a.stat_value(speed_stat)
+    speed_b = creature_b.stat_value(speed_stat)
+
+    if speed_a > speed_b or (speed_a == speed_b and rng.randint(0, 1) == 0):
+        return [a_first, b_first]
+
+    return [b_first, a_first]
+
+
+def perform_turn(
+    move_a: Move | None,
+    creature_a: BattleCreature,
+    move_b: Move | None,
+    creature_b: BattleCreature,
+    static_game_data: StaticGameData,
+    rng=random,
+) -> tuple[list[str], tuple[BattleCreature, BattleCreature] | None]:
+    """
+    Performs both creatures' moves for a turn in turn order. A move can be
+    None if the creature had no valid moves to select from.
+
+    The turn stops as soon as either creature faints so that the fainted
+    creature can't have its turn.
+
+    :return: The messages from the moves and the (aggressor, defender)
+    whose move ended the turn early with a faint, None if neither fainted.
+    """
+    speed_stat = static_game_data.stats[data.SPEED_STAT]
+    messages = []
+
+    for move, aggressor, defender in turn_order(
+        move_a, creature_a, move_b, creature_b, speed_stat, rng
+    ):
+        if move:
+            messages.extend(perform_move(move, aggressor, defender, static_game_data, rng))
+
+            if aggressor.creature.fainted or defender.creature.fainted:
+                return messages, (aggressor, defender)
+
+    return messages, None
+
+
+def num_catch_checks_passed(
+    creature: BattleCreature, pokeball: Pokeball, num_shakes: int, rng=random
+):
     """
     Catching a creature is based on a catch rate (modified from the
     creatures base catch rate), the ball used and a set of random
     checks.
 
     This function determines how many random checks are passed.
+
+    :param rng: Source of randomness, defaults to the random module.
     """
     a = creature.modified_catch_rate(pokeball)
     b = 65535 * (a / 255) ** (1 / 4)
 
     for i in range(num_shakes):
-        if random.randint(0, 65535) > b:
+        if rng.randint(0, 65535) > b:
             return i
 
     return num_shakes
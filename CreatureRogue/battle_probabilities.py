@@ -0,0 +1,146 @@
+"""
+Exact probabilities of the random parts of a battle, worked out by
+enumerating every outcome rather than sampling them the way
+battle_calculations does during a battle.
+
+Used to show the chance of catching a creature with each pokeball and by
+the AIs to value knock outs. The underlying calculations are memoised on
+their (hashable, numeric) inputs.
+"""
+
+from functools import lru_cache
+
+import CreatureRogue.battle_calculations as battle_calculations
+from CreatureRogue.data_layer.data import HP_STAT
+from CreatureRogue.data_layer.pokeball import Pokeball
+from CreatureRogue.models.battle_creature import BattleCreature
+from CreatureRogue.models.move import Move
+
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def shake_chance(modified_catch_rate: float) -> float:
+    """
+    The chance of passing one catch check in num_catch_checks_passed,
+    where a check passes if a random integer in [0, 65535] is at most b.
+    """
+    b = 65535 * (modified_catch_rate / 255) ** (1 / 4)
+    if b < 0:
+        return 0.0
+
+    return min(1.0, (int(b) + 1) / 65536)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def catch_checks_distribution(modified_catch_rate: float, num_shakes: int) -> tuple[float, ...]:
+    """
+    The chance of num_catch_checks_passed returning each of 0 to
+    num_shakes.
+    """
+    p = shake_chance(modified_catch_rate)
+
+    return (*(p**passed * (1 - p) for passed in range(num_shakes)), p**num_shakes)
+
+
+def catch_chance(
+    creature: BattleCreature,
+    pokeball: Pokeball,
+    num_shakes: int = battle_calculations.NUMBER_CATCH_CHECKS,
+) -> float:
+    """
+    The chance that throwing the pokeball catches the creature at its
+    current hp.
+    """
+    return catch_checks_distribution(creature.modified_catch_rate(pokeball), num_shakes)[-1]
+
+
+def catch_chances(creature: BattleCreature, pokeballs) -> dict[Pokeball, float]:
+    return {pokeball: catch_chance(creature, pokeball) for pokeball in pokeballs}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _damage_outcomes(
+    hit: float,
+    level: int,
+    attack_value: float,
+    defence_value: float,
+    base_attack: int,
+    same_type: bool,
+    type_modifier: float,
+) -> tuple[tuple[int, float], ...]:
+    critical_chance = battle_calculations.CRITICAL_HIT_PERCENT / 100
+    distribution = battle_calculations.damage_distributions(
+        level, attack_value, defence_value, base_attack, same_type, type_modifier
+    )
+    chances = {}  # type: dict[int, float]
+    for damage, chance in (
+        (0, 1 - hit),
+        (int(distribution.damage), hit * (1 - critical_chance)),
+        (int(distribution.critical_damage), hit * critical_chance),
+    ):
+        if chance > 0:
+            chances[damage] = chances.get(damage, 0.0) + chance
+
+    return tuple(sorted(chances.items()))
+
+
+def damage_outcomes(
+    move: Move, attacking_creature: BattleCreature, defending_creature: BattleCreature, type_chart
+) -> tuple[tuple[int, float], ...]:
+    """
+    Every amount of damage the move can do this turn (0 if it misses) with
+    its chance, in increasing order of damage.
+    """
+    move_data = move.move_data
+    hit = battle_calculations.hit_chance(
+        move_data.base_accuracy,
+        attacking_creature.stat_value(move_data.accuracy_stat),
+        defending_creature.stat_value(move_data.evasion_stat),
+    )
+    if not move_data.damage_move() or hit <= 0:
+        return ((0, 1.0),)
+
+    return _damage_outcomes(
+        hit,
+        attacking_creature.creature.level,
+        attacking_creature.stat_value(move_data.attack_stat),
+        defending_creature.stat_value(move_data.defence_stat),
+        move_data.base_attack,
+        move_data.type in attacking_creature.creature.species.types,
+        type_chart.combined_modifier(move_data.type, defending_creature.creature.species.types),
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _ko_chance(outcomes: tuple[tuple[int, float], ...], hp: int, turns: int) -> float:
+    if hp <= 0:
+        return 1.0
+    if turns <= 0:
+        return 0.0
+
+    return sum(
+        chance * (1.0 if damage >= hp else _ko_chance(outcomes, hp - damage, turns - 1))
+        for damage, chance in outcomes
+    )
+
+
+def ko_chance(
+    move: Move,
+    attacking_creature: BattleCreature,
+    defending_creature: BattleCreature,
+    type_chart,
+    turns: int = 1,
+) -> float:
+    """
+    The chance that using the move every turn knocks out the defending
+    creature within the given number of turns, from its current hp and
+    ignoring anything else that happens in those turns.
+    """
+    hp_stat = defending_creature.static_game_data.stats[HP_STAT]
+
+    return _ko_chance(
+        damage_outcomes(move, attacking_creature, defending_creature, type_chart),
+        defending_creature.creature.current_stat(hp_stat),
+        turns,
+    )
@@ -0,0 +1,421 @@
+"""
+Every wild battle gets its own RandomStream seeded from the game's stream
+so the whole battle follows from that seed, the two creatures as they
+were at the start and the actions the player chose. A BattleLog records
+exactly that (plus the AI which picked the computer's moves and the
+outcome) in a compact binary form which can be re-run headlessly through
+battle_calculations:
+
+    python -m CreatureRogue.battle_replay battle_logs/*.battle [--repeat 100]
+
+Each log is replayed and checked against the outcome it recorded, so a
+player reported bug can be reproduced from their log and real battles
+double as regression and performance fixtures.
+"""
+
+import argparse
+import dataclasses
+import struct
+import sys
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+
+import CreatureRogue.battle_calculations as battle_calculations
+import CreatureRogue.data_layer.snapshot as snapshot
+import CreatureRogue.settings as settings
+from CreatureRogue.battle_ai import GreedyMoveAi, LookaheadAi, RandomMoveAi
+from CreatureRogue.battle_search import ExpectiminimaxAi, SearchBudget
+from CreatureRogue.data_layer.data import EVASION_STAT, HP_STAT, StaticGameData
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+from CreatureRogue.models.battle_creature import BattleCreature
+from CreatureRogue.models.creature import Creature
+from CreatureRogue.models.move import Move
+from CreatureRogue.rng import RandomStream
+
+LOG_VERSION = 3
+
+# The AIs a log can record, by name. Only the position of each name is
+# written to the log so new AIs must be added to the end. The search AI's
+# budget is recorded too, but as it stops on a time limit its battles only
+# replay exactly if each search reaches the same depth.
+AI_TYPES = MappingProxyType(
+    {
+        "random": RandomMoveAi,
+        "greedy": GreedyMoveAi,
+        "lookahead": LookaheadAi,
+        "expectiminimax": ExpectiminimaxAi,
+    }
+)
+
+MOVE_EVENT = 0
+CATCH_EVENT = 1
+
+_MAGIC = b"CRBL"
+_STAT_IDS = range(HP_STAT, EVASION_STAT + 1)
+_AI_NAMES = tuple(AI_TYPES)
+# Magic, version, seed, AI, search max depth (0 for no search) and time.
+_HEADER = struct.Struct("<4sHQBBd")
+_CREATURE = struct.Struct(f"<HBIB{len(_STAT_IDS)}B{len(_STAT_IDS)}H{len(_STAT_IDS)}hB")
+_MOVE = struct.Struct("<HB")  # Move id, pp
+_COUNT = struct.Struct("<I")
+_EVENT = struct.Struct("<BH")  # Event type, move index or pokeball id
+_OUTCOME = struct.Struct("<BIhhBI")  # Present, turns, hp, hp, caught, fingerprint
+
+
+@dataclass(frozen=True)
+class CreatureRecord:
+    """
+    Everything about a creature at the start of a battle which can change
+    how the battle plays out.
+    """
+
+    species_id: int
+    level: int
+    current_xp: int
+    was_traded: bool
+    individual_values: tuple[int, ...]
+    effort_values: tuple[int, ...]
+    stats: tuple[int, ...]
+    moves: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def from_creature(cls, creature: Creature, static_game_data: StaticGameData):
+        stats = [static_game_data.stats[stat_id] for stat_id in _STAT_IDS]
+
+        return cls(
+            creature.species.species_id,
+            creature.level,
+            creature.current_xp,
+            creature.was_traded,
+            tuple(creature.individual_values[stat] for stat in stats),
+            tuple(creature.effort_values[stat] for stat in stats),
+            tuple(creature.current_stat(stat) for stat in stats),
+            tuple((move.move_data.move_id, move.pp) for move in creature.moves),
+        )
+
+    def to_creature(self, static_game_data: StaticGameData) -> Creature:
+        stats = [static_game_data.stats[stat_id] for stat_id in _STAT_IDS]
+        moves = []
+        for move_id, pp in self.moves:
+            move = Move(static_game_data.moves[move_id])
+            move.pp = pp
+            moves.append(move)
+
+        creature = Creature(
+            species=static_game_data.species[self.species_id],
+            level=self.level,
+            nickname=None,
+            trainer=None,
+            individual_values=dict(zip(stats, self.individual_values, strict=True)),
+            effort_values=dict(zip(stats, self.effort_values, strict=True)),
+            was_traded=self.was_traded,
+            moves=moves,
+            current_xp=self.current_xp,
+        )
+        creature.stats = dict(zip(stats, self.stats, strict=True))
+
+        return creature
+
+    def pack(self) -> bytes:
+        return _CREATURE.pack(
+            self.species_id,
+            self.level,
+            self.current_xp,
+            self.was_traded,
+            *self.individual_values,
+            *self.effort_values,
+            *self.stats,
+            len(self.moves),
+        ) + b"".join(_MOVE.pack(*move) for move in self.moves)
+
+    @classmethod
+    def unpack_from(cls, buffer: bytes, offset: int) -> tuple["CreatureRecord", int]:
+        values = _CREATURE.unpack_from(buffer, offset)
+        offset += _CREATURE.size
+        n = len(_STAT_IDS)
+        moves = []
+        for _ in range(values[-1]):
+            moves.append(_MOVE.unpack_from(buffer, offset))
+            offset += _MOVE.size
+
+        record = cls(
+            values[0],
+            values[1],
+            values[2],
+            bool(values[3]),
+            values[4 : 4 + n],
+            values[4 + n : 4 + 2 * n],
+            values[4 + 2 * n : 4 + 3 * n],
+            tuple(moves),
+        )
+
+        return record, offset
+
+
+@dataclass(frozen=True)
+class ReplayOutcome:
+    """
+    How a battle ended. The fingerprint is the next 32 bits from the
+    battle's random stream so any difference in the random numbers drawn
+    shows up even if the hp happens to match.
+    """
+
+    turns: int
+    player_hp: int
+    wild_hp: int
+    caught: bool
+    fingerprint: int
+
+
+@dataclass
+class BattleLog:
+    """
+    The seed, starting creatures and player actions of a battle, in the
+    order they happened, and the name in AI_TYPES of the computer's AI
+    (with its search budget if it searches).
+    """
+
+    seed: int
+    player_creature: CreatureRecord
+    wild_creature: CreatureRecord
+    events: list[tuple[int, int]] = field(default_factory=list)
+    outcome: ReplayOutcome | None = None
+    ai: str = "random"
+    ai_budget: SearchBudget | None = None
+
+    def record_move(self, move_index: int):
+        self.events.append((MOVE_EVENT, move_index))
+
+    def record_catch(self, pokeball_id: int):
+        self.events.append((CATCH_EVENT, pokeball_id))
+
+    def finish(
+        self,
+        player_creature: BattleCreature,
+        wild_creature: BattleCreature,
+        caught: bool,
+        rng: RandomStream,
+    ):
+        self.outcome = battle_outcome(self.events, player_creature, wild_creature, caught, rng)
+
+    def to_bytes(self) -> bytes:
+        outcome = self.outcome
+        return b"".join(
+            [
+                _HEADER.pack(
+                    _MAGIC,
+                    LOG_VERSION,
+                    self.seed,
+                    _AI_NAMES.index(self.ai),
+                    *(
+                        (self.ai_budget.max_depth, self.ai_budget.time_ms)
+                        if self.ai_budget is not None
+                        else (0, 0.0)
+                    ),
+                ),
+                self.player_creature.pack(),
+                self.wild_creature.pack(),
+                _COUNT.pack(len(self.events)),
+                *(_EVENT.pack(*event) for event in self.events),
+                _OUTCOME.pack(True, *dataclasses.astuple(outcome))
+                if outcome is not None
+                else _OUTCOME.pack(False, 0, 0, 0, False, 0),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> "BattleLog":
+        magic, version, seed, ai_index, max_depth, time_ms = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != LOG_VERSION:
+            raise ValueError(f"Not a version {LOG_VERSION} battle log")
+        if ai_index >= len(_AI_NAMES):
+            raise ValueError(f"Unknown battle log AI {ai_index}")
+
+        player_creature, offset = CreatureRecord.unpack_from(buffer, _HEADER.size)
+        wild_creature, offset = CreatureRecord.unpack_from(buffer, offset)
+        (num_events,) = _COUNT.unpack_from(buffer, offset)
+        offset += _COUNT.size
+        events = [_EVENT.unpack_from(buffer, offset + i * _EVENT.size) for i in range(num_events)]
+        offset += num_events * _EVENT.size
+        present, *outcome = _OUTCOME.unpack_from(buffer, offset)
+
+        return cls(
+            seed,
+            player_creature,
+            wild_creature,
+            events,
+            ReplayOutcome(outcome[0], outcome[1], outcome[2], bool(outcome[3]), outcome[4])
+            if present
+            else None,
+            _AI_NAMES[ai_index],
+            SearchBudget(max_depth, time_ms) if max_depth > 0 else None,
+        )
+
+    def write(self, log_file: str | Path):
+        path = Path(log_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.to_bytes())
+
+    @classmethod
+    def read(cls, log_file: str | Path) -> "BattleLog":
+        return cls.from_bytes(Path(log_file).read_bytes())
+
+
+def start_battle_log(
+    seed: int,
+    player_creature: Creature,
+    wild_creature: Creature,
+    static_game_data: StaticGameData,
+    computer_ai: RandomMoveAi,
+) -> BattleLog:
+    """
+    Records the seed and both creatures as they are before the battle
+    changes them.
+
+    :param computer_ai: The AI picking the wild creature's moves, which
+    must be one of AI_TYPES.
+    """
+    return BattleLog(
+        seed,
+        CreatureRecord.from_creature(player_creature, static_game_data),
+        CreatureRecord.from_creature(wild_creature, static_game_data),
+        ai=ai_name(computer_ai),
+        ai_budget=computer_ai.budget if isinstance(computer_ai, ExpectiminimaxAi) else None,
+    )
+
+
+def ai_name(computer_ai: RandomMoveAi) -> str:
+    """
+    :raises ValueError: If the AI's type isn't in AI_TYPES.
+    """
+    for name, ai_type in AI_TYPES.items():
+        if type(computer_ai) is ai_type:
+            return name
+
+    raise ValueError(f"{type(computer_ai).__name__} can't be recorded in a battle log")
+
+
+def battle_outcome(
+    events: Iterable[tuple[int, int]],
+    player_creature: BattleCreature,
+    wild_creature: BattleCreature,
+    caught: bool,
+    rng: RandomStream,
+) -> ReplayOutcome:
+    hp_stat = player_creature.static_game_data.stats[HP_STAT]
+
+    return ReplayOutcome(
+        turns=sum(1 for event_type, _ in events if event_type == MOVE_EVENT),
+        player_hp=player_creature.creature.current_stat(hp_stat),
+        wild_hp=wild_creature.creature.current_stat(hp_stat),
+        caught=caught,
+        fingerprint=rng.getrandbits(32),
+    )
+
+
+def replay_battle(static_game_data: StaticGameData, log: BattleLog) -> ReplayOutcome:
+    """
+    Re-runs the battle in the log the same way BattleState ran it, without
+    any rendering or input.
+    """
+    rng = RandomStream(log.seed)
+    player_creature = BattleCreature(
+        log.player_creature.to_creature(static_game_data), static_game_data
+    )
+    wild_creature = BattleCreature(
+        log.wild_creature.to_creature(static_game_data), static_game_data
+    )
+    if log.ai_budget is not None:
+        computer_ai = AI_TYPES[log.ai](wild_creature, rng, budget=log.ai_budget)
+    else:
+        computer_ai = AI_TYPES[log.ai](wild_creature, rng)
+
+    caught = False
+    for event_type, value in log.events:
+        if event_type == MOVE_EVENT:
+            battle_calculations.perform_turn(
+                player_creature.creature.moves[value],
+                player_creature,
+                computer_ai.select_move(player_creature),
+                wild_creature,
+                static_game_data,
+                rng,
+            )
+        elif event_type == CATCH_EVENT:
+            caught = (
+                battle_calculations.num_catch_checks_passed(
+                    wild_creature,
+                    static_game_data.pokeballs[value],
+                    battle_calculations.NUMBER_CATCH_CHECKS,
+                    rng,
+                )
+                == battle_calculations.NUMBER_CATCH_CHECKS
+            )
+        else:
+            raise ValueError(f"Unknown battle log event {event_type}")
+
+    return battle_outcome(log.events, player_creature, wild_creature, caught, rng)
+
+
+def check_replay(static_game_data: StaticGameData, log: BattleLog) -> ReplayOutcome:
+    """
+    Replays the battle and checks that it ends exactly as recorded.
+
+    :raises AssertionError: If the outcome differs from the recorded one.
+    """
+    outcome = replay_battle(static_game_data, log)
+    if log.outcome is not None and outcome != log.outcome:
+        raise AssertionError(f"Replay ended {outcome}, recorded {log.outcome}")
+
+    return outcome
+
+
+def battle_log_file(seed: int, log_dir: str = settings.BATTLE_LOG_DIR) -> Path:
+    return Path(log_dir) / f"{seed:016x}.battle"
+
+
+def replay_files(
+    static_game_data: StaticGameData, log_files: Iterable[str], repeat: int, stream=sys.stdout
+) -> Mapping[str, bool]:
+    """
+    Checks each log, replaying it repeat times to time it.
+
+    :return: Whether each log replayed to its recorded outcome.
+    """
+    results = {}
+    for log_file in log_files:
+        log = BattleLog.read(log_file)
+        start = time.perf_counter()
+        try:
+            for _ in range(repeat):
+                check_replay(static_game_data, log)
+            results[log_file] = True
+        except AssertionError as e:
+            results[log_file] = False
+            stream.write(f"{log_file}: MISMATCH {e}\n")
+            continue
+        elapsed = time.perf_counter() - start
+
+        stream.write(
+            f"{log_file}: OK, {len(log.events)} actions,"
+            f" {elapsed / repeat * 1e6:.0f}us per replay\n"
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("logs", nargs="+", help="Battle log files")
+    parser.add_argument("--repeat", type=int, default=1, help="Times to replay each log")
+    args = parser.parse_args()
+
+    replay_static_game_data = snapshot.load_static_data(
+        settings.DB_FILE, settings.SNAPSHOT_FILE, LocationAreaRectCollection()
+    )
+    replay_results = replay_files(replay_static_game_data, args.logs, args.repeat)
+
+    sys.exit(0 if all(replay_results.values()) else 1)
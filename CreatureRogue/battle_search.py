@@ -0,0 +1,216 @@
+"""
+Search based battle AI for enemy trainers.
+
+ExpectiminimaxAi plays out every combination of its own and the
+opponent's moves over the next few turns on BattleSnapshots, weighting
+the random parts of a turn (speed ties, hits and misses, critical hits)
+by their chance. It assumes the opponent always picks the reply which is
+worst for it.
+
+The search deepens one turn at a time until the per-turn time budget runs
+out, then plays the best move from the deepest search which completed.
+Values of battle states already searched are kept in a transposition
+table for the rest of the battle. Difficulty levels are just different
+search budgets:
+
+    ExpectiminimaxAi(battle_creature, rng, difficulty="hard")
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from CreatureRogue.battle_ai import STAT_STAGE_VALUE, RandomMoveAi
+from CreatureRogue.models.battle_creature import BattleCreature
+from CreatureRogue.models.battle_snapshot import BattleRules, BattleSnapshot
+from CreatureRogue.models.move import Move
+
+# Value of a won battle, a lost battle is the negative of this. Any other
+# state is worth between -1 and 1 (the difference in the fraction of max
+# hp remaining) plus a little for stat stages.
+WIN_VALUE = 10.0
+MAX_TRANSPOSITIONS = 200_000
+
+
+@dataclass(frozen=True)
+class SearchBudget:
+    """
+    How far and for how long the AI searches each turn. The first turn of
+    lookahead is always searched whatever the time budget.
+    """
+
+    max_depth: int
+    time_ms: float
+
+
+DIFFICULTY_BUDGETS = MappingProxyType(
+    {
+        "easy": SearchBudget(max_depth=1, time_ms=5),
+        "normal": SearchBudget(max_depth=2, time_ms=20),
+        "hard": SearchBudget(max_depth=4, time_ms=100),
+    }
+)
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+class ExpectiminimaxAi(RandomMoveAi):
+    """
+    The search runs on BattleSnapshots with this AI's creature as creature
+    a (side 0) and its opponent as creature b (side 1).
+    """
+
+    def __init__(
+        self,
+        battle_creature: BattleCreature,
+        rng=random,
+        difficulty: str = "normal",
+        budget: SearchBudget | None = None,
+    ):
+        """
+        :param difficulty: One of DIFFICULTY_BUDGETS.
+        :param budget: Overrides the difficulty's search budget.
+        """
+        super().__init__(battle_creature, rng)
+        self.budget = budget if budget is not None else DIFFICULTY_BUDGETS[difficulty]
+        self.completed_depth = 0
+        self.nodes = 0
+        self._transpositions = {}  # type: dict[tuple[BattleSnapshot, int], float]
+        self._opponent = None  # type: BattleCreature | None
+        self._rules = None  # type: BattleRules | None
+        self._deadline = None  # type: float | None
+
+    def select_move(self, opponent: BattleCreature | None = None) -> Move | None:
+        """
+        :param opponent: The creature being fought, a random move is picked
+        if this isn't passed.
+        """
+        if opponent is None:
+            return super().select_move()
+
+        if opponent is not self._opponent:
+            self._opponent = opponent
+            self._rules = BattleRules(self.battle_creature, opponent)
+            self._transpositions.clear()
+
+        snapshot = BattleSnapshot.from_creatures(self.battle_creature, opponent)
+        moves = list(snapshot.options(0))
+        if not moves:
+            return None
+
+        best_move = moves[0]
+        self.completed_depth = 0
+        self.nodes = 0
+        deadline = time.perf_counter() + self.budget.time_ms / 1000
+        for depth in range(1, self.budget.max_depth + 1):
+            # Search the previous best move first so it wins ties.
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+            self._deadline = deadline if depth > 1 else None
+            try:
+                best_move = self._search_root(snapshot, moves, depth)
+            except _SearchTimeout:
+                break
+            self.completed_depth = depth
+
+        if len(self._transpositions) > MAX_TRANSPOSITIONS:
+            self._transpositions.clear()
+
+        return self.battle_creature.creature.moves[best_move]
+
+    def _search_root(self, snapshot: BattleSnapshot, moves: list[int], depth: int) -> int:
+        best_move, best_value = None, None
+        for move in moves:
+            value = min(
+                self._turn_value(snapshot, move, their_move, depth)
+                for their_move in self._options(snapshot, 1)
+            )
+            if best_value is None or value > best_value:
+                best_move, best_value = move, value
+
+        return best_move
+
+    @staticmethod
+    def _options(snapshot: BattleSnapshot, side: int) -> tuple[int | None, ...]:
+        """
+        The moves a side can pick, (None,) if it has none with pp left.
+        """
+        return snapshot.options(side) or (None,)
+
+    def _value(self, snapshot: BattleSnapshot, depth: int) -> float:
+        """
+        The value of a snapshot at the start of a turn, searching depth
+        turns ahead.
+        """
+        if depth == 0 or snapshot.finished():
+            return self._evaluate(snapshot)
+
+        key = (snapshot, depth)
+        value = self._transpositions.get(key)
+        if value is not None:
+            return value
+
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        self.nodes += 1
+        our_moves, their_moves = self._options(snapshot, 0), self._options(snapshot, 1)
+        if our_moves == (None,) and their_moves == (None,):
+            value = self._evaluate(snapshot)
+        else:
+            value = max(
+                min(self._turn_value(snapshot, ours, theirs, depth) for theirs in their_moves)
+                for ours in our_moves
+            )
+
+        self._transpositions[key] = value
+        return value
+
+    def _turn_value(
+        self, snapshot: BattleSnapshot, our_move: int | None, their_move: int | None, depth: int
+    ) -> float:
+        """
+        The expected value after a turn where both sides use the given
+        moves, following battle_calculations.perform_turn.
+        """
+        moves = (our_move, their_move)
+        total = 0.0
+        for first, order_chance in self._rules.turn_orders(snapshot):
+            for after_first, first_chance in self._move_outcomes(snapshot, first, moves[first]):
+                if after_first.finished():
+                    total += order_chance * first_chance * self._value(after_first, depth - 1)
+                    continue
+
+                for after_second, second_chance in self._move_outcomes(
+                    after_first, 1 - first, moves[1 - first]
+                ):
+                    total += (
+                        order_chance
+                        * first_chance
+                        * second_chance
+                        * self._value(after_second, depth - 1)
+                    )
+
+        return total
+
+    def _move_outcomes(self, snapshot: BattleSnapshot, side: int, move_index: int | None):
+        if move_index is None:
+            return ((snapshot, 1.0),)
+
+        return snapshot.move_outcomes(self._rules, side, move_index)
+
+    def _evaluate(self, snapshot: BattleSnapshot) -> float:
+        ours, theirs = snapshot
+        if ours.fainted:
+            return -WIN_VALUE
+        if theirs.fainted:
+            return WIN_VALUE
+
+        return (
+            ours.hp / self._rules.sides[0].max_hp
+            - theirs.hp / self._rules.sides[1].max_hp
+            + STAT_STAGE_VALUE * (sum(ours.stat_adjusts) - sum(theirs.stat_adjusts))
+        )
@@ -0,0 +1,117 @@
+"""
+Runs battles between two creatures to completion without any rendering
+or user input so that matchups can be evaluated offline in bulk.
+
+The battle logic is exactly that used in game (battle_calculations) but
+each battle gets its own seeded random number generator so results are
+reproducible.
+"""
+
+import copy
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import CreatureRogue.battle_calculations as battle_calculations
+from CreatureRogue.battle_ai import RandomMoveAi
+from CreatureRogue.data_layer.data import HP_STAT, StaticGameData
+from CreatureRogue.models.battle_creature import BattleCreature
+from CreatureRogue.models.creature import Creature
+from CreatureRogue.rng import RandomStream
+
+MAX_TURNS = 1000
+
+
+@dataclass(frozen=True)
+class BattleOutcome:
+    """
+    The result of a simulated battle between creature a and creature b.
+
+    winner is 0 if creature a won, 1 if creature b won and None if the
+    battle ended without either fainting (both ran out of moves or the
+    turn limit was reached).
+    """
+
+    winner: int | None
+    turns: int
+    hp_remaining: tuple[int, int]
+    fainted: tuple[bool, bool]
+
+
+def battle_copy(creature: Creature) -> Creature:
+    """
+    Copies the parts of a creature that a battle changes (current stats,
+    PP and status) so that the original can be battled repeatedly.
+    """
+    battle_creature = copy.copy(creature)
+    battle_creature.stats = dict(creature.stats)
+    battle_creature.moves = [copy.copy(move) for move in creature.moves]
+    battle_creature.ailments = list(creature.ailments)
+
+    return battle_creature
+
+
+def simulate_battle(
+    static_game_data: StaticGameData,
+    creature_a: Creature,
+    creature_b: Creature,
+    ai_a: Callable = RandomMoveAi,
+    ai_b: Callable = RandomMoveAi,
+    seed=None,
+    max_turns: int = MAX_TURNS,
+) -> BattleOutcome:
+    """
+    Battles two creatures against each other until one faints.
+
+    Neither creature passed in is modified, the battle is fought between
+    copies of them.
+
+    :param static_game_data: The static data the creatures were created
+    from.
+    :param creature_a: The first creature, wins ties in the outcome order.
+    :param creature_b: The second creature.
+    :param ai_a: Creates the AI for creature a, called with the battle
+    creature and the battle's random number generator (an AI class like
+    RandomMoveAi can be passed directly).
+    :param ai_b: Creates the AI for creature b.
+    :param seed: Seed for the battle's RandomStream, an int or a sequence
+    of ints.
+    :param max_turns: Turn limit after which the battle is abandoned.
+    """
+    rng = RandomStream(seed)
+    hp_stat = static_game_data.stats[HP_STAT]
+
+    battle_creature_a = BattleCreature(battle_copy(creature_a), static_game_data)
+    battle_creature_b = BattleCreature(battle_copy(creature_b), static_game_data)
+    move_selector_a = ai_a(battle_creature_a, rng)
+    move_selector_b = ai_b(battle_creature_b, rng)
+
+    turns = 0
+    while turns < max_turns:
+        move_a = move_selector_a.select_move(battle_creature_b)
+        move_b = move_selector_b.select_move(battle_creature_a)
+        if move_a is None and move_b is None:
+            break
+
+        turns += 1
+        _, fainted = battle_calculations.perform_turn(
+            move_a, battle_creature_a, move_b, battle_creature_b, static_game_data, rng
+        )
+        if fainted is not None:
+            break
+
+    fainted = (battle_creature_a.creature.fainted, battle_creature_b.creature.fainted)
+    winner = None
+    if fainted[1] and not fainted[0]:
+        winner = 0
+    elif fainted[0] and not fainted[1]:
+        winner = 1
+
+    return BattleOutcome(
+        winner=winner,
+        turns=turns,
+        hp_remaining=(
+            battle_creature_a.creature.current_stat(hp_stat),
+            battle_creature_b.creature.current_stat(hp_stat),
+        ),
+        fainted=fainted,
+    )
@@ -15,12 +15,14 @@ from CreatureRogue.models.creature import Creature
 from CreatureRogue.models.move import Move
 
 
-def random_stat_values(stats: dict[int, Stat], min_val: int, max_val: int) -> dict[Stat, int]:
+def random_stat_values(
+    stats: dict[int, Stat], min_val: int, max_val: int, rng=random
+) -> dict[Stat, int]:
     """
     Used to return a set of random values between min, max for
     all available stats.
     """
-    return {stats[stat]: random.randint(min_val, max_val) for stat in stats}
+    return {stats[stat]: rng.randint(min_val, max_val) for stat in stats}
 
 
 def zero_stat_values(stats: dict[int, Stat]) -> dict[Stat, int]:
@@ -31,12 +33,15 @@ def zero_stat_values(stats: dict[int, Stat]) -> dict[Stat, int]:
 
 
 def create_wild_creature(
-    static_game_data: StaticGameData, species: Species, level: int
+    static_game_data: StaticGameData, species: Species, level: int, rng=random
 ) -> Creature:
     """
     Creating a wild creature of a given species and level is nearly
     deterministic. The only randomization is in the individual individual
     values as these determine any variation from the species base.
+
+    :param rng: Source of randomness for the individual values, defaults
+    to the random module.
     """
     moves = [Move(move) for move in species.move_data_at_level(level)]
 
@@ -45,7 +50,7 @@ def create_wild_creature(
         level,
         None,
         None,
-        random_stat_values(static_game_data.stats, 1, 15),
+        random_stat_values(static_game_data.stats, 1, 15, rng),
         zero_stat_values(static_game_data.stats),
         False,
         moves,
@@ -1,3 +1,6 @@
+import sys
+
+
 class Ailment:
     """
     An ailment can be applied to a creature.
@@ -5,9 +8,11 @@ class Ailment:
     TODO: Very little by way of implementation here at the moment, just enough to store the information
     """
 
+    __slots__ = ("ailment_id", "name")
+
     def __init__(self, ailment_id: int, name: str):
         self.ailment_id = ailment_id
-        self.name = name
+        self.name = sys.intern(name)
 
     def __str__(self):
         return self.name
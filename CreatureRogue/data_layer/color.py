@@ -1,9 +1,15 @@
+import sys
+
+
 class Color:
-    def __init__(self, name, r, g, b):
-        self.name = name
+    __slots__ = ("b", "color_id", "g", "name", "r")
+
+    def __init__(self, name, r, g, b, color_id: int | None = None):
+        self.name = sys.intern(name)
         self.r = r
         self.g = g
         self.b = b
+        self.color_id = color_id
 
     def __str__(self):
         return f"{self.name} - ({self.r},{self.g},{self.b})"
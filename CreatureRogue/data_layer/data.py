@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from pathlib import Path
 
 from CreatureRogue.data_layer.location_area_rect import LocationAreaRect
@@ -39,6 +40,13 @@ class StaticGameData:
     It's really just a collection of the different objects to facilitate
     passing it around the game and each object should be accessed directly
     (static_data.*).
+
+    Species, moves and location areas are mappings from id which may be
+    plain dicts or lazily loaded tables, so only the mapping interface
+    should be relied on for those.
+
+    pokedex_numbers maps each species id to its pokedex number so that
+    the pokedex can be laid out without loading every species.
     """
 
     def __init__(
@@ -59,6 +67,7 @@ class StaticGameData:
         pokeballs,
         ailments,
         map_data_tile_types: dict[int, MapDataTileType],
+        pokedex_numbers: Mapping[int, int] | None = None,
     ):
         self.species = species
         self.types = types
@@ -76,6 +85,11 @@ class StaticGameData:
         self.pokeballs = pokeballs
         self.ailments = ailments
         self.map_data_tile_types = map_data_tile_types
+        self.pokedex_numbers = (
+            pokedex_numbers
+            if pokedex_numbers is not None
+            else {species_id: species[species_id].pokedex_number for species_id in species}
+        )
 
     def stat(self, stat):
         return self.stats[stat]
@@ -3,9 +3,15 @@ The db layer module is used to load information from the static database
 data into a static data object. Acts as an ORM.
 """
 
+import contextlib
 import logging
 import sqlite3
 import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 
 import CreatureRogue.settings as settings
 from CreatureRogue.data_layer.ailment import Ailment
@@ -13,6 +19,7 @@ from CreatureRogue.data_layer.color import Color
 from CreatureRogue.data_layer.data import ACCURACY_STAT, EVASION_STAT, StaticGameData
 from CreatureRogue.data_layer.encounter import Encounter
 from CreatureRogue.data_layer.growth_rate import GrowthRate
+from CreatureRogue.data_layer.lazy_table import LazyTable
 from CreatureRogue.data_layer.location import Location
 from CreatureRogue.data_layer.location_area import LocationArea
 from CreatureRogue.data_layer.location_area_rect_collection import (
@@ -30,73 +37,280 @@ from CreatureRogue.data_layer.type_chart import TypeChart
 from CreatureRogue.data_layer.xp_lookup import XpLookup
 
 
+@dataclass
+class _LookupTables:
+    """
+    The small tables which the larger tables (moves, species and location
+    areas) link to. These are always loaded up front.
+    """
+
+    growth_rates: dict[int, GrowthRate]
+    xp_lookup: XpLookup
+    types: dict[int, Type]
+    type_chart: TypeChart
+    stats: dict[int, Stat]
+    ailments: dict[int, Ailment]
+    move_targets: dict[int, MoveTarget]
+    pokeballs: dict[int, Pokeball]
+    colors: dict[int, Color]
+    regions: dict[int, Region]
+    locations: dict[int, Location]
+    map_data_tile_types: dict[int, MapDataTileType]
+
+
 class Loader:
+    """
+    Child tables (types, stats, moves of a species etc) are pulled in a
+    single query each and grouped in memory rather than queried once per
+    parent row.
+
+    Alternatively load_lazy_static_data only loads moves, species and
+    location areas as they are first accessed.
+
+    The time spent on each table during the last load is available in
+    timings (seconds keyed by table name).
+    """
+
     def __init__(self, db_file: str):
         self.db_file = db_file
+        self.timings = {}  # type: dict[str, float]
+        self._id_columns = {}  # type: dict[str, str]
 
-    def load_static_data(
-        self, location_area_rectangles: LocationAreaRectCollection
-    ) -> StaticGameData:
+    @contextlib.contextmanager
+    def _timed(self, table: str):
         """
-        Given a database file we want to load the entire of the static
-        data into the application so that it can be quickly accessed as
-        required.
+        Adds the time taken by the enclosed block to the timing for the
+        given table.
         """
+        start = time.perf_counter()
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                # XP
-                growth_rates = self._load_growth_rates(conn)
-                xp_lookup = self._load_xp_lookup(conn, growth_rates)
-
-                # Types
-                types = self._load_types(conn)
-                type_chart = self._load_type_chart(conn, types)
-
-                # Stats
-                stats = self._load_stats(conn)
-
-                # Ailments
-                ailments = self._load_ailments(conn)
+            yield
+        finally:
+            self.timings[table] = self.timings.get(table, 0.0) + time.perf_counter() - start
 
-                # Moves
-                move_targets = self._load_move_targets(conn)
-                moves = self._load_moves(conn, types, stats, move_targets, ailments)
+    def _fetch_grouped(self, conn, table: str, query: str) -> dict[int, list[tuple]]:
+        """
+        Runs a query against a child table exactly once and groups the
+        rows by their first column (the parent id). The parent id is
+        stripped from the grouped rows.
 
-                # Pokeballs
-                pokeballs = self._load_pokeballs(conn)
+        Rows within a group keep the order that the database returned
+        them in.
+        """
+        grouped = defaultdict(list)
+        with self._timed(table):
+            for row in conn.execute(query):
+                grouped[row[0]].append(row[1:])
 
-                # Species
-                colors = self._load_colors(conn)
-                species = self._load_species(conn, types, colors, stats, growth_rates, moves)
+        return grouped
 
-                # Regions/Areas
-                regions = self._load_regions(conn)
-                locations = self._load_locations(conn, regions)
-                location_areas = self._load_location_areas(conn, locations, species)
+    def _fetch_for_id(self, conn, table: str, query: str, row_id: int) -> list[tuple]:
+        """
+        Runs the same query as _fetch_grouped would but only returns the
+        rows for a single parent id (again stripping the parent id).
 
-                # Map Data Tile Types
-                map_data_tile_types = self._load_map_data_tile_types(conn)
-        except sqlite3.Error as err:
-            logging.error("An error occurred attempting to pull data from the database", err)
-            sys.exit(1)
+        The query is wrapped so that the filter applies to its first
+        column whatever that column happens to be called.
+        """
+        with self._timed(table):
+            if query not in self._id_columns:
+                self._id_columns[query] = conn.execute(
+                    f"SELECT * FROM ({query}) LIMIT 0"
+                ).description[0][0]
+
+            return [
+                row[1:]
+                for row in conn.execute(
+                    f'SELECT * FROM ({query}) WHERE "{self._id_columns[query]}" = ?', (row_id,)
+                )
+            ]
+
+    def _fetch_ids(self, conn, table: str, query: str) -> list[int]:
+        """
+        Returns the values of the first column of the query, in order.
+        """
+        with self._timed(table):
+            return [row[0] for row in conn.execute(query)]
+
+    def _log_timings(self):
+        logging.info(
+            "Loaded static data in %.3fs (%s)",
+            sum(self.timings.values()),
+            ", ".join(
+                f"{table}: {seconds:.3f}s"
+                for table, seconds in sorted(
+                    self.timings.items(), key=lambda item: item[1], reverse=True
+                )
+            ),
+        )
 
-        return StaticGameData(
-            species,
+    def _load_lookup_tables(self, conn) -> _LookupTables:
+        # XP
+        with self._timed("growth_rates"):
+            growth_rates = self._load_growth_rates(conn)
+        with self._timed("experience"):
+            xp_lookup = self._load_xp_lookup(conn, growth_rates)
+
+        # Types
+        with self._timed("types"):
+            types = self._load_types(conn)
+        with self._timed("type_efficacy"):
+            type_chart = self._load_type_chart(conn, types)
+
+        # Stats
+        with self._timed("stats"):
+            stats = self._load_stats(conn)
+
+        # Ailments
+        with self._timed("move_meta_ailments"):
+            ailments = self._load_ailments(conn)
+
+        # Move targets
+        with self._timed("move_targets"):
+            move_targets = self._load_move_targets(conn)
+
+        # Pokeballs
+        with self._timed("pokeballs"):
+            pokeballs = self._load_pokeballs(conn)
+
+        # Colors
+        with self._timed("pokemon_colors"):
+            colors = self._load_colors(conn)
+
+        # Regions/Locations
+        with self._timed("regions"):
+            regions = self._load_regions(conn)
+        with self._timed("locations"):
+            locations = self._load_locations(conn, regions)
+
+        # Map Data Tile Types
+        with self._timed("region_map_data_cell_types"):
+            map_data_tile_types = self._load_map_data_tile_types(conn)
+
+        return _LookupTables(
+            growth_rates,
+            xp_lookup,
             types,
             type_chart,
-            moves,
             stats,
-            colors,
-            growth_rates,
+            ailments,
             move_targets,
+            pokeballs,
+            colors,
             regions,
             locations,
+            map_data_tile_types,
+        )
+
+    @staticmethod
+    def _static_game_data(
+        lookups: _LookupTables,
+        species: Mapping[int, Species],
+        moves: Mapping[int, MoveData],
+        location_areas: Mapping[int, LocationArea],
+        location_area_rectangles: LocationAreaRectCollection,
+        pokedex_numbers: Mapping[int, int] | None = None,
+    ) -> StaticGameData:
+        return StaticGameData(
+            species,
+            lookups.types,
+            lookups.type_chart,
+            moves,
+            lookups.stats,
+            lookups.colors,
+            lookups.growth_rates,
+            lookups.move_targets,
+            lookups.regions,
+            lookups.locations,
             location_areas,
             location_area_rectangles,
-            xp_lookup,
-            pokeballs,
-            ailments,
-            map_data_tile_types,
+            lookups.xp_lookup,
+            lookups.pokeballs,
+            lookups.ailments,
+            lookups.map_data_tile_types,
+            pokedex_numbers,
+        )
+
+    def load_static_data(
+        self, location_area_rectangles: LocationAreaRectCollection
+    ) -> StaticGameData:
+        """
+        Given a database file we want to load the entire of the static
+        data into the application so that it can be quickly accessed as
+        required.
+        """
+        self.timings = {}
+        try:
+            with sqlite3.connect(self.db_file) as conn:
+                lookups = self._load_lookup_tables(conn)
+                moves = self._load_moves(conn, lookups)
+                species = self._load_species(conn, lookups, moves)
+                location_areas = self._load_location_areas(conn, lookups, species)
+        except sqlite3.Error as err:
+            logging.error("An error occurred attempting to pull data from the database", err)
+            sys.exit(1)
+
+        self._log_timings()
+
+        return self._static_game_data(
+            lookups, species, moves, location_areas, location_area_rectangles
+        )
+
+    def load_lazy_static_data(
+        self,
+        location_area_rectangles: LocationAreaRectCollection,
+        cache_size: int = settings.LAZY_CACHE_SIZE,
+    ) -> StaticGameData:
+        """
+        Loads the small lookup tables straight away but only the ids of
+        the moves, species and location areas (plus each species' pokedex
+        number). Each of those is loaded from the database the first time
+        it is accessed and then kept in a cache of at most cache_size
+        entries per table.
+
+        The database connection is kept open for as long as the static
+        data is in use. Computer moves are selected on a worker thread so
+        the connection may be used from any thread, with one lock shared
+        by the tables making sure only one thread uses it at a time.
+        """
+        self.timings = {}
+        try:
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            lock = threading.RLock()
+            lookups = self._load_lookup_tables(conn)
+
+            moves = LazyTable(
+                self._fetch_ids(conn, "move_data", self._move_data_query()),
+                lambda move_id: self._load_move(conn, lookups, move_id),
+                cache_size,
+                lock,
+            )
+            species = LazyTable(
+                self._fetch_ids(conn, "creature_species_data", self._species_data_query()),
+                lambda species_id: self._load_single_species(conn, lookups, moves, species_id),
+                cache_size,
+                lock,
+            )
+            location_areas = LazyTable(
+                self._fetch_ids(conn, "location_areas", self._location_area_query()),
+                lambda area_id: self._load_location_area(conn, lookups, species, area_id),
+                cache_size,
+                lock,
+            )
+            with self._timed("creature_species_data"):
+                pokedex_numbers = dict(
+                    conn.execute(
+                        f"SELECT species_id, pokedex_number FROM ({self._species_data_query()})"
+                    )
+                )
+        except sqlite3.Error as err:
+            logging.error("An error occurred attempting to pull data from the database", err)
+            sys.exit(1)
+
+        self._log_timings()
+
+        return self._static_game_data(
+            lookups, species, moves, location_areas, location_area_rectangles, pokedex_numbers
         )
 
     @staticmethod
@@ -123,7 +337,7 @@ class Loader:
         )
 
         for stat_id, name, short_name in cur.fetchall():
-            stats[stat_id] = Stat(name, short_name)
+            stats[stat_id] = Stat(name, short_name, stat_id)
 
         return stats
 
@@ -138,7 +352,7 @@ class Loader:
         )
 
         for color_id, name, red, green, blue in cur.fetchall():
-            colors[color_id] = Color(name, red, green, blue)
+            colors[color_id] = Color(name, red, green, blue, color_id)
 
         return colors
 
@@ -150,7 +364,7 @@ class Loader:
         cur.execute("SELECT id, identifier FROM growth_rates")
 
         for gr_id, name in cur.fetchall():
-            growth_rates[gr_id] = GrowthRate(name)
+            growth_rates[gr_id] = GrowthRate(name, gr_id)
 
         return growth_rates
 
@@ -209,7 +423,7 @@ class Loader:
         )
 
         for mt_id, identifier, name, description in cur.fetchall():
-            targets[mt_id] = MoveTarget(identifier, name, description)
+            targets[mt_id] = MoveTarget(identifier, name, description, mt_id)
 
         return targets
 
@@ -223,7 +437,7 @@ class Loader:
         )
 
         for type_id, name in cur.fetchall():
-            types[type_id] = Type(name)
+            types[type_id] = Type(name, type_id)
 
         return types
 
@@ -243,22 +457,19 @@ class Loader:
 
             chart[damage_type][target_type] = int(damage_factor)
 
-        return TypeChart(chart)
+        return TypeChart(chart, types.values())
 
     @staticmethod
-    def _load_moves(
-        conn,
-        types: dict[int, Type],
-        stats: dict[int, Stat],
-        move_targets: dict[int, MoveTarget],
-        ailments: dict[int, Ailment],
-    ) -> dict[int, MoveData]:
-        logging.info("Loading moves")
-        moves = {}
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM move_data")
+    def _move_data_query() -> str:
+        return "SELECT * FROM move_data"
 
-        for (
+    @staticmethod
+    def _move_stat_changes_query() -> str:
+        return "SELECT move_id, stat_id, change FROM move_meta_stat_changes"
+
+    @staticmethod
+    def _build_move(row: tuple, stat_changes: Iterable[tuple], lookups: _LookupTables) -> MoveData:
+        (
             move_id,
             name,
             pp,
@@ -270,67 +481,96 @@ class Loader:
             max_hits,
             target_id,
             ailment_id,
-        ) in cur.fetchall():
-            if damage_class_id == 2:  # Physical
-                attack_stat = stats[2]
-                defense_stat = stats[3]
-            elif damage_class_id == 3:  # Special
-                attack_stat = stats[4]
-                defense_stat = stats[5]
-            else:  # Non-damaging
-                attack_stat = None
-                defense_stat = None
-
-            accuracy_stat = stats[7]
-            evasion_stat = stats[8]
-
-            stat_cur = conn.cursor()
-            stat_cur.execute(
-                f"SELECT stat_id, change FROM move_meta_stat_changes WHERE move_id = {move_id}"
-            )
+        ) = row
+        stats = lookups.stats
+
+        if damage_class_id == 2:  # Physical
+            attack_stat = stats[2]
+            defense_stat = stats[3]
+        elif damage_class_id == 3:  # Special
+            attack_stat = stats[4]
+            defense_stat = stats[5]
+        else:  # Non-damaging
+            attack_stat = None
+            defense_stat = None
+
+        accuracy_stat = stats[7]
+        evasion_stat = stats[8]
+
+        stat_effects = {stats[stat]: 0 for stat in stats}
+        for stat_id, change in stat_changes:
+            stat_effects[stats[stat_id]] = change
+
+        return MoveData(
+            name,
+            pp,
+            lookups.types[type_id],
+            power,
+            accuracy,
+            min_hits,
+            max_hits,
+            stat_effects,
+            attack_stat,
+            defense_stat,
+            accuracy_stat,
+            evasion_stat,
+            lookups.move_targets[target_id],
+            lookups.ailments[ailment_id],
+            move_id,
+        )
 
-            stat_effects = {stats[stat]: 0 for stat in stats}
-            for stat_id, change in stat_cur.fetchall():
-                stat_effects[stats[stat_id]] = change
+    def _load_moves(self, conn, lookups: _LookupTables) -> dict[int, MoveData]:
+        logging.info("Loading moves")
+        stat_changes = self._fetch_grouped(
+            conn, "move_meta_stat_changes", self._move_stat_changes_query()
+        )
 
-            moves[move_id] = MoveData(
-                name,
-                pp,
-                types[type_id],
-                power,
-                accuracy,
-                min_hits,
-                max_hits,
-                stat_effects,
-                attack_stat,
-                defense_stat,
-                accuracy_stat,
-                evasion_stat,
-                move_targets[target_id],
-                ailments[ailment_id],
-            )
+        moves = {}
+        with self._timed("move_data"):
+            for row in conn.execute(self._move_data_query()).fetchall():
+                moves[row[0]] = self._build_move(row, stat_changes.get(row[0], ()), lookups)
 
         return moves
 
-    @staticmethod
-    def _load_species(
-        conn,
-        types: dict[int, Type],
-        colors: dict[int, Color],
-        stats: dict[int, Stat],
-        growth_rates: dict[int, GrowthRate],
-        moves: dict[int, MoveData],
-    ) -> dict[int, Species]:
-        logging.info("Loading species")
-        species = {}
-        cur = conn.cursor()
-        cur.execute(
-            f"SELECT species_id, creature_id, pokedex_number, name, height, weight, base_experience, color_id, growth_rate_id, flavor_text, genus, capture_rate FROM creature_species_data WHERE pokedex_id = {settings.POKEDEX_ID} AND local_language_id = {settings.LOCAL_LANGUAGE_ID}"
+    def _load_move(self, conn, lookups: _LookupTables, move_id: int) -> MoveData:
+        (row,) = self._fetch_for_id(conn, "move_data", self._move_data_query(), move_id)
+
+        return self._build_move(
+            (move_id, *row),
+            self._fetch_for_id(
+                conn, "move_meta_stat_changes", self._move_stat_changes_query(), move_id
+            ),
+            lookups,
         )
 
-        for (
+    @staticmethod
+    def _species_data_query() -> str:
+        return f"SELECT species_id, creature_id, pokedex_number, name, height, weight, base_experience, color_id, growth_rate_id, flavor_text, genus, capture_rate FROM creature_species_data WHERE pokedex_id = {settings.POKEDEX_ID} AND local_language_id = {settings.LOCAL_LANGUAGE_ID}"
+
+    @staticmethod
+    def _species_types_query() -> str:
+        return "SELECT pokemon_id, type_id FROM pokemon_types"
+
+    @staticmethod
+    def _species_stats_query() -> str:
+        return "SELECT pokemon_id, stat_id, base_stat FROM pokemon_stats INNER JOIN stats ON stats.id = pokemon_stats.stat_id"
+
+    @staticmethod
+    def _species_moves_query() -> str:
+        return f"SELECT pokemon_id, move_id, level FROM pokemon_moves WHERE pokemon_move_method_id=1 AND version_group_id = {settings.VERSION_GROUP_ID}"
+
+    @staticmethod
+    def _build_species(
+        row: tuple,
+        creature_types: Iterable[tuple],
+        creature_stats: Iterable[tuple],
+        creature_moves: Iterable[tuple],
+        lookups: _LookupTables,
+        moves: Mapping[int, MoveData],
+    ) -> Species:
+        (
             species_id,
-            creature_id,
+            _,
             pokedex_number,
             name,
             height,
@@ -341,46 +581,77 @@ class Loader:
             flavor_text,
             genus,
             capture_rate,
-        ) in cur.fetchall():
-            types_cur = conn.cursor()
-            types_cur.execute(f"SELECT type_id FROM pokemon_types WHERE pokemon_id = {creature_id}")
-            species_types = [types[row[0]] for row in types_cur]
+        ) = row
+        stats = lookups.stats
 
-            stats_cur = conn.cursor()
-            stats_cur.execute(
-                f"SELECT stat_id, base_stat FROM pokemon_stats INNER JOIN stats ON stats.id = pokemon_stats.stat_id WHERE pokemon_id = {creature_id}"
-            )
-            species_stats = {stats[row[0]]: row[1] for row in stats_cur}
-            species_stats[stats[EVASION_STAT]] = 1
-            species_stats[stats[ACCURACY_STAT]] = 1
+        species_types = [lookups.types[type_id] for (type_id,) in creature_types]
 
-            moves_cur = conn.cursor()
-            moves_cur.execute(
-                f"SELECT move_id, level FROM pokemon_moves WHERE pokemon_move_method_id=1 AND pokemon_id={creature_id} AND version_group_id = {settings.VERSION_GROUP_ID}"
-            )
-            level_moves = {n: [] for n in range(1, 101)}
-            for move_id, level in moves_cur.fetchall():
-                level_moves[level].append(moves[move_id])
+        species_stats = {stats[stat_id]: base_stat for stat_id, base_stat in creature_stats}
+        species_stats[stats[EVASION_STAT]] = 1
+        species_stats[stats[ACCURACY_STAT]] = 1
 
-            species[species_id] = Species(
-                pokedex_number,
-                name,
-                height,
-                weight,
-                species_types,
-                species_stats,
-                base_exp,
-                growth_rates[growth_rate_id],
-                name[0:1],
-                colors[color_id],  # TODO - What if the creature has no name?
-                level_moves,
-                flavor_text,
-                genus,
-                capture_rate,
-            )
+        level_moves = {n: [] for n in range(1, 101)}
+        for move_id, level in creature_moves:
+            level_moves[level].append(moves[move_id])
+
+        return Species(
+            pokedex_number,
+            name,
+            height,
+            weight,
+            species_types,
+            species_stats,
+            base_exp,
+            lookups.growth_rates[growth_rate_id],
+            name[0:1],
+            lookups.colors[color_id],  # TODO - What if the creature has no name?
+            level_moves,
+            flavor_text,
+            genus,
+            capture_rate,
+            species_id,
+        )
+
+    def _load_species(
+        self, conn, lookups: _LookupTables, moves: Mapping[int, MoveData]
+    ) -> dict[int, Species]:
+        logging.info("Loading species")
+        creature_types = self._fetch_grouped(conn, "pokemon_types", self._species_types_query())
+        creature_stats = self._fetch_grouped(conn, "pokemon_stats", self._species_stats_query())
+        creature_moves = self._fetch_grouped(conn, "pokemon_moves", self._species_moves_query())
+
+        species = {}
+        with self._timed("creature_species_data"):
+            for row in conn.execute(self._species_data_query()).fetchall():
+                creature_id = row[1]
+                species[row[0]] = self._build_species(
+                    row,
+                    creature_types.get(creature_id, ()),
+                    creature_stats.get(creature_id, ()),
+                    creature_moves.get(creature_id, ()),
+                    lookups,
+                    moves,
+                )
 
         return species
 
+    def _load_single_species(
+        self, conn, lookups: _LookupTables, moves: Mapping[int, MoveData], species_id: int
+    ) -> Species:
+        (row,) = self._fetch_for_id(
+            conn, "creature_species_data", self._species_data_query(), species_id
+        )
+        creature_id = row[0]
+
+        return self._build_species(
+            (species_id, *row),
+            self._fetch_for_id(conn, "pokemon_types", self._species_types_query(), creature_id),
+            self._fetch_for_id(conn, "pokemon_stats", self._species_stats_query(), creature_id),
+            self._fetch_for_id(conn, "pokemon_moves", self._species_moves_query(), creature_id),
+            lookups,
+            moves,
+        )
+
     @staticmethod
     def _load_regions(conn) -> dict[int, Region]:
         logging.info("Loading regions")
@@ -405,49 +676,83 @@ class Loader:
         )
 
         for location_id, identifier, name, region_id in cur.fetchall():
-            locations[location_id] = Location(identifier, name, regions[region_id])
+            locations[location_id] = Location(identifier, name, regions[region_id], location_id)
 
         return locations
 
     @staticmethod
+    def _location_area_query() -> str:
+        return f"SELECT location_areas.id, location_areas.identifier, location_area_prose.name, location_areas.location_id FROM location_areas INNER JOIN location_area_prose ON location_areas.id = location_area_prose.location_area_id WHERE NOT location_areas.location_id IS NULL AND local_language_id={settings.LOCAL_LANGUAGE_ID}"
+
+    @staticmethod
+    def _encounter_rates_query() -> str:
+        return "SELECT location_area_id, encounter_method_id, rate FROM location_area_encounter_rates AS rates WHERE version_id = (SELECT MAX(version_id) FROM location_area_encounter_rates WHERE location_area_id = rates.location_area_id)"
+
+    @staticmethod
+    def _encounters_query() -> str:
+        return "SELECT location_area_id, species_id, MIN(min_level), MAX(max_level), MAX(rarity), encounter_method_id FROM encounters INNER JOIN pokemon on pokemon_id = pokemon.id INNER JOIN encounter_slots ON encounter_slots.id = encounters.encounter_slot_id GROUP BY location_area_id, pokemon_id, encounter_method_id"
+
+    @staticmethod
+    def _build_location_area(
+        row: tuple,
+        rates: Iterable[tuple],
+        encounters: Iterable[tuple],
+        lookups: _LookupTables,
+        species: Mapping[int, Species],
+    ) -> LocationArea:
+        _, identifier, name, location_id = row
+
+        method_encounters = {}  # type: dict[int, list[Encounter]]
+        for species_id, min_level, max_level, rarity, method_id in encounters:
+            method_encounters.setdefault(method_id, []).append(
+                Encounter(species[species_id], min_level, max_level, rarity)
+            )
+
+        return LocationArea(
+            identifier,
+            name,
+            lookups.locations[location_id],
+            encounter_rates=dict(rates),
+            encounters=method_encounters,
+        )
+
     def _load_location_areas(
-        conn, locations: dict[int, Location], species: dict[int, Species]
+        self, conn, lookups: _LookupTables, species: Mapping[int, Species]
     ) -> dict[int, LocationArea]:
         logging.info("Loading location areas")
-        location_areas = {}
-        cur = conn.cursor()
-        cur.execute(
-            f"SELECT location_areas.id, location_areas.identifier, location_area_prose.name, location_areas.location_id FROM location_areas INNER JOIN location_area_prose ON location_areas.id = location_area_prose.location_area_id WHERE NOT location_areas.location_id IS NULL AND local_language_id={settings.LOCAL_LANGUAGE_ID}"
+        area_rates = self._fetch_grouped(
+            conn, "location_area_encounter_rates", self._encounter_rates_query()
         )
+        area_encounters = self._fetch_grouped(conn, "encounters", self._encounters_query())
 
-        for area_id, identifier, name, location_id in cur.fetchall():
-            rate_cur = conn.cursor()
-            rate_cur.execute(
-                f"SELECT encounter_method_id, rate FROM location_area_encounter_rates WHERE version_id = (SELECT MAX(version_id) FROM location_area_encounter_rates WHERE location_area_id = {area_id}) AND location_area_id = {area_id}"
-            )
-
-            enc_cur = conn.cursor()
-            enc_cur.execute(
-                f"SELECT species_id, MIN(min_level), MAX(max_level), MAX(rarity), encounter_method_id FROM encounters INNER JOIN pokemon on pokemon_id = pokemon.id INNER JOIN encounter_slots ON encounter_slots.id = encounters.encounter_slot_id WHERE location_area_id = {area_id} GROUP BY pokemon_id, encounter_method_id"
-            )
-
-            walk_encs = []
-            for (
-                species_id,
-                min_level,
-                max_level,
-                rarity,
-                method_id,
-            ) in enc_cur.fetchall():
-                if method_id == 1:
-                    walk_encs.append(Encounter(species[species_id], min_level, max_level, rarity))
-
-            location_areas[area_id] = LocationArea(
-                identifier, name, locations[location_id], walk_encs
-            )
+        location_areas = {}
+        with self._timed("location_areas"):
+            for row in conn.execute(self._location_area_query()).fetchall():
+                location_areas[row[0]] = self._build_location_area(
+                    row,
+                    area_rates.get(row[0], ()),
+                    area_encounters.get(row[0], ()),
+                    lookups,
+                    species,
+                )
 
         return location_areas
 
+    def _load_location_area(
+        self, conn, lookups: _LookupTables, species: Mapping[int, Species], area_id: int
+    ) -> LocationArea:
+        (row,) = self._fetch_for_id(conn, "location_areas", self._location_area_query(), area_id)
+
+        return self._build_location_area(
+            (area_id, *row),
+            self._fetch_for_id(
+                conn, "location_area_encounter_rates", self._encounter_rates_query(), area_id
+            ),
+            self._fetch_for_id(conn, "encounters", self._encounters_query(), area_id),
+            lookups,
+            species,
+        )
+
     @staticmethod
     def _load_map_data_tile_types(conn) -> dict[int, MapDataTileType]:
         logging.info("Loading tile types")
@@ -2,6 +2,8 @@ from CreatureRogue.data_layer.species import Species
 
 
 class Encounter:
+    __slots__ = ("max_level", "min_level", "rarity", "species")
+
     def __init__(self, species: Species, min_level: int, max_level: int, rarity):
         self.species = species
         self.min_level = min_level
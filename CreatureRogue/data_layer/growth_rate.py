@@ -1,6 +1,12 @@
+import sys
+
+
 class GrowthRate:
-    def __init__(self, name):
-        self.name = name
+    __slots__ = ("growth_rate_id", "name")
+
+    def __init__(self, name, growth_rate_id: int | None = None):
+        self.name = sys.intern(name)
+        self.growth_rate_id = growth_rate_id
 
     def __str__(self):
         return self.name
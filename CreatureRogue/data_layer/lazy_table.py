@@ -0,0 +1,75 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyTable(Mapping[int, T], Generic[T]):
+    """
+    A read only mapping from id to a static data object where the object
+    is only fetched the first time that it is accessed.
+
+    Fetched objects are kept in a least recently used cache with at most
+    max_size entries so memory use follows what is actually being used
+    rather than the size of the table.
+
+    The set of ids is known up front so iterating over the table and
+    membership checks never fetch anything.
+
+    Lookups hold a lock so the table can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[int],
+        fetch: Callable[[int], T],
+        max_size: int,
+        lock=None,
+    ):
+        """
+        :param lock: A threading.RLock to use instead of the table's own,
+        tables whose fetches read from each other should share one.
+        """
+        if max_size < 1:
+            raise ValueError("A lazy table must be able to cache at least one entry")
+
+        self._ids = tuple(ids)
+        self._id_set = frozenset(self._ids)
+        self._fetch = fetch
+        self._cache = OrderedDict()  # type: OrderedDict[int, T]
+        self.max_size = max_size
+        self._lock = lock if lock is not None else threading.RLock()
+
+    def __getitem__(self, key: int) -> T:
+        if key not in self._id_set:
+            raise KeyError(key)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+            value = self._fetch(key)
+            self._cache[key] = value
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._id_set
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def cached_ids(self) -> list[int]:
+        """
+        The ids currently held in the cache, least recently used first.
+        """
+        with self._lock:
+            return list(self._cache)
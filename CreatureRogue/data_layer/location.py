@@ -1,8 +1,14 @@
+import sys
+
+
 class Location:
-    def __init__(self, identifier, name: str, region):
+    __slots__ = ("identifier", "location_id", "name", "region")
+
+    def __init__(self, identifier, name: str, region, location_id: int | None = None):
         self.region = region
-        self.identifier = identifier
-        self.name = name
+        self.identifier = sys.intern(identifier)
+        self.name = sys.intern(name)
+        self.location_id = location_id
 
     def __str__(self):
         return self.name
@@ -1,26 +1,73 @@
-import functools
+import bisect
+import itertools
 import random
-from collections.abc import Sequence
+import sys
+from collections.abc import Mapping, Sequence
+
+import numpy as np
 
 from CreatureRogue.data_layer.encounter import Encounter
 from CreatureRogue.data_layer.location import Location
 
+WALK_ENCOUNTER_METHOD = 1
+
 
 class LocationArea:
     """
     A location area is the region of the map which contains a certain set of
     encounters.
+
+    Encounters are held by encounter method (walking, surfing, fishing
+    etc.) along with the running total of their rarities so that choosing
+    one is a binary search.
     """
 
+    __slots__ = (
+        "_cumulative_rarities",
+        "encounter_rates",
+        "encounters",
+        "identifier",
+        "location",
+        "name",
+    )
+
     def __init__(
-        self, identifier: str, name: str, location: Location, walk_encounters: Sequence[Encounter]
+        self,
+        identifier: str,
+        name: str,
+        location: Location,
+        walk_encounters: Sequence[Encounter] = (),
+        encounter_rates: Mapping[int, int] | None = None,
+        encounters: Mapping[int, Sequence[Encounter]] | None = None,
     ):
+        """
+        :param walk_encounters: Encounters when walking, shorthand for
+        passing them in encounters under WALK_ENCOUNTER_METHOD.
+        :param encounter_rates: Chance of an encounter by encounter method.
+        :param encounters: The encounters for each encounter method.
+        """
         self.location = location
-        self.identifier = identifier
-        self.name = name
-        self.walk_encounters = walk_encounters  # TODO - Convert walk_encounters to an encounters map that takes an encounter type (id?) and maps to a set of encounters instead
+        self.identifier = sys.intern(identifier)
+        self.name = sys.intern(name)
+        self.encounter_rates = encounter_rates if encounter_rates is not None else {}
+        self.encounters = dict(encounters) if encounters is not None else {}
+        if walk_encounters:
+            self.encounters[WALK_ENCOUNTER_METHOD] = walk_encounters
+
+        self._cumulative_rarities = {
+            method: list(itertools.accumulate(encounter.rarity for encounter in method_encounters))
+            for method, method_encounters in self.encounters.items()
+        }
+
+    @property
+    def walk_encounters(self) -> Sequence[Encounter]:
+        return self.encounters.get(WALK_ENCOUNTER_METHOD, [])
+
+    @property
+    def walk_encounter_rate(self) -> int:
+        return self.encounter_rates.get(WALK_ENCOUNTER_METHOD, 0)
 
-    def get_encounter(self) -> Encounter | None:
+    def get_encounter(self, method: int = WALK_ENCOUNTER_METHOD, rng=random) -> Encounter | None:
         """
         Select between all of the available encounters in the location area.
 
@@ -31,18 +78,45 @@ class LocationArea:
         should occur, this will always return an encounter if one exists
         for the area.
 
-        TODO - This currently assumes that the encounter type is walking.
+        :param method: The encounter method, walking by default.
+        :param rng: Source of randomness, defaults to the random module.
         """
-        total_rarity = functools.reduce(lambda x, y: x + y.rarity, self.walk_encounters, 0)
-        rand = random.randint(0, total_rarity if total_rarity == 0 else total_rarity - 1)
+        cumulative_rarities = self._cumulative_rarities.get(method, [])
+        total_rarity = cumulative_rarities[-1] if cumulative_rarities else 0
+        rand = rng.randint(0, total_rarity if total_rarity == 0 else total_rarity - 1)
 
-        total = 0
-        for encounter in self.walk_encounters:
-            total += encounter.rarity
-            if total > rand:
-                return encounter
+        index = bisect.bisect_right(cumulative_rarities, rand)
+        if index < len(cumulative_rarities):
+            return self.encounters[method][index]
 
         return None
 
+    def sample_encounters(
+        self,
+        n: int,
+        rng: np.random.Generator | None = None,
+        method: int = WALK_ENCOUNTER_METHOD,
+    ) -> np.ndarray:
+        """
+        The batched form of get_encounter for simulations. Makes n weighted
+        random selections in one go.
+
+        :param n: The number of encounters to select.
+        :param rng: NumPy random generator, a fresh one if not passed.
+        :param method: The encounter method, walking by default.
+
+        :return: Integer array of indices into encounters[method].
+        """
+        cumulative_rarities = self._cumulative_rarities.get(method, [])
+        if not cumulative_rarities or cumulative_rarities[-1] <= 0:
+            raise ValueError(f"{self} has no encounters for method {method}")
+
+        if rng is None:
+            rng = np.random.default_rng()
+
+        rands = rng.integers(0, cumulative_rarities[-1], size=n)
+
+        return np.searchsorted(cumulative_rarities, rands, side="right")
+
     def __str__(self):
         return self.name
@@ -1,4 +1,6 @@
 class LocationAreaRect:
+    __slots__ = ("location_area_id", "x1", "x2", "y1", "y2")
+
     def __init__(self, location_area_id: int, x1: int, y1: int, x2: int, y2: int):
         self.location_area_id = location_area_id
         self.x1 = x1
@@ -1,3 +1,7 @@
+import bisect
+
+import numpy as np
+
 from CreatureRogue.data_layer.location_area_rect import LocationAreaRect
 
 
@@ -8,17 +12,54 @@ class LocationAreaRectCollection:
 
     To facilitate this all access must be through accessor functions
     not to data directly.
+
+    Rectangles are indexed in a uniform grid of square cells so a lookup
+    only tests the few rectangles overlapping the cell containing the
+    position rather than every rectangle.
+
+    Where rectangles overlap the one which was added first takes
+    precedence (replacing a rectangle keeps its original precedence).
     """
 
-    def __init__(self):
-        self.by_id = {} # type: dict[int, LocationAreaRect]
+    def __init__(self, cell_size: int = 32):
+        self.by_id = {}  # type: dict[int, LocationAreaRect]
+        self.cell_size = cell_size
+        self._grid = {}  # type: dict[tuple[int, int], list[tuple[int, int]]]
+        self._precedence = {}  # type: dict[int, int]
+
+    def _cells(self, x1: int, y1: int, x2: int, y2: int):
+        """
+        All grid cells which overlap the rectangle (x1,y1),(x2,y2)
+        inclusive.
+        """
+        for cell_y in range(y1 // self.cell_size, y2 // self.cell_size + 1):
+            for cell_x in range(x1 // self.cell_size, x2 // self.cell_size + 1):
+                yield cell_x, cell_y
 
     def add_location_area_rect(self, rect: LocationAreaRect):
         """
         Adds a new location rectangle to the object, will overwrite any
         existing that uses the same location area id.
         """
-        self.by_id[rect.location_area_id] = rect
+        location_area_id = rect.location_area_id
+        if location_area_id in self.by_id:
+            self._remove_from_grid(self.by_id[location_area_id])
+        else:
+            self._precedence[location_area_id] = len(self._precedence)
+
+        self.by_id[location_area_id] = rect
+
+        entry = (self._precedence[location_area_id], location_area_id)
+        for cell in self._cells(rect.x1, rect.y1, rect.x2, rect.y2):
+            bisect.insort(self._grid.setdefault(cell, []), entry)
+
+    def _remove_from_grid(self, rect: LocationAreaRect):
+        entry = (self._precedence[rect.location_area_id], rect.location_area_id)
+        for cell in self._cells(rect.x1, rect.y1, rect.x2, rect.y2):
+            bucket = self._grid[cell]
+            bucket.remove(entry)
+            if not bucket:
+                del self._grid[cell]
 
     def get_location_area_by_position(self, x: int, y: int) -> int | None:
         """
@@ -26,12 +67,55 @@ class LocationAreaRectCollection:
         area which covers those.
 
         Note, that there is currently nothing policing location area
-        overlaps so this will return the first such area.
+        overlaps so this will return the first such area added.
 
         If no location area covers these coordinates then returns None.
         """
-        for location_area_id, rect in self.by_id.items():
+        for _, location_area_id in self._grid.get((x // self.cell_size, y // self.cell_size), ()):
+            rect = self.by_id[location_area_id]
             if rect.x2 >= x >= rect.x1 and rect.y2 >= y >= rect.y1:
                 return location_area_id
 
         return None
+
+    def get_location_areas_in_rect(self, x1: int, y1: int, x2: int, y2: int) -> list[int]:
+        """
+        Returns every location area which intersects the rectangle
+        (x1,y1),(x2,y2) inclusive, e.g. all areas visible in a viewport.
+
+        The areas are in precedence order, so where they overlap the area
+        that get_location_area_by_position would return comes first.
+        """
+        entries = set()
+        for cell in self._cells(x1, y1, x2, y2):
+            entries.update(self._grid.get(cell, ()))
+
+        location_area_ids = []
+        for _, location_area_id in sorted(entries):
+            rect = self.by_id[location_area_id]
+            if rect.x1 <= x2 and rect.x2 >= x1 and rect.y1 <= y2 and rect.y2 >= y1:
+                location_area_ids.append(location_area_id)
+
+        return location_area_ids
+
+    def to_raster(self, width: int, height: int) -> np.ndarray:
+        """
+        Bakes the collection into a dense (height, width) array holding
+        the location area id covering each tile, or -1 where no area
+        covers it. Rectangles are clipped to the array bounds.
+
+        Looking up a tile in the raster gives the same answer as
+        get_location_area_by_position.
+        """
+        raster = np.full((height, width), -1, dtype=np.int32)
+
+        # Paint in reverse precedence so that earlier rectangles end up on top.
+        for location_area_id in sorted(
+            self.by_id, key=lambda area_id: self._precedence[area_id], reverse=True
+        ):
+            rect = self.by_id[location_area_id]
+            raster[max(rect.y1, 0) : max(rect.y2 + 1, 0), max(rect.x1, 0) : max(rect.x2 + 1, 0)] = (
+                location_area_id
+            )
+
+        return raster
@@ -1,4 +1,6 @@
 class MapDataTileType:
+    __slots__ = ("blue", "display_character", "green", "name", "red", "traversable")
+
     def __init__(
         self, name: str, display_character: str, red: int, green: int, blue: int, traversable: bool
     ):
@@ -1,6 +1,9 @@
 import sqlite3 as sqlite
 from collections.abc import Mapping, Sequence
 
+import numpy as np
+
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
 from CreatureRogue.data_layer.map_data_tile_type import MapDataTileType
 from CreatureRogue.data_layer.region import Region
 
@@ -27,16 +30,118 @@ class MapDataTile:
         return f"{self.tile_type} ({self.row}, {self.column})"
 
 
+class MapTileRow(Sequence[MapDataTile]):
+    """
+    A single row of a MapTileGrid. Tiles are created when indexed.
+    """
+
+    def __init__(self, map_data: "MapData", row: int):
+        self.map_data = map_data
+        self.row = row
+
+    def __len__(self) -> int:
+        return self.map_data.width
+
+    def __getitem__(self, column: int) -> MapDataTile:
+        if isinstance(column, slice):
+            raise TypeError("Map rows can't be sliced, use MapData.tile_type_indices")
+
+        tile_type_index = self.map_data.tile_type_indices[self.row, column]
+        return MapDataTile(
+            tile_type=self.map_data.tile_types[tile_type_index],
+            row=self.row,
+            column=column if column >= 0 else column + self.map_data.width,
+        )
+
+
+class MapTileGrid(Sequence[MapTileRow]):
+    """
+    Read only view over the tile type array of a map which behaves like
+    the list of rows of MapDataTile objects that maps used to hold, so
+    tiles[y][x] still works.
+    """
+
+    def __init__(self, map_data: "MapData"):
+        self.map_data = map_data
+
+    def __len__(self) -> int:
+        return self.map_data.height
+
+    def __getitem__(self, row: int) -> MapTileRow:
+        if isinstance(row, slice):
+            raise TypeError("Map grids can't be sliced, use MapData.tile_type_indices")
+        if not -self.map_data.height <= row < self.map_data.height:
+            raise IndexError(row)
+
+        return MapTileRow(self.map_data, row if row >= 0 else row + self.map_data.height)
+
+
 class MapData:
     """
     Contains the full information on the map for a region.
 
     TODO - How do we codify the links between different parts of a region?
+
+    The map is stored as a (rows, columns) uint8 array of indices into
+    tile_types along with lookup tables indexed the same way for each
+    tile type's glyph, colour and traversability. tiles gives a view of
+    the map as rows of MapDataTile objects for code that wants those.
+
+    If location_area_ids is set it is a (rows, columns) array holding the
+    id of the location area covering each tile (-1 for none).
     """
 
-    def __init__(self, region: Region, tiles: Sequence[Sequence[MapDataTile]]):
+    def __init__(
+        self,
+        region: Region,
+        tile_types: Sequence[MapDataTileType],
+        tile_type_indices: np.ndarray,
+        location_area_ids: np.ndarray | None = None,
+    ):
         self.region = region
-        self.tiles = tiles
+        self.tile_types = tuple(tile_types)
+        self.tile_type_indices = tile_type_indices
+        self.location_area_ids = location_area_ids
+
+        self.glyphs = np.array(
+            [ord(tile_type.display_character) for tile_type in self.tile_types], dtype=np.int32
+        )
+        self.colors = np.array(
+            [tile_type.color for tile_type in self.tile_types], dtype=np.uint8
+        ).reshape(-1, 3)
+        self.traversable = np.array(
+            [bool(tile_type.traversable) for tile_type in self.tile_types], dtype=np.bool_
+        )
+
+        self.tiles = MapTileGrid(self)
+
+    @property
+    def height(self) -> int:
+        return self.tile_type_indices.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.tile_type_indices.shape[1]
+
+    def tile_type_at(self, x: int, y: int) -> MapDataTileType:
+        return self.tile_types[self.tile_type_indices[y, x]]
+
+    def is_traversable(self, x: int, y: int) -> bool:
+        return bool(self.traversable[self.tile_type_indices[y, x]])
+
+    def location_area_at(self, x: int, y: int) -> int | None:
+        """
+        Returns the id of the location area covering the tile at x, y or
+        None if there isn't one (or the position is off the map).
+
+        Only valid if the location area ids were baked into the map.
+        """
+        rows, columns = self.location_area_ids.shape
+        if not (0 <= y < rows and 0 <= x < columns):
+            return None
+
+        location_area_id = int(self.location_area_ids[y, x])
+        return location_area_id if location_area_id >= 0 else None
 
 
 class MapLoader:
@@ -48,6 +153,7 @@ class MapLoader:
         region: Region,
         tile_types: Mapping[int, MapDataTileType],
         default_tile_type: MapDataTileType,
+        location_area_rects: LocationAreaRectCollection | None = None,
     ) -> MapData:
         """
         This function will load the data for a given region.
@@ -61,25 +167,51 @@ class MapLoader:
         static data.
         :param default_tile_type: If a tile doesn't exist in the database
         then this is the type which is loaded in it's place.
+        :param location_area_rects: If passed then the location area of
+        every tile is baked into the map so that it can be looked up by
+        position without any geometry tests.
 
         :return: A MapData object containing the full information required to
         render the map.
         """
+        # Index 0 is always the default tile type so that the zero filled
+        # array starts out as all default tiles.
+        map_tile_types = [default_tile_type] + [
+            tile_type for tile_type in tile_types.values() if tile_type is not default_tile_type
+        ]
+        if len(map_tile_types) > np.iinfo(np.uint8).max + 1:
+            raise ValueError(f"Too many tile types ({len(map_tile_types)}) for a uint8 map")
+
+        index_by_tile_type_id = np.zeros(max(tile_types, default=0) + 1, dtype=np.uint8)
+        for tile_type_id, tile_type in tile_types.items():
+            index_by_tile_type_id[tile_type_id] = map_tile_types.index(tile_type)
+
         with sqlite.connect(self.db_file) as conn:
             cur = conn.cursor()
             cur.execute(
                 f'SELECT MAX(row) + 1, MAX("column") + 1 FROM region_map_data WHERE region_id = {region.id}'
             )
             max_row, max_col = cur.fetchone()
-            tiles = [
-                [MapDataTile(tile_type=default_tile_type, row=y, column=x) for x in range(max_col)]
-                for y in range(max_row)
-            ]
+            tile_type_indices = np.zeros((max_row, max_col), dtype=np.uint8)
 
             cur.execute(
                 f'SELECT row, "column", cell_type_id FROM region_map_data WHERE region_id = {region.id} ORDER BY row, "column"'
             )
-            for y, x, tile_type_id in cur.fetchall():
-                tiles[y][x].tile_type = tile_types.get(tile_type_id, default_tile_type)
+            cells = np.array(cur.fetchall(), dtype=np.int64).reshape(-1, 3)
+            rows, columns, tile_type_ids = cells[:, 0], cells[:, 1], cells[:, 2]
 
-            return MapData(region=region, tiles=tiles)
+            known = (tile_type_ids >= 0) & (tile_type_ids < len(index_by_tile_type_id))
+            tile_type_indices[rows[known], columns[known]] = index_by_tile_type_id[
+                tile_type_ids[known]
+            ]
+
+            location_area_ids = None
+            if location_area_rects is not None:
+                location_area_ids = location_area_rects.to_raster(max_col, max_row)
+
+            return MapData(
+                region=region,
+                tile_types=map_tile_types,
+                tile_type_indices=tile_type_indices,
+                location_area_ids=location_area_ids,
+            )
@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Mapping
 
 from CreatureRogue.data_layer.ailment import Ailment
@@ -7,6 +8,24 @@ from CreatureRogue.data_layer.type import Type
 
 
 class MoveData:
+    __slots__ = (
+        "accuracy_stat",
+        "ailment",
+        "attack_stat",
+        "base_accuracy",
+        "base_attack",
+        "defence_stat",
+        "evasion_stat",
+        "max_hits",
+        "max_pp",
+        "min_hits",
+        "move_id",
+        "name",
+        "stat_changes",
+        "target",
+        "type",
+    )
+
     def __init__(
         self,
         name: str,
@@ -23,8 +42,10 @@ class MoveData:
         evasion_stat: Stat | None,
         target: MoveTarget,
         ailment: Ailment | None,
+        move_id: int | None = None,
     ):
-        self.name = name
+        self.move_id = move_id
+        self.name = sys.intern(name)
         self.max_pp = max_pp
         self.type = move_type
         self.base_attack = base_attack
@@ -52,5 +73,22 @@ class MoveData:
         """
         return any(self.stat_changes[stat] != 0 for stat in self.stat_changes)
 
+    def __eq__(self, other):
+        """
+        MoveData records are equal if they have the same database id, so a
+        record reloaded by a lazy table is interchangeable with the one it
+        replaced. Records without an id are only equal to themselves.
+        """
+        if not isinstance(other, MoveData):
+            return NotImplemented
+
+        return self is other or (self.move_id is not None and self.move_id == other.move_id)
+
+    def __hash__(self):
+        if self.move_id is None:
+            return object.__hash__(self)
+
+        return hash((MoveData, self.move_id))
+
     def __str__(self):
         return self.name
@@ -1,8 +1,14 @@
+import sys
+
+
 class MoveTarget:
-    def __init__(self, identifier: str, name: str, description: str):
-        self.identifier = identifier
-        self.name = name
+    __slots__ = ("description", "identifier", "name", "target_id")
+
+    def __init__(self, identifier: str, name: str, description: str, target_id: int | None = None):
+        self.identifier = sys.intern(identifier)
+        self.name = sys.intern(name)
         self.description = description
+        self.target_id = target_id
 
     def __str__(self):
         return self.name
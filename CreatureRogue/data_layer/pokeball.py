@@ -1,4 +1,16 @@
+import sys
+
+
 class Pokeball:
+    __slots__ = (
+        "bottom_color",
+        "catch_rate",
+        "display_char",
+        "name",
+        "pokeball_id",
+        "top_color",
+    )
+
     def __init__(
         self,
         pokeball_id: int,
@@ -9,7 +21,7 @@ class Pokeball:
         display_char: str,
     ):
         self.pokeball_id = pokeball_id
-        self.name = name
+        self.name = sys.intern(name)
         self.catch_rate = catch_rate
         self.top_color = top_color
         self.bottom_color = bottom_color
@@ -1,8 +1,13 @@
+import sys
+
+
 class Region:
+    __slots__ = ("id", "identifier", "name")
+
     def __init__(self, region_id, identifier, name: str):
         self.id = region_id
-        self.identifier = identifier
-        self.name = name
+        self.identifier = sys.intern(identifier)
+        self.name = sys.intern(name)
 
     def __str__(self):
         return self.name
@@ -0,0 +1,171 @@
+"""
+A snapshot is a pre-built copy of the fully linked static game data which
+can be read back far faster than re-parsing the database on every start
+up.
+
+Snapshots are keyed on a hash of the database file and the settings which
+change what gets loaded from it, so a stale snapshot is never used. They
+can be built ahead of time with:
+
+    python -m CreatureRogue.data_layer.snapshot
+
+and are otherwise rebuilt automatically whenever the game falls back to
+loading from the database.
+"""
+
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import CreatureRogue.settings as settings
+from CreatureRogue.data_layer.data import StaticGameData, load_location_area_rects
+from CreatureRogue.data_layer.db_layer import Loader
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+
+# Must be bumped whenever one of the pickled data layer classes changes
+# shape, otherwise old snapshots would load objects missing attributes.
+SNAPSHOT_FORMAT_VERSION = 8
+
+_MAGIC = b"CRSNAP"
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+def snapshot_key(db_file: str) -> tuple:
+    """
+    The key identifies exactly which data a snapshot was built from. Any
+    change to the database contents or to the settings that filter it
+    gives a different key.
+    """
+    digest = hashlib.sha256()
+    with Path(db_file).open("rb") as db:
+        for chunk in iter(lambda: db.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return (
+        SNAPSHOT_FORMAT_VERSION,
+        digest.hexdigest(),
+        settings.LOCAL_LANGUAGE_ID,
+        settings.VERSION_GROUP_ID,
+        settings.POKEDEX_ID,
+        settings.VERSION_ID,
+        settings.LOCATION_GENERATION_ID,
+    )
+
+
+def write_snapshot(static_game_data: StaticGameData, db_file: str, snapshot_file: str):
+    """
+    Serialises the static game data into the snapshot file.
+
+    The location area rectangles come from a separate file which is cheap
+    to parse so they are not stored in the snapshot.
+    """
+    snapshot_data = copy.copy(static_game_data)
+    snapshot_data.location_area_rects = None
+
+    header = pickle.dumps(snapshot_key(db_file), protocol=pickle.HIGHEST_PROTOCOL)
+    payload = pickle.dumps(snapshot_data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Written to a temporary file which atomically replaces the snapshot,
+    # so a crash or a full disk never leaves a truncated snapshot behind.
+    path = Path(snapshot_file)
+    fd, temp_file = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as snapshot:
+            snapshot.write(_MAGIC)
+            snapshot.write(_HEADER_LENGTH.pack(len(header)))
+            snapshot.write(header)
+            snapshot.write(payload)
+        Path(temp_file).replace(path)
+    except BaseException:
+        Path(temp_file).unlink(missing_ok=True)
+        raise
+
+
+def read_snapshot(
+    db_file: str, snapshot_file: str, location_area_rectangles: LocationAreaRectCollection
+) -> StaticGameData | None:
+    """
+    Reads the static game data back from a snapshot file.
+
+    Returns None if there is no snapshot, if it was built from a
+    different database or different settings or if it can't be read (e.g.
+    it was truncated). The header is checked before the (much larger)
+    payload is read.
+    """
+    path = Path(snapshot_file)
+    if not path.is_file() or not Path(db_file).is_file():
+        return None
+
+    with path.open("rb") as snapshot:
+        if snapshot.read(len(_MAGIC)) != _MAGIC:
+            logging.warning("Ignoring %s, it is not a snapshot file", snapshot_file)
+            return None
+
+        try:
+            (header_length,) = _HEADER_LENGTH.unpack(snapshot.read(_HEADER_LENGTH.size))
+            key = pickle.loads(snapshot.read(header_length))
+            if key != snapshot_key(db_file):
+                logging.info("Snapshot %s is stale", snapshot_file)
+                return None
+
+            static_game_data = pickle.load(snapshot)
+        except Exception as err:
+            # A damaged pickle can raise almost anything (ValueError for a
+            # bad protocol, UnicodeDecodeError, KeyError...), none of which
+            # should stop the data being loaded from the database instead.
+            logging.warning("Ignoring %s, the snapshot is corrupt: %r", snapshot_file, err)
+            return None
+
+    static_game_data.location_area_rects = location_area_rectangles
+    return static_game_data
+
+
+def load_static_data(
+    db_file: str,
+    snapshot_file: str,
+    location_area_rectangles: LocationAreaRectCollection,
+    rebuild: bool = True,
+) -> StaticGameData:
+    """
+    Loads the static game data from the snapshot if it is up to date and
+    falls back to the database otherwise.
+
+    :param rebuild: Whether to write a fresh snapshot after falling back
+    to the database so that the next start up is fast again.
+    """
+    start = time.perf_counter()
+    static_game_data = read_snapshot(db_file, snapshot_file, location_area_rectangles)
+    if static_game_data is not None:
+        logging.info("Loaded static data from snapshot in %.3fs", time.perf_counter() - start)
+        return static_game_data
+
+    static_game_data = Loader(db_file).load_static_data(location_area_rectangles)
+
+    if rebuild:
+        try:
+            write_snapshot(static_game_data, db_file, snapshot_file)
+        except OSError as err:
+            logging.warning("Unable to write snapshot %s: %s", snapshot_file, err)
+
+    return static_game_data
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    build_start = time.perf_counter()
+    built_data = Loader(settings.DB_FILE).load_static_data(
+        load_location_area_rects(settings.LOCATION_AREA_RECTS_FILE)
+    )
+    write_snapshot(built_data, settings.DB_FILE, settings.SNAPSHOT_FILE)
+    print(
+        f"Wrote {settings.SNAPSHOT_FILE} in {time.perf_counter() - build_start:.3f}s",
+        file=sys.stderr,
+    )
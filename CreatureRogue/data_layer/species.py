@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Mapping, Sequence
 
 from CreatureRogue.data_layer.color import Color
@@ -8,6 +9,37 @@ from CreatureRogue.data_layer.type import Type
 
 
 class Species:
+    """
+    The static data for a single species.
+
+    The move set at each level is worked out the first time one is asked
+    for and kept in a table indexed by level. The table is rebuilt if
+    level_moves is replaced (but not if it is modified in place).
+
+    Species are not frozen since level_moves can be replaced, but
+    equality and hashing only use the species id so they aren't affected
+    by changes to any other attribute.
+    """
+
+    __slots__ = (
+        "_learnset",
+        "_level_moves",
+        "base_stats",
+        "base_xp_yield",
+        "capture_rate",
+        "display_character",
+        "display_color",
+        "flavor_text",
+        "genus",
+        "growth_rate",
+        "height",
+        "name",
+        "pokedex_number",
+        "species_id",
+        "types",
+        "weight",
+    )
+
     def __init__(
         self,
         pokedex_number: int,
@@ -24,9 +56,11 @@ class Species:
         flavor_text: str,
         genus: str,
         capture_rate: int,
+        species_id: int | None = None,
     ):
+        self.species_id = species_id
         self.pokedex_number = pokedex_number
-        self.name = name
+        self.name = sys.intern(name)
         self.height = height
         self.weight = weight
         self.types = types
@@ -40,6 +74,27 @@ class Species:
         self.genus = genus
         self.capture_rate = capture_rate
 
+    @property
+    def level_moves(self) -> Mapping[int, Sequence[MoveData]]:
+        return self._level_moves
+
+    @level_moves.setter
+    def level_moves(self, level_moves: Mapping[int, Sequence[MoveData]]):
+        self._level_moves = level_moves
+        self._learnset = None  # type: list[tuple[MoveData, ...]] | None
+
+    def _build_learnset(self) -> list[tuple[MoveData, ...]]:
+        """
+        The move set at every level from 0 to the last level at which a
+        move is learnt. Each level's set is the moves learnt at that level
+        followed by the previous level's set, cut down to 4.
+        """
+        learnset = [()]  # type: list[tuple[MoveData, ...]]
+        for level in range(1, max(self._level_moves, default=0) + 1):
+            learnset.append((*self._level_moves.get(level, ()), *learnset[-1])[:4])
+
+        return learnset
+
     def imperial_weight_str(self) -> str:
         """
         Weight is stored in 1/10kg so this function is used to convert to
@@ -71,14 +126,10 @@ class Species:
         """
         assert level > 0
 
-        moves = []  # type: list[MoveData]
-        for i in [lvl for lvl in range(level, 0, -1) if lvl in self.level_moves]:
-            moves.extend(self.level_moves[i])
-
-            if len(moves) >= 4:
-                break
+        if self._learnset is None:
+            self._learnset = self._build_learnset()
 
-        return moves[:4]
+        return list(self._learnset[min(level, len(self._learnset) - 1)])
 
     def level(self, xp_loader, current_xp):
         """
@@ -86,5 +137,25 @@ class Species:
         """
         return xp_loader.level_at_xp(self, current_xp)
 
+    def __eq__(self, other):
+        """
+        Compared by species id. The lazy species table can evict a species
+        and load it again as a new object, which must still be the same
+        dict key (e.g. in the pokedex or the AI caches). Species created
+        without an id fall back to identity.
+        """
+        if not isinstance(other, Species):
+            return NotImplemented
+
+        return self is other or (
+            self.species_id is not None and self.species_id == other.species_id
+        )
+
+    def __hash__(self):
+        if self.species_id is None:
+            return object.__hash__(self)
+
+        return hash((Species, self.species_id))
+
     def __str__(self):
         return self.name
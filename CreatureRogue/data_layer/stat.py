@@ -1,7 +1,13 @@
+import sys
+
+
 class Stat:
-    def __init__(self, name: str, short_name: str):
-        self.name = name
-        self.short_name = short_name
+    __slots__ = ("name", "short_name", "stat_id")
+
+    def __init__(self, name: str, short_name: str, stat_id: int | None = None):
+        self.name = sys.intern(name)
+        self.short_name = sys.intern(short_name)
+        self.stat_id = stat_id
 
     def __str__(self):
         return self.name
@@ -1,6 +1,12 @@
+import sys
+
+
 class Type:
-    def __init__(self, name: str):
-        self.name = name
+    __slots__ = ("name", "type_id")
+
+    def __init__(self, name: str, type_id: int | None = None):
+        self.name = sys.intern(name)
+        self.type_id = type_id
 
     def __str__(self):
         return self.name
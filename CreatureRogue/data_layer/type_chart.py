@@ -1,10 +1,49 @@
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
 from CreatureRogue.data_layer.type import Type
 
 
 class TypeChart:
-    def __init__(self, chart: dict[Type, dict[Type, int]]):
+    """
+    Holds how effective attacks of each type are against creatures of
+    each type.
+
+    As well as the chart as passed in, the modifiers are held in a dense
+    (types + 1, types + 1) matrix where each type has been given an index
+    (type_index). The final index is used for any type which isn't in the
+    chart (and to pad single type defenders) and is always 100.
+    """
+
+    def __init__(self, chart: dict[Type, dict[Type, int]], types: Iterable[Type] = ()):
+        """
+        :param chart: Damage modifier by attacking type then defending type.
+        Any pair not in the chart has a modifier of 100.
+        :param types: All types, these get an index in the matrix even if
+        they don't appear in the chart.
+        """
         self.chart = chart
 
+        self.type_index = {}  # type: dict[Type, int]
+        for chart_type in types:
+            self.type_index.setdefault(chart_type, len(self.type_index))
+        for attacking_type, defending_types in chart.items():
+            for chart_type in (attacking_type, *defending_types):
+                self.type_index.setdefault(chart_type, len(self.type_index))
+        self.neutral_index = len(self.type_index)
+
+        self.matrix = np.full((self.neutral_index + 1,) * 2, 100, dtype=np.int16)
+        for attacking_type, defending_types in chart.items():
+            for defending_type, damage_factor in defending_types.items():
+                self.matrix[self.type_index[attacking_type], self.type_index[defending_type]] = (
+                    damage_factor
+                )
+
+        # Scalar lookups into a numpy array are slow so damage_modifier
+        # uses the same matrix as nested lists.
+        self._rows = self.matrix.tolist()
+
     def damage_modifier(self, attacking_type: Type, defending_type: Type) -> int:
         """
         The type chart hold information on how attacks of all types affect
@@ -17,9 +56,66 @@ class TypeChart:
         :return: The integer factor which corresponds to the percentage
         damage adjustment (so 100 is default).
         """
-        if attacking_type in self.chart and defending_type in self.chart[attacking_type]:
-            return self.chart[attacking_type][defending_type]
-        return 100
+        return self._rows[self.type_index.get(attacking_type, self.neutral_index)][
+            self.type_index.get(defending_type, self.neutral_index)
+        ]
+
+    def combined_modifier(self, attacking_type: Type, defending_types: Iterable[Type]) -> float:
+        """
+        The factor applied to the damage of an attack of one type against
+        a creature with all of the defending types (so 1 is default).
+        """
+        row = self._rows[self.type_index.get(attacking_type, self.neutral_index)]
+
+        modifier = 1
+        for defending_type in defending_types:
+            modifier = modifier * row[self.type_index.get(defending_type, self.neutral_index)] / 100
+
+        return modifier
+
+    def indices(self, types: Iterable[Type]) -> np.ndarray:
+        """
+        The matrix index of each of the types.
+        """
+        return np.array([self.type_index.get(t, self.neutral_index) for t in types], dtype=np.intp)
+
+    def defender_indices(self, defenders: Iterable[Sequence[Type]]) -> np.ndarray:
+        """
+        Builds the (defenders, 2) array of matrix indices that
+        combined_modifiers takes from the types of each defender, e.g.
+        [species.types for species in static_game_data.species.values()].
+
+        Defenders with a single type are padded with the neutral index.
+        """
+        defenders = list(defenders)
+        indices = np.full((len(defenders), 2), self.neutral_index, dtype=np.intp)
+        for row, defending_types in enumerate(defenders):
+            if len(defending_types) > 2:
+                raise ValueError(f"Defenders have at most two types, not {len(defending_types)}")
+
+            indices[row, : len(defending_types)] = self.indices(defending_types)
+
+        return indices
+
+    def combined_modifiers(
+        self, attacking_types: Iterable[Type], defender_indices: np.ndarray
+    ) -> np.ndarray:
+        """
+        The batched form of combined_modifier. Scores every attacking type
+        against every defender in one go.
+
+        :param attacking_types: The types of the attacks (e.g. a move
+        pool).
+        :param defender_indices: The types of each defender as returned by
+        defender_indices.
+
+        :return: A (attacking types, defenders) float array of the factor
+        applied to the damage of each attack against each defender.
+        """
+        rows = self.matrix[self.indices(attacking_types)]
+
+        # Same order of operations as combined_modifier.
+        return rows[:, defender_indices[:, 0]] / 100 * rows[:, defender_indices[:, 1]] / 100
 
     def __str__(self):
         type_chart_str = ""
@@ -1,24 +1,76 @@
+import bisect
+from collections.abc import Sequence
+
+import numpy as np
+
 from CreatureRogue.data_layer.growth_rate import GrowthRate
 from CreatureRogue.data_layer.species import Species
 
 
 class XpLookup:
+    """
+    The experience required for each level by growth rate.
+
+    Alongside the map each growth rate's levels and xp thresholds are held
+    as arrays sorted by level so that finding the level for an amount of
+    xp is a binary search.
+    """
+
     def __init__(self, xp_map: dict[GrowthRate, dict[int, int]]):
         self.xp_map = xp_map
+        self._levels = {}  # type: dict[GrowthRate, np.ndarray]
+        self._thresholds = {}  # type: dict[GrowthRate, np.ndarray]
+
+        for growth_rate, level_xps in xp_map.items():
+            levels = sorted(level_xps)
+            # A trailing 0 is the level for xp beyond the final threshold.
+            self._levels[growth_rate] = np.array([*levels, 0], dtype=np.int64)
+            self._thresholds[growth_rate] = np.array(
+                [level_xps[level] for level in levels], dtype=np.int64
+            )
+
+        self._threshold_lists = {
+            growth_rate: thresholds.tolist() for growth_rate, thresholds in self._thresholds.items()
+        }
+        self._level_lists = {
+            growth_rate: levels.tolist() for growth_rate, levels in self._levels.items()
+        }
 
     def level_at_xp(self, species: Species, xp: int) -> int:
         """
         The level that a creature is when it has exactly xp amount of
         experience is determined by the species growth rate and some static
         data which is checked here.
+
+        This is the first level whose threshold is more than xp, or 0 if xp
+        is beyond every threshold.
+        """
+        growth_rate = species.growth_rate
+        index = bisect.bisect_right(self._threshold_lists[growth_rate], xp)
+
+        return self._level_lists[growth_rate][index]
+
+    def levels_at_xp(self, species: Sequence[Species], xps) -> np.ndarray:
+        """
+        The batched form of level_at_xp for many creatures at once.
+
+        :param species: The species of each creature.
+        :param xps: Array of the xp of each creature.
+
+        :return: Integer array of the level of each creature.
         """
-        level_xps = self.xp_map[species.growth_rate]
+        xps = np.asarray(xps, dtype=np.int64)
+        growth_rates = [s.growth_rate for s in species]
+        levels = np.empty(len(growth_rates), dtype=np.int64)
 
-        for level, level_xp in level_xps.items():
-            if xp < level_xp:
-                return level
+        for growth_rate in set(growth_rates):
+            mask = np.fromiter(
+                (rate == growth_rate for rate in growth_rates), dtype=np.bool_, count=len(levels)
+            )
+            indices = np.searchsorted(self._thresholds[growth_rate], xps[mask], side="right")
+            levels[mask] = self._levels[growth_rate][indices]
 
-        return 0
+        return levels
 
     def xp_at_level(self, species: Species, level: int) -> int:
         """
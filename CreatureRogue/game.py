@@ -7,15 +7,18 @@ Use Game.create() to instantiate a fully initialized game.
 
 from __future__ import annotations
 
-import random
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import tcod
 
+import CreatureRogue.battle_replay as battle_replay
 import CreatureRogue.creature_creator as creature_creator
 import CreatureRogue.data_layer.data as data
 import CreatureRogue.data_layer.db_layer as db_layer
+import CreatureRogue.data_layer.snapshot as snapshot
 import CreatureRogue.settings as settings
 from CreatureRogue.battle_ai import RandomMoveAi
 from CreatureRogue.models.battle_creature import BattleCreature
@@ -29,6 +32,7 @@ from CreatureRogue.renderer.battle_renderer import (
 from CreatureRogue.renderer.game_menu_renderer import GameMenuRenderer
 from CreatureRogue.renderer.map_renderer import MapRenderer
 from CreatureRogue.renderer.pokedex_renderer import PokedexRenderer
+from CreatureRogue.rng import RandomStream
 from CreatureRogue.states.battle_state import BattleState
 from CreatureRogue.states.game_menu_state import InGameMenuState
 from CreatureRogue.states.map_state import MapState
@@ -57,8 +61,14 @@ class Game:
         level_up_renderer: LevelUpRenderer,
         game_menu_renderer: GameMenuRenderer,
         catch_graphic_renderer: CatchGraphicRenderer,
+        rng: RandomStream | None = None,
     ):
+        """
+        :param rng: The random number stream used for all encounters and
+        battles, seeded from settings.RANDOM_SEED if not passed.
+        """
         self.config = config
+        self.rng = rng if rng is not None else RandomStream(settings.RANDOM_SEED)
         self.static_game_data = static_game_data
         self.game_data = game_data
         self.battle_renderer = battle_renderer
@@ -67,6 +77,13 @@ class Game:
         self.level_up_renderer = level_up_renderer
         self.game_menu_renderer = game_menu_renderer
         self.catch_graphic_renderer = catch_graphic_renderer
+        self.dirty = True
+        self.rendered_frames = 0
+        self.skipped_frames = 0
+        # Computer moves are selected off the main thread so that the game
+        # loop keeps handling events whilst an AI searches. A single worker
+        # means only one AI is ever reading the battle at a time.
+        self.ai_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="computer-ai")
         self.state = MapState(self, self.game_data, self.map_renderer)
 
     @classmethod
@@ -80,15 +97,22 @@ class Game:
         """
         Factory method to create a fully initialized Game instance.
 
-        This loads all static data from the database and creates all renderers.
+        This loads all static data (from the snapshot if it is up to date,
+        otherwise from the database, or on demand if LAZY_STATIC_DATA is
+        set) and creates all renderers.
         """
         config = GameConfig(screen_width, screen_height, title, font)
 
         # Load static game data
         location_area_rectangles = data.load_location_area_rects(settings.LOCATION_AREA_RECTS_FILE)
-        static_game_data = db_layer.Loader(settings.DB_FILE).load_static_data(
-            location_area_rectangles
-        )
+        if settings.LAZY_STATIC_DATA:
+            static_game_data = db_layer.Loader(settings.DB_FILE).load_lazy_static_data(
+                location_area_rectangles
+            )
+        else:
+            static_game_data = snapshot.load_static_data(
+                settings.DB_FILE, settings.SNAPSHOT_FILE, location_area_rectangles
+            )
 
         # Create game data
         game_data = GameData()
@@ -130,6 +154,18 @@ class Game:
 
         return game
 
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, state):
+        """
+        Every state transition needs the new state drawing.
+        """
+        self._state = state
+        self.dirty = True
+
     @property
     def screen_width(self) -> int:
         return self.config.screen_width
@@ -146,10 +182,53 @@ class Game:
     def font(self) -> str:
         return self.config.font
 
+    def _animating(self) -> bool:
+        return self.state is not None and self.state.needs_redraw()
+
+    def render_frame(self, console: tcod.console.Console) -> bool:
+        """
+        Draws the frame border and the current state onto the console if
+        anything has changed since the last frame was drawn.
+
+        The frame is only redrawn if it has been marked dirty (by input or
+        a state transition) or the state has something animating.
+        Otherwise the frame is counted in skipped_frames.
+
+        :param console: The root console to draw onto.
+
+        :return: Whether the console was redrawn and so needs presenting.
+        """
+        if not self.dirty and not self._animating():
+            self.skipped_frames += 1
+            return False
+
+        # Cleared before rendering so that a state transition made during
+        # rendering causes another redraw.
+        self.dirty = False
+        self.rendered_frames += 1
+
+        console.draw_frame(
+            0,
+            0,
+            self.screen_width,
+            self.screen_height,
+            fg=settings.FOREGROUND_COLOR,
+        )
+
+        if self.state is not None:
+            output_console = self.state.render()
+            output_console.blit(console, 0, 0, self.screen_width, self.screen_height, 0, 0)
+
+        return True
+
     def game_loop(self):
         """
         The game loop runs until the user closes the window manually. All
         game logic and rendering is done here.
+
+        The loop sleeps until there is an event to handle unless something
+        is animating, in which case it wakes up at most FPS_LIMIT times a
+        second to draw the next frame.
         """
         console = tcod.console.Console(self.screen_width, self.screen_height)
         with tcod.context.new(
@@ -159,27 +238,21 @@ class Game:
             tileset=tcod.tileset.load_tilesheet(self.font, 16, 16, tcod.tileset.CHARMAP_TCOD),
         ) as context:
             while True:
-                console.draw_frame(
-                    0,
-                    0,
-                    self.screen_width,
-                    self.screen_height,
-                    fg=settings.FOREGROUND_COLOR,
-                )
-
-                if self.state is not None:
-                    output_console = self.state.render()
-                    output_console.blit(console, 0, 0, self.screen_width, self.screen_height, 0, 0)
+                if self.render_frame(console):
+                    context.present(console)
 
-                context.present(console)
-
-                for event in tcod.event.wait():
+                timeout = 1 / settings.FPS_LIMIT if self._animating() or self.dirty else None
+                for event in tcod.event.wait(timeout):
                     context.convert_event(event)  # Sets tile coordinates for mouse events.
 
                     match event:
                         case tcod.event.KeyDown():
                             if self.state is not None:
                                 self.state.handle_input(event)
+                            self.dirty = True
+                        case tcod.event.WindowEvent():
+                            # Exposed, resized, restored etc.
+                            self.dirty = True
                         case tcod.event.Quit():
                             raise SystemExit
 
@@ -195,25 +268,37 @@ class Game:
 
     def start_wild_battle(self):
         # Choose a pokemon to fight
-        x, y = self.game_data.player.coords
-        location_area_id = self.static_game_data.location_area_rects.get_location_area_by_position(
-            x, y
-        )
+        location_area = self.game_data.player.get_location_area()
 
-        if location_area_id is not None:
-            encounter = self.static_game_data.location_areas[location_area_id].get_encounter()
+        if location_area is not None:
+            encounter = location_area.get_encounter(rng=self.rng)
 
-            level = random.randint(encounter.min_level, encounter.max_level)
+            level = self.rng.randint(encounter.min_level, encounter.max_level)
             wild_creature = creature_creator.create_wild_creature(
-                self.static_game_data, encounter.species, level
+                self.static_game_data, encounter.species, level, self.rng
             )
             self.game_data.player.encounter_creature(wild_creature)
+            player_creature = self.game_data.player.creatures[0]
+
+            # The battle gets its own stream so that it can be replayed
+            # from the seed alone.
+            battle_seed = self.rng.getrandbits(64)
+            battle_rng = RandomStream(battle_seed)
+            wild_battle_creature = BattleCreature(wild_creature, self.static_game_data)
+            computer_ai = RandomMoveAi(wild_battle_creature, battle_rng)
+            battle_log = None
+            if settings.RECORD_BATTLES:
+                battle_log = battle_replay.start_battle_log(
+                    battle_seed, player_creature, wild_creature, self.static_game_data, computer_ai
+                )
 
             self.game_data.battle_data = BattleData(
                 self.game_data,
-                BattleCreature(self.game_data.player.creatures[0], self.static_game_data),
-                RandomMoveAi(BattleCreature(wild_creature, self.static_game_data)),
-                wild_creature=BattleCreature(wild_creature, self.static_game_data),
+                BattleCreature(player_creature, self.static_game_data),
+                computer_ai,
+                wild_creature=wild_battle_creature,
+                rng=battle_rng,
+                battle_log=battle_log,
             )
 
             self.state = BattleState(
@@ -224,12 +309,30 @@ class Game:
                 self.catch_graphic_renderer,
             )
 
+    def _finish_battle_log(self, caught: bool):
+        battle_data = self.game_data.battle_data
+        battle_log = battle_data.battle_log
+        if battle_log is not None:
+            battle_log.finish(
+                battle_data.player_creature,
+                battle_data.defending_creature(),
+                caught,
+                battle_data.rng,
+            )
+            log_file = battle_replay.battle_log_file(battle_log.seed)
+            try:
+                battle_log.write(log_file)
+            except OSError as err:
+                logging.warning("Unable to write battle log %s: %s", log_file, err)
+
     def catch_creature(self, creature):
+        self._finish_battle_log(caught=True)
         self.game_data.player.catch_creature(creature)
         self.game_data.battle_data = None
         self.state = MapState(self, self.game_data, self.map_renderer)
 
     def end_wild_battle(self):
+        self._finish_battle_log(caught=False)
         self.game_data.battle_data = None
         self.state = MapState(self, self.game_data, self.map_renderer)
 
@@ -0,0 +1,309 @@
+"""
+Command line tool which estimates how often each species beats every
+other species at a set of levels by simulating wild battles:
+
+    python -m CreatureRogue.matchup_matrix --levels 10 50 --battles 200
+
+Every pair of species is a separate Monte Carlo estimate seeded from the
+run's seed, the level and the two species so results don't depend on how
+the work was split up. Pairs are handed out to a process pool in chunks
+and the results of each chunk are appended to a JSON lines file as soon
+as it completes. Running again with the same file only simulates the
+pairs which are missing from it.
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+import CreatureRogue.creature_creator as creature_creator
+import CreatureRogue.data_layer.snapshot as snapshot
+import CreatureRogue.settings as settings
+from CreatureRogue.battle_simulator import simulate_battle
+from CreatureRogue.data_layer.data import StaticGameData
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+from CreatureRogue.rng import RandomStream
+
+RESULT_FILE = "matchups.jsonl"
+DEFAULT_CHUNK_SIZE = 32
+
+# Static data for the worker process, loaded once by _init_worker.
+_worker_static_game_data = None  # type: StaticGameData | None
+
+
+@dataclass(frozen=True)
+class MatchupResult:
+    """
+    The result of simulating battles between wild creatures of species a
+    and species b at the given level.
+    """
+
+    level: int
+    species_a: int
+    species_b: int
+    seed: int
+    battles: int
+    wins_a: int
+    wins_b: int
+    turns: int
+
+    @property
+    def key(self) -> tuple[int, int, int]:
+        return self.level, self.species_a, self.species_b
+
+    @property
+    def draws(self) -> int:
+        return self.battles - self.wins_a - self.wins_b
+
+
+def matchup_pairs(species_ids: Sequence[int], levels: Iterable[int]) -> list[tuple[int, int, int]]:
+    """
+    Every (level, species a, species b) which needs simulating. Battles are
+    symmetric so each unordered pair (including a species against itself)
+    is only included once.
+    """
+    return [
+        (level, species_a, species_b)
+        for level in levels
+        for index, species_a in enumerate(species_ids)
+        for species_b in species_ids[index:]
+    ]
+
+
+def simulate_matchup(
+    static_game_data: StaticGameData,
+    level: int,
+    species_a: int,
+    species_b: int,
+    battles: int,
+    seed: int,
+) -> MatchupResult:
+    """
+    Battles freshly created wild creatures of the two species against each
+    other, new individual values are rolled for every battle.
+    """
+    rng = RandomStream((seed, level, species_a, species_b))
+    wins = [0, 0]
+    turns = 0
+
+    for _ in range(battles):
+        creature_a = creature_creator.create_wild_creature(
+            static_game_data, static_game_data.species[species_a], level, rng
+        )
+        creature_b = creature_creator.create_wild_creature(
+            static_game_data, static_game_data.species[species_b], level, rng
+        )
+        outcome = simulate_battle(
+            static_game_data, creature_a, creature_b, seed=rng.getrandbits(64)
+        )
+
+        turns += outcome.turns
+        if outcome.winner is not None:
+            wins[outcome.winner] += 1
+
+    return MatchupResult(level, species_a, species_b, seed, battles, wins[0], wins[1], turns)
+
+
+def _init_worker(db_file: str, snapshot_file: str):
+    global _worker_static_game_data
+    _worker_static_game_data = snapshot.load_static_data(
+        db_file, snapshot_file, LocationAreaRectCollection(), rebuild=False
+    )
+
+
+def _simulate_chunk(
+    pairs: Sequence[tuple[int, int, int]], battles: int, seed: int
+) -> list[MatchupResult]:
+    return [
+        simulate_matchup(_worker_static_game_data, level, species_a, species_b, battles, seed)
+        for level, species_a, species_b in pairs
+    ]
+
+
+def read_results(result_file: str) -> dict[tuple[int, int, int], MatchupResult]:
+    """
+    Reads the results saved so far, keyed by (level, species a, species b).
+
+    A line which can't be parsed (e.g. the last line of a run which was
+    killed part way through writing it) is ignored. If a pair appears more
+    than once the last result wins.
+    """
+    results = {}
+    path = Path(result_file)
+    if not path.is_file():
+        return results
+
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = MatchupResult(**json.loads(line))
+            except (ValueError, TypeError):
+                continue
+
+            results[result.key] = result
+
+    return results
+
+
+def _report_progress(done: int, total: int, start: float, stream):
+    elapsed = time.perf_counter() - start
+    remaining = elapsed / done * (total - done) if done else 0
+    stream.write(
+        f"\r{done}/{total} pairs ({100 * done / max(total, 1):.1f}%)"
+        f" {elapsed:.0f}s elapsed, ~{remaining:.0f}s remaining"
+    )
+    stream.flush()
+
+
+def run_matchups(
+    db_file: str,
+    snapshot_file: str,
+    species_ids: Sequence[int],
+    levels: Sequence[int],
+    battles: int,
+    result_file: str,
+    seed: int = 0,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress=sys.stderr,
+) -> dict[tuple[int, int, int], MatchupResult]:
+    """
+    Simulates every matchup between the species at each level which isn't
+    already in the result file (with the same number of battles and seed)
+    and appends the new results to it.
+
+    Each worker process loads the static data itself, from the snapshot if
+    it is up to date, so build the snapshot before calling this.
+
+    :param db_file: The pokedex database.
+    :param snapshot_file: Snapshot of the static data in db_file.
+    :param species_ids: The species to battle against each other.
+    :param levels: The level(s) the creatures battle at.
+    :param battles: Number of battles to simulate per pair per level.
+    :param result_file: JSON lines file results are read from and appended
+    to.
+    :param seed: Base seed for every matchup.
+    :param workers: Number of worker processes, defaults to the CPU count.
+    :param chunk_size: Number of pairs handed to a worker at a time.
+    :param progress: Stream progress is written to, None for no progress.
+
+    :return: All results for the requested matchups, keyed by (level,
+    species a, species b) with species a before species b in species_ids.
+    """
+    results = read_results(result_file)
+    pairs = [
+        pair
+        for pair in matchup_pairs(species_ids, levels)
+        if pair not in results or (results[pair].battles, results[pair].seed) != (battles, seed)
+    ]
+    chunks = [pairs[i : i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+
+    if chunks:
+        path = Path(result_file)
+        needs_newline = False
+        if path.is_file() and path.stat().st_size > 0:
+            with path.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read() != b"\n"
+
+        start = time.perf_counter()
+        with (
+            ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(db_file, snapshot_file)
+            ) as pool,
+            path.open("a", encoding="utf-8") as f,
+        ):
+            if needs_newline:
+                f.write("\n")
+
+            futures = {
+                pool.submit(_simulate_chunk, chunk, battles, seed): len(chunk) for chunk in chunks
+            }
+            done = 0
+            for future in as_completed(futures):
+                for result in future.result():
+                    f.write(json.dumps(dataclasses.asdict(result)) + "\n")
+                    results[result.key] = result
+                f.flush()
+
+                done += futures[future]
+                if progress is not None:
+                    _report_progress(done, len(pairs), start, progress)
+
+        if progress is not None:
+            progress.write("\n")
+
+    return {pair: results[pair] for pair in matchup_pairs(species_ids, levels)}
+
+
+def win_rate_matrix(
+    results: dict[tuple[int, int, int], MatchupResult], species_ids: Sequence[int], level: int
+) -> np.ndarray:
+    """
+    The fraction of battles that each species won against each other
+    species at a level. Row i, column j is how often species_ids[i] beat
+    species_ids[j].
+    """
+    index = {species_id: i for i, species_id in enumerate(species_ids)}
+    matrix = np.full((len(species_ids), len(species_ids)), np.nan)
+
+    for (result_level, species_a, species_b), result in results.items():
+        if result_level != level or species_a not in index or species_b not in index:
+            continue
+
+        a, b = index[species_a], index[species_b]
+        if a == b:
+            # In a mirror match either side winning is the species winning.
+            matrix[a, a] = (result.wins_a + result.wins_b) / (2 * result.battles)
+        else:
+            matrix[a, b] = result.wins_a / result.battles
+            matrix[b, a] = result.wins_b / result.battles
+
+    return matrix
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--levels", type=int, nargs="+", default=[50])
+    parser.add_argument("--battles", type=int, default=100, help="Battles per pair per level")
+    parser.add_argument("--species", type=int, nargs="+", help="Species ids, defaults to all")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", default=RESULT_FILE, help="JSON lines result file")
+    parser.add_argument("--top", type=int, default=10, help="Species to list per level")
+    args = parser.parse_args()
+
+    # Also makes sure the snapshot is up to date for the workers.
+    static_game_data = snapshot.load_static_data(
+        settings.DB_FILE, settings.SNAPSHOT_FILE, LocationAreaRectCollection()
+    )
+    species_ids = sorted(args.species if args.species else static_game_data.species)
+
+    matchups = run_matchups(
+        settings.DB_FILE,
+        settings.SNAPSHOT_FILE,
+        species_ids,
+        args.levels,
+        args.battles,
+        args.output,
+        seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+
+    for matrix_level in args.levels:
+        mean_win_rates = np.nanmean(win_rate_matrix(matchups, species_ids, matrix_level), axis=1)
+        print(f"Level {matrix_level}, best average win rate:")
+        for i in np.argsort(-mean_win_rates)[: args.top]:
+            species = static_game_data.species[species_ids[i]]
+            print(f"  {species.name:<15} {mean_win_rates[i]:.3f}")
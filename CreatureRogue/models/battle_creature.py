@@ -4,6 +4,7 @@ from CreatureRogue.data_layer.data import HP_STAT, StaticGameData
 from CreatureRogue.data_layer.pokeball import Pokeball
 from CreatureRogue.data_layer.stat import Stat
 from CreatureRogue.models.creature import Creature
+from CreatureRogue.models.stat_values import StatValues, stat_array
 
 
 class BattleCreature:
@@ -13,8 +14,13 @@ class BattleCreature:
 
     The battle creature is an encapsulating object which is used to capture
     this information in an easily discardable manner.
+
+    Stat adjustments are held in an array indexed by stat id, stat_adjusts
+    gives a mapping view of them keyed by Stat.
     """
 
+    __slots__ = ("_stat_adjusts", "creature", "static_game_data")
+
     stat_adjust_factors = MappingProxyType(
         {
             -6: 1 / 4,
@@ -33,10 +39,17 @@ class BattleCreature:
         }
     )
 
+    # stat_adjust_factors indexed by adjustment + 6.
+    adjust_factors_by_stage = tuple(map(stat_adjust_factors.__getitem__, range(-6, 7)))
+
     def __init__(self, creature: Creature, static_game_data: StaticGameData):
         self.static_game_data = static_game_data
         self.creature = creature
-        self.stat_adjusts = dict.fromkeys(self.creature.stats, 0)
+        self._stat_adjusts = stat_array(typecode="b")
+
+    @property
+    def stat_adjusts(self) -> StatValues:
+        return StatValues(self._stat_adjusts, self.creature.species.base_stats)
 
     def adjust_stat_adjusts(self, stat: Stat, value: int) -> int:
         """
@@ -49,12 +62,11 @@ class BattleCreature:
         :param value: An integer amount to adjust the stat. Will be capped
         so safe to call with any value.
         """
-        old_val = self.stat_adjusts[stat]
-        self.stat_adjusts[stat] += value
-
-        self.stat_adjusts[stat] = max(-6, min(6, self.stat_adjusts[stat]))
+        stat_id = stat.stat_id
+        old_val = self._stat_adjusts[stat_id]
+        self._stat_adjusts[stat_id] = max(-6, min(6, old_val + value))
 
-        return self.stat_adjusts[stat] - old_val
+        return self._stat_adjusts[stat_id] - old_val
 
     def stat_value(self, stat: Stat) -> float:
         """
@@ -68,7 +80,21 @@ class BattleCreature:
         specifies which statistic we're interested in.
         """
         return (
-            self.creature.stats[stat] * BattleCreature.stat_adjust_factors[self.stat_adjusts[stat]]
+            self.creature.current_stat(stat)
+            * BattleCreature.adjust_factors_by_stage[self._stat_adjusts[stat.stat_id] + 6]
+        )
+
+    def adjusted_stat_value(self, stat: Stat, adjustment: int) -> float:
+        """
+        The value that stat would have if its adjustment factor was changed
+        by adjustment (capped in the same way as adjust_stat_adjusts). Used
+        to look ahead at the effect of a move without performing it.
+        """
+        stat_adjust = max(-6, min(6, self._stat_adjusts[stat.stat_id] + adjustment))
+
+        return (
+            self.creature.current_stat(stat)
+            * BattleCreature.adjust_factors_by_stage[stat_adjust + 6]
         )
 
     def modified_catch_rate(self, pokeball: Pokeball) -> float:
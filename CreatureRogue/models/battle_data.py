@@ -5,6 +5,7 @@ This information is the core data used when the main game state is
 It contains information on the participants.
 """
 
+import random
 from typing import Any
 
 from CreatureRogue.models.battle_creature import BattleCreature
@@ -20,12 +21,21 @@ class BattleData:
         computer_ai: Any,
         trainer_creature: BattleCreature | None = None,
         wild_creature: BattleCreature | None = None,
+        rng=random,
+        battle_log=None,
     ):
+        """
+        :param rng: Source of randomness for everything in the battle.
+        :param battle_log: The BattleLog recording the battle, if it is
+        being recorded.
+        """
         self.game_data = game_data
         self.player_creature = player_creature
         self.wild_creature = wild_creature
         self.trainer_creature = trainer_creature
         self.computer_ai = computer_ai
+        self.rng = rng
+        self.battle_log = battle_log
 
     def defending_creature(self) -> BattleCreature | None:
         """
@@ -40,4 +50,4 @@ class BattleData:
         """
         Selects a move based on whatever computer ai is in use.
         """
-        return self.computer_ai.select_move()
+        return self.computer_ai.select_move(self.player_creature)
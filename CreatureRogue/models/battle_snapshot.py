@@ -0,0 +1,277 @@
+"""
+A BattleSnapshot is a compact, immutable copy of everything about the two
+creatures in a battle which can change during it: hp, stat adjustment
+stages, pp, ailments and whether they have fainted. Being nested tuples
+snapshots are hashable and copying one is just building a tuple, so AI
+search and simulation can branch on moves without cloning the live
+BattleCreature objects.
+
+Everything which doesn't change during a battle (species, level, the
+non-hp stats and the moves themselves) is held once in a BattleRules
+for the pair of creatures, which also memoises the damage calculations.
+
+    rules = BattleRules(attacker, defender)
+    snapshot = BattleSnapshot.from_creatures(attacker, defender)
+    after = snapshot.apply_move(rules, 0, move_index, hit=True)
+"""
+
+from typing import NamedTuple
+
+import CreatureRogue.battle_calculations as battle_calculations
+from CreatureRogue.data_layer.data import HP_STAT, SPEED_STAT
+from CreatureRogue.models.battle_creature import BattleCreature
+
+
+class CreatureSnapshot(NamedTuple):
+    """
+    The changing state of one creature. Stat adjustments are indexed by
+    stat id, pp by move index and ailments are ailment ids.
+    """
+
+    hp: int
+    stat_adjusts: tuple[int, ...]
+    pp: tuple[int, ...]
+    ailments: tuple[int, ...]
+    fainted: bool
+
+    @classmethod
+    def from_battle_creature(cls, battle_creature: BattleCreature) -> "CreatureSnapshot":
+        creature = battle_creature.creature
+
+        return cls(
+            creature.current_stat(battle_creature.static_game_data.stats[HP_STAT]),
+            battle_creature.stat_adjusts.by_stat_id(),
+            tuple(move.pp for move in creature.moves),
+            tuple(ailment.ailment_id for ailment in creature.ailments),
+            creature.fainted,
+        )
+
+    def restore(self, battle_creature: BattleCreature):
+        """
+        Writes this state back to the live battle creature.
+        """
+        creature = battle_creature.creature
+        creature.stats[battle_creature.static_game_data.stats[HP_STAT]] = self.hp
+        battle_creature.stat_adjusts.set_by_stat_id(self.stat_adjusts)
+        for move, pp in zip(creature.moves, self.pp, strict=True):
+            move.pp = pp
+        creature.ailments = [
+            battle_creature.static_game_data.ailments[ailment_id] for ailment_id in self.ailments
+        ]
+        creature.fainted = self.fainted
+
+
+class _SideRules:
+    """
+    The parts of one creature which don't change during a battle. Move
+    targets are relative to the creature using the move: 0 for itself, 1
+    for its opponent and None for neither.
+    """
+
+    __slots__ = ("level", "max_hp", "move_data", "species", "stat_changes", "stats", "targets")
+
+    def __init__(self, battle_creature: BattleCreature, opponent: BattleCreature):
+        creature = battle_creature.creature
+        self.species = creature.species
+        self.level = creature.level
+        self.max_hp = max(1, creature.max_stat(battle_creature.static_game_data.stats[HP_STAT]))
+        self.stats = creature.stats.by_stat_id()
+        self.move_data = tuple(move.move_data for move in creature.moves)
+        self.targets = []  # type: list[int | None]
+        self.stat_changes = []  # type: list[tuple[tuple[int, int], ...]]
+        for move in creature.moves:
+            target = battle_calculations.move_target(move, battle_creature, opponent)
+            self.targets.append(None if target is None else int(target is opponent))
+            self.stat_changes.append(
+                tuple(
+                    (stat.stat_id, value)
+                    for stat, value in move.move_data.stat_changes.items()
+                    if value != 0
+                )
+            )
+
+
+class BattleRules:
+    """
+    The fixed parts of a battle between two creatures, used to work out
+    how moves change a BattleSnapshot of them. Creature a is side 0 and
+    creature b side 1.
+    """
+
+    def __init__(self, creature_a: BattleCreature, creature_b: BattleCreature):
+        self.type_chart = creature_a.static_game_data.type_chart
+        self.sides = (_SideRules(creature_a, creature_b), _SideRules(creature_b, creature_a))
+        self._damage = {}  # type: dict[tuple, tuple[int, int]]
+
+    def stat_value(self, snapshot: "BattleSnapshot", side: int, stat_id: int) -> float:
+        """
+        See BattleCreature.stat_value.
+        """
+        return (
+            self.sides[side].stats[stat_id]
+            * BattleCreature.adjust_factors_by_stage[snapshot[side].stat_adjusts[stat_id] + 6]
+        )
+
+    def hit_chance(self, snapshot: "BattleSnapshot", side: int, move_index: int) -> float:
+        move_data = self.sides[side].move_data[move_index]
+        if not move_data.base_accuracy:
+            return 0.0
+
+        return battle_calculations.hit_chance(
+            move_data.base_accuracy,
+            self.stat_value(snapshot, side, move_data.accuracy_stat.stat_id),
+            self.stat_value(snapshot, 1 - side, move_data.evasion_stat.stat_id),
+        )
+
+    def damage(
+        self, snapshot: "BattleSnapshot", side: int, move_index: int, critical: bool = False
+    ) -> int:
+        """
+        The damage done by the move if it hits, see damage_calculation.
+        """
+        attacker, defender = self.sides[side], self.sides[1 - side]
+        move_data = attacker.move_data[move_index]
+        if not move_data.damage_move():
+            return 0
+
+        key = (
+            side,
+            move_index,
+            self.stat_value(snapshot, side, move_data.attack_stat.stat_id),
+            self.stat_value(snapshot, 1 - side, move_data.defence_stat.stat_id),
+        )
+        damage = self._damage.get(key)
+        if damage is None:
+            distribution = battle_calculations.damage_distributions(
+                attacker.level,
+                key[2],
+                key[3],
+                move_data.base_attack,
+                move_data.type in attacker.species.types,
+                self.type_chart.combined_modifier(move_data.type, defender.species.types),
+            )
+            damage = (int(distribution.damage), int(distribution.critical_damage))
+            self._damage[key] = damage
+
+        return damage[critical]
+
+    def turn_orders(self, snapshot: "BattleSnapshot") -> tuple[tuple[int, float], ...]:
+        """
+        The side which moves first and the chance of that order, see
+        battle_calculations.turn_order.
+        """
+        speed_a = self.stat_value(snapshot, 0, SPEED_STAT)
+        speed_b = self.stat_value(snapshot, 1, SPEED_STAT)
+        if speed_a > speed_b:
+            return ((0, 1.0),)
+        if speed_a < speed_b:
+            return ((1, 1.0),)
+
+        return (0, 0.5), (1, 0.5)
+
+
+class BattleSnapshot(NamedTuple):
+    creature_a: CreatureSnapshot
+    creature_b: CreatureSnapshot
+
+    @classmethod
+    def from_creatures(
+        cls, creature_a: BattleCreature, creature_b: BattleCreature
+    ) -> "BattleSnapshot":
+        return cls(
+            CreatureSnapshot.from_battle_creature(creature_a),
+            CreatureSnapshot.from_battle_creature(creature_b),
+        )
+
+    @classmethod
+    def from_battle_data(cls, battle_data) -> "BattleSnapshot":
+        """
+        Snapshot of the player's creature (creature a) and the creature it
+        is fighting (creature b).
+        """
+        return cls.from_creatures(battle_data.player_creature, battle_data.defending_creature())
+
+    def restore(self, battle_data):
+        """
+        Writes the snapshot back to the live creatures of the battle it
+        was taken from.
+        """
+        self.creature_a.restore(battle_data.player_creature)
+        self.creature_b.restore(battle_data.defending_creature())
+
+    def options(self, side: int) -> tuple[int, ...]:
+        """
+        The indexes of the moves the side has pp left for.
+        """
+        return tuple(index for index, pp in enumerate(self[side].pp) if pp > 0)
+
+    def finished(self) -> bool:
+        return self.creature_a.fainted or self.creature_b.fainted
+
+    def apply_move(
+        self,
+        rules: BattleRules,
+        side: int,
+        move_index: int,
+        hit: bool = True,
+        critical: bool = False,
+    ) -> "BattleSnapshot":
+        """
+        The snapshot after the side uses the move, following perform_move
+        with the random parts (whether the move hits and whether it's a
+        critical hit) given.
+        """
+        attacker = self[side]
+        if attacker.pp[move_index] <= 0:
+            return self
+
+        pp = list(attacker.pp)
+        pp[move_index] -= 1
+        creatures = [self.creature_a, self.creature_b]
+        creatures[side] = attacker._replace(pp=tuple(pp))
+
+        side_rules = rules.sides[side]
+        target_side = side_rules.targets[move_index]
+        if hit and target_side is not None:
+            target = side if target_side == 0 else 1 - side
+            changes = {}
+            damage = rules.damage(self, side, move_index, critical)
+            if damage:
+                hp = max(0, creatures[target].hp - damage)
+                changes["hp"] = hp
+                changes["fainted"] = creatures[target].fainted or hp <= 0
+
+            if side_rules.stat_changes[move_index]:
+                stat_adjusts = list(creatures[target].stat_adjusts)
+                for stat_id, value in side_rules.stat_changes[move_index]:
+                    stat_adjusts[stat_id] = max(-6, min(6, stat_adjusts[stat_id] + value))
+                changes["stat_adjusts"] = tuple(stat_adjusts)
+
+            creatures[target] = creatures[target]._replace(**changes)
+
+        return BattleSnapshot(*creatures)
+
+    def move_outcomes(
+        self, rules: BattleRules, side: int, move_index: int
+    ) -> list[tuple["BattleSnapshot", float]]:
+        """
+        Every snapshot the side using the move can lead to, with its
+        chance.
+        """
+        hit = rules.hit_chance(self, side, move_index)
+        outcomes = []
+        if hit < 1:
+            outcomes.append((self.apply_move(rules, side, move_index, hit=False), 1 - hit))
+        if hit <= 0:
+            return outcomes
+
+        if rules.sides[side].move_data[move_index].damage_move():
+            critical_chance = battle_calculations.CRITICAL_HIT_PERCENT / 100
+            outcomes.append((self.apply_move(rules, side, move_index), hit * (1 - critical_chance)))
+            outcomes.append(
+                (self.apply_move(rules, side, move_index, critical=True), hit * critical_chance)
+            )
+        else:
+            outcomes.append((self.apply_move(rules, side, move_index), hit))
+
+        return outcomes
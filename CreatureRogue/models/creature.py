@@ -4,25 +4,57 @@ values for any creature.
 """
 
 import math
+from array import array
+from collections.abc import Mapping
 
+from CreatureRogue.data_layer.data import HP_STAT
 from CreatureRogue.data_layer.species import Species
 from CreatureRogue.data_layer.stat import Stat
 from CreatureRogue.models.move import Move
+from CreatureRogue.models.stat_values import StatValues, stat_array
 
 
 class Creature:
+    """
+    Individual values, effort values and current stats are held in arrays
+    indexed by stat id (see stat_values). The individual_values,
+    effort_values and stats properties give mapping views of them keyed by
+    Stat.
+
+    The max value of every stat at the creature's current level is worked
+    out once and cached until the level, individual values or effort
+    values change.
+    """
+
+    __slots__ = (
+        "_effort_values",
+        "_individual_values",
+        "_level",
+        "_max_stats",
+        "_stats",
+        "ailments",
+        "current_xp",
+        "fainted",
+        "moves",
+        "nickname",
+        "species",
+        "trainer",
+        "was_traded",
+    )
+
     def __init__(
         self,
         species: Species,
         level: int,
         nickname: str | None,
         trainer,
-        individual_values: dict[Stat, int],
-        effort_values: dict[Stat, int],
+        individual_values: Mapping[Stat, int],
+        effort_values: Mapping[Stat, int],
         was_traded: bool,
         moves: list[Move],
         current_xp: int,
     ):
+        self._max_stats = None  # type: array | None
         self.species = species
         self.level = level
         self.nickname = nickname if nickname is not None else species.name
@@ -31,28 +63,74 @@ class Creature:
         self.effort_values = effort_values
         self.was_traded = was_traded
         self.moves = moves
-        self.stats = {stat: self.max_stat(stat) for stat in species.base_stats}
+        self._stats = self._max_stat_array()[:]
         self.current_xp = current_xp
         self.fainted = False
         self.ailments = []
 
+    def _clear_max_stats(self):
+        self._max_stats = None
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @level.setter
+    def level(self, level: int):
+        self._level = level
+        self._max_stats = None
+
+    @property
+    def individual_values(self) -> StatValues:
+        return StatValues(self._individual_values, self.species.base_stats, self._clear_max_stats)
+
+    @individual_values.setter
+    def individual_values(self, individual_values: Mapping[Stat, int]):
+        self._individual_values = stat_array(individual_values)
+        self._max_stats = None
+
+    @property
+    def effort_values(self) -> StatValues:
+        return StatValues(self._effort_values, self.species.base_stats, self._clear_max_stats)
+
+    @effort_values.setter
+    def effort_values(self, effort_values: Mapping[Stat, int]):
+        self._effort_values = stat_array(effort_values)
+        self._max_stats = None
+
+    @property
+    def stats(self) -> StatValues:
+        """
+        The current value of each stat.
+        """
+        return StatValues(self._stats, self.species.base_stats)
+
+    @stats.setter
+    def stats(self, stats: Mapping[Stat, int]):
+        self._stats = stat_array(stats)
+
     def adjust_stat(self, stat: Stat, delta: int):
         """
         Adjust a stat by the given delta. Also caps at the min/max values
         for that stat.
         """
-        self.stats[stat] -= delta
+        stat_id = stat.stat_id
+        value = self._stats[stat_id] - delta
 
-        if self.stats[stat] < 0:
-            self.stats[stat] = 0
-        elif self.stats[stat] > self.max_stat(stat):
-            self.stats[stat] = self.max_stat(stat)
+        if value < 0:
+            value = 0
+        else:
+            max_value = self._max_stat_array()[stat_id]
+            if value > max_value:
+                value = max_value
+
+        self._stats[stat_id] = value
 
     def current_stat(self, stat: Stat) -> int:
         """
         Get the current value of the given stat.
         """
-        return self.stats[stat]
+        return self._stats[stat.stat_id]
 
     def max_stat(self, stat: Stat, level: int | None = None):
         """
@@ -62,24 +140,32 @@ class Creature:
         Can optionally pass in a level to calculate what the stats were at
         a particular level.
         """
-        if level is None:
-            level = self.level
-
-        if stat.name.upper() == "HP":
-            value = (
-                self.individual_values[stat]
-                + self.species.base_stats[stat]
-                + math.sqrt(self.effort_values[stat]) / 8
-                + 50
-            ) * level / 50 + 10
-        else:
-            value = (
-                self.individual_values[stat]
-                + self.species.base_stats[stat]
-                + math.sqrt(self.effort_values[stat]) / 8
-            ) * level / 50 + 5
+        if level is None or level == self._level:
+            return self._max_stat_array()[stat.stat_id]
+
+        return self._calculate_max_stat(stat, level)
+
+    def _max_stat_array(self) -> array:
+        if self._max_stats is None:
+            max_stats = stat_array()
+            for stat in self.species.base_stats:
+                max_stats[stat.stat_id] = self._calculate_max_stat(stat, self._level)
+            self._max_stats = max_stats
+
+        return self._max_stats
+
+    def _calculate_max_stat(self, stat: Stat, level: int) -> int:
+        stat_id = stat.stat_id
+        base = (
+            self._individual_values[stat_id]
+            + self.species.base_stats[stat]
+            + math.sqrt(self._effort_values[stat_id]) / 8
+        )
+
+        if stat_id == HP_STAT:
+            return int((base + 50) * level / 50 + 10)
 
-        return int(value)
+        return int(base * level / 50 + 5)
 
     def xp_given(self, number_winners, winner_traded, winner_modifier=1):
         """
@@ -6,6 +6,8 @@ class Move:
     A move is a single action that a creature can take during a battle.
     """
 
+    __slots__ = ("move_data", "pp")
+
     def __init__(self, move_data: MoveData):
         self.move_data = move_data
         self.pp = self.move_data.max_pp
@@ -25,13 +25,12 @@ class Player:
     ):
         self.name = name
         self.creatures = []
+        # Maps pokedex number to (status, species id), species are looked
+        # up when they're shown so that lazily loaded species stay unloaded.
         self.pokedex = {
-            static_game_data.species[species_id].pokedex_number: (
-                0,
-                static_game_data.species[species_id],
-            )
-            for species_id in static_game_data.species
-        }
+            pokedex_number: (0, species_id)
+            for species_id, pokedex_number in static_game_data.pokedex_numbers.items()
+        }  # type: dict[int, tuple[int, int]]
         self.map_data = map_data
         self.coords = (x, y)
         self.steps_in_long_grass_since_encounter = 0
@@ -59,19 +58,23 @@ class Player:
     def get_location_area(self) -> LocationArea | None:
         """
         The location area of a player is determined by the x, y coordinates
-        and the static game data.
+        and the static game data (or the location areas baked into the map
+        if there are any).
         """
         x, y = self.coords
-        location_area_id = self.static_game_data.location_area_rects.get_location_area_by_position(
-            x, y
-        )
+        if self.map_data is not None and self.map_data.location_area_ids is not None:
+            location_area_id = self.map_data.location_area_at(x, y)
+        else:
+            location_area_id = (
+                self.static_game_data.location_area_rects.get_location_area_by_position(x, y)
+            )
 
         if location_area_id is not None:
             return self.static_game_data.location_areas[location_area_id]
 
         return None
 
-    def _can_traverse(self, cell: MapDataTile) -> bool:
+    def _can_traverse(self, x: int, y: int) -> bool:
         """
         Depending on the current player state they may or may not be able
         to traverse any given cell. This check is made every time the
@@ -81,9 +84,9 @@ class Player:
         false otherwise.
         """
         # TODO - Only really check that the cell is always traversable at the moment
-        return cell.tile_type.traversable
+        return self.map_data.is_traversable(x, y)
 
-    def _causes_encounter(self) -> bool:
+    def _causes_encounter(self, rng=random) -> bool:
         """
         Calculation used to determine whether a player causes an encounter
         with movement.
@@ -91,6 +94,8 @@ class Player:
         It is called each time the player steps on a square that could
         cause an encounter and returns true if an encounter should be
         generated and false otherwise.
+
+        :param rng: Source of randomness, defaults to the random module.
         """
         location_area = self.get_location_area()
         if location_area is None:
@@ -100,19 +105,22 @@ class Player:
 
         if (
             8 - encounter_rate // 10 < self.steps_in_long_grass_since_encounter
-            and random.random() < 0.95
+            and rng.random() < 0.95
         ):
             return False
 
-        return random.randint(0, 99) < encounter_rate and random.randint(0, 99) < 40
+        return rng.randint(0, 99) < encounter_rate and rng.randint(0, 99) < 40
 
-    def move_to_cell(self, x: int, y: int) -> tuple[bool, bool]:
+    def move_to_cell(self, x: int, y: int, rng=random) -> tuple[bool, bool]:
         """
         Move to the cell specified by x,y in the current map.
 
         Returns (whether moved, whether caused a wild encounter)
+
+        :param rng: Source of randomness for encounters, defaults to the
+        random module.
         """
-        if self._can_traverse(self.map_data.tiles[y][x]):
+        if self._can_traverse(x, y):
             self.coords = (x, y)
             causes_encounter = False
 
@@ -120,7 +128,7 @@ class Player:
             # if self.get_cell().base_cell == map_renderer.LONG_GRASS:
             #     self.steps_in_long_grass_since_encounter += 1
 
-            #     causes_encounter = self._causes_encounter()
+            #     causes_encounter = self._causes_encounter(rng)
             # else:
             #     self.steps_in_long_grass_since_encounter = 0
 
@@ -139,7 +147,7 @@ class Player:
 
         Is responsible for updating the pokedex.
         """
-        self.pokedex[creature.species.pokedex_number] = (1, creature.species)
+        self.pokedex[creature.species.pokedex_number] = (1, creature.species.species_id)
 
     def catch_creature(self, creature: Creature):
         """
@@ -147,4 +155,4 @@ class Player:
 
         Is responsible for updating the pokedex.
         """
-        self.pokedex[creature.species.pokedex_number] = (2, creature.species)
+        self.pokedex[creature.species.pokedex_number] = (2, creature.species.species_id)
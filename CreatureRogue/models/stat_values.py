@@ -0,0 +1,107 @@
+"""
+Per stat values (individual values, current stats etc.) are held in
+fixed length arrays indexed by stat id rather than dicts keyed by Stat.
+
+StatValues wraps one of those arrays so that it can still be used like
+the dict it replaced.
+"""
+
+from array import array
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+
+from CreatureRogue.data_layer.data import EVASION_STAT
+from CreatureRogue.data_layer.stat import Stat
+
+# Stat ids run from HP_STAT (1) to EVASION_STAT, index 0 is unused.
+STAT_ARRAY_LENGTH = EVASION_STAT + 1
+
+
+def stat_array(values: Mapping[Stat, int] | None = None, typecode: str = "i") -> array:
+    """
+    Creates a zeroed stat array, filled in from values if passed.
+    """
+    stat_values = array(typecode, [0]) * STAT_ARRAY_LENGTH
+    if values is not None:
+        for stat, value in values.items():
+            stat_values[stat.stat_id] = value
+
+    return stat_values
+
+
+class StatValues(MutableMapping[Stat, int]):
+    """
+    A view of a stat array as a mapping from Stat to value. Writes go
+    through to the array.
+    """
+
+    __slots__ = ("_on_change", "_stats", "_values")
+
+    def __init__(
+        self,
+        values: array,
+        stats: Mapping[Stat, int],
+        on_change: Callable[[], None] | None = None,
+    ):
+        """
+        :param values: The stat array.
+        :param stats: The stats which have values (e.g. a species' base
+        stats), only the keys are used.
+        :param on_change: Called whenever a value is set.
+        """
+        self._values = values
+        self._stats = stats
+        self._on_change = on_change
+
+    def _in_range(self, stat: object) -> bool:
+        """
+        Whether the stat has a slot in the array, index 0 is padding and
+        negative ids would index from the end.
+        """
+        stat_id = getattr(stat, "stat_id", None)
+        return stat_id is not None and 0 < stat_id < len(self._values)
+
+    def __getitem__(self, stat: Stat) -> int:
+        if stat not in self:
+            raise KeyError(stat)
+
+        return self._values[stat.stat_id]
+
+    def __contains__(self, stat: object) -> bool:
+        return self._in_range(stat) and stat in self._stats
+
+    def __setitem__(self, stat: Stat, value: int):
+        if not self._in_range(stat):
+            raise KeyError(stat)
+
+        self._values[stat.stat_id] = value
+
+        if self._on_change is not None:
+            self._on_change()
+
+    def __delitem__(self, stat: Stat):
+        raise TypeError("Stats can't be removed from a creature")
+
+    def __iter__(self) -> Iterator[Stat]:
+        return (stat for stat in self._stats if self._in_range(stat))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def by_stat_id(self) -> tuple[int, ...]:
+        """
+        A copy of the underlying values indexed by stat id, index 0 is
+        unused.
+        """
+        return tuple(self._values)
+
+    def set_by_stat_id(self, values: tuple[int, ...]):
+        """
+        Overwrites every value from a tuple returned by by_stat_id.
+        """
+        if len(values) != len(self._values):
+            raise ValueError(f"Expected {len(self._values)} values, got {len(values)}")
+
+        self._values[:] = array(self._values.typecode, values)
+
+        if self._on_change is not None:
+            self._on_change()
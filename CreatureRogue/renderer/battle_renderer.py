@@ -7,9 +7,11 @@ from types import MappingProxyType
 import tcod
 from tcod import libtcodpy
 
+import CreatureRogue.battle_probabilities as battle_probabilities
 import CreatureRogue.data_layer.data as data
 import CreatureRogue.settings as settings
 from CreatureRogue.data_layer.pokeball import Pokeball
+from CreatureRogue.models.battle_creature import BattleCreature
 from CreatureRogue.models.battle_data import BattleData
 from CreatureRogue.models.creature import Creature
 
@@ -245,11 +247,17 @@ class BattleRenderer:
         self.console = tcod.console.Console(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
 
     def render(
-        self, battle_data: BattleData, messages: list[str], selecting_pokeball: bool
+        self,
+        battle_data: BattleData,
+        messages: list[str],
+        selecting_pokeball: bool,
+        thinking: bool = False,
     ) -> tcod.console.Console:
         """
         The external interface to this class. Call this to render the
         given battle data object.
+
+        :param thinking: Whether the computer is still selecting its move.
         """
         self.console.clear(fg=settings.FOREGROUND_COLOR, bg=settings.BACKGROUND_COLOR)
         self._render_lines()
@@ -270,6 +278,7 @@ class BattleRenderer:
         if selecting_pokeball:
             self._render_pokeball_select(
                 self.game.game_data.player.available_pokeballs(),
+                battle_data.defending_creature(),
                 x=BattleRenderer.left_padding,
                 y=BattleRenderer.top_section_height + 2,
             )
@@ -292,6 +301,12 @@ class BattleRenderer:
                     x=BattleRenderer.option_area_width,
                     y=BattleRenderer.top_section_height + 4,
                 )
+            elif thinking:
+                self._render_message(
+                    message=f"{battle_data.defending_creature().creature.in_battle_name()} is thinking...",
+                    x=BattleRenderer.option_area_width,
+                    y=BattleRenderer.top_section_height + 4,
+                )
 
         return self.console
 
@@ -421,16 +436,23 @@ class BattleRenderer:
         """
         self.console.print(x + 1, y + 1, message)
 
-    def _render_pokeball_select(self, pokeballs: dict[Pokeball, int], x: int, y: int):
+    def _render_pokeball_select(
+        self, pokeballs: dict[Pokeball, int], creature: BattleCreature, x: int, y: int
+    ):
         """
         Render the list of available pokeball types along with the key
-        press required to select them.
+        press required to select them and the chance of each one catching
+        the creature.
         """
+        chances = battle_probabilities.catch_chances(creature, pokeballs)
         for row, pokeball in enumerate(pokeballs.keys()):
             self.console.print(
                 x,
                 y + row + 1,
-                "{}. {:20s}{}".format(
-                    pokeball.display_char, pokeball.name + " Ball", pokeballs[pokeball]
+                "{}. {:20s}{:3d} {:>5.0%}".format(
+                    pokeball.display_char,
+                    pokeball.name + " Ball",
+                    pokeballs[pokeball],
+                    chances[pokeball],
                 ),
             )
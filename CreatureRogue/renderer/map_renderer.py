@@ -2,6 +2,7 @@
 Responsible for rendering a map of tiles onto the screen in ascii.
 """
 
+import numpy as np
 import tcod
 
 import CreatureRogue.settings as settings
@@ -10,9 +11,20 @@ from CreatureRogue.models.player import Player
 
 
 class MapRenderer:
+    """
+    The glyph and colour of every tile on the current map are worked out
+    once and held in arrays padded by a screen's width/height of blank
+    cells on each side. Rendering a frame is then just copying the
+    visible window out of those arrays into the console, whatever the
+    viewport size and however close the player is to the map edge.
+    """
+
     def __init__(self):
         self.console = tcod.console.Console(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
         self.start_x = self.start_y = 0
+        self._map_data = None  # type: MapData | None
+        self._glyphs = None  # type: np.ndarray | None
+        self._fg = None  # type: np.ndarray | None
 
     def render(self, player: Player | None) -> tcod.console.Console:
         self.console.clear(fg=settings.FOREGROUND_COLOR, bg=settings.BACKGROUND_COLOR)
@@ -33,16 +45,36 @@ class MapRenderer:
 
         self.console.print(x - self.start_x, y - self.start_y, "@", fg=settings.PLAYER_COLOR)
 
+    def _cache_map(self, map_data: MapData):
+        """
+        Builds the padded glyph and foreground arrays for a map. Padding
+        cells look exactly like a cleared console.
+        """
+        pad = ((settings.SCREEN_HEIGHT,) * 2, (settings.SCREEN_WIDTH,) * 2)
+
+        self._glyphs = np.pad(
+            map_data.glyphs[map_data.tile_type_indices], pad, constant_values=ord(" ")
+        )
+        self._fg = np.empty((*self._glyphs.shape, 3), dtype=np.uint8)
+        self._fg[...] = settings.FOREGROUND_COLOR
+        self._fg[
+            settings.SCREEN_HEIGHT : -settings.SCREEN_HEIGHT,
+            settings.SCREEN_WIDTH : -settings.SCREEN_WIDTH,
+        ] = map_data.colors[map_data.tile_type_indices]
+        self._map_data = map_data
+
     def _render_map(self, map_data: MapData):
-        for y in range(self.start_y, self.start_y + settings.SCREEN_HEIGHT):
-            for x in range(self.start_x, self.start_x + settings.SCREEN_WIDTH):
-                if len(map_data.tiles) > y >= 0 and len(map_data.tiles[y]) > x >= 0:
-                    cell = map_data.tiles[y][x]
-
-                    self.console.default_fg = cell.color
-                    self.console.print(
-                        x - self.start_x,
-                        y - self.start_y,
-                        cell.display_character,
-                        fg=cell.color,
-                    )
+        if map_data is not self._map_data:
+            self._cache_map(map_data)
+
+        # The view is always centred on a tile on the map so it never
+        # reaches further off the map than the padding.
+        y = self.start_y + settings.SCREEN_HEIGHT
+        x = self.start_x + settings.SCREEN_WIDTH
+        window = (
+            slice(y, y + settings.SCREEN_HEIGHT),
+            slice(x, x + settings.SCREEN_WIDTH),
+        )
+
+        self.console.ch[...] = self._glyphs[window]
+        self.console.fg[...] = self._fg[window]
@@ -37,10 +37,10 @@ class PokedexRenderer:
         self._render_species(pokedex, left_most_column)
 
         if viewing_species:
-            status, species = pokedex[viewing_species]
+            status, species_id = pokedex[viewing_species]
 
             if status > 0:
-                self._render_details_box(species, status)
+                self._render_details_box(self.game.static_game_data.species[species_id], status)
 
         return self.console
 
@@ -91,15 +91,15 @@ class PokedexRenderer:
         displayed differently.
         """
         for pokedex_number in pokedex:
-            status, species = pokedex[pokedex_number]
+            status, species_id = pokedex[pokedex_number]
 
             name = "???"
             color = settings.POKEDEX_UNKNOWN_COLOR
             if status == 1:
-                name = species.name
+                name = self.game.static_game_data.species[species_id].name
                 color = settings.POKEDEX_SEEN_COLOR
             elif status == 2:
-                name = species.name
+                name = self.game.static_game_data.species[species_id].name
                 color = settings.POKEDEX_KNOWN_COLOR
 
             column, row = self.calculate_position_of_pokedex_number(
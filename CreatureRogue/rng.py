@@ -0,0 +1,109 @@
+"""
+All of the game's randomness (encounters, creature creation and battles)
+comes from a RandomStream passed down from whatever owns the game or
+simulation rather than the global random module. Seeding the stream
+makes a run reproducible and parallel workers can each be given their
+own stream (see spawn) instead of sharing one generator.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 4096
+
+
+class RandomStream:
+    """
+    A seedable random number generator with the parts of the
+    random.Random interface the game uses (random, randint, randrange,
+    uniform, choice and getrandbits) so it can be passed anywhere an rng
+    is taken.
+
+    Numbers come from a NumPy generator which is drawn from a block at a
+    time, handing them out one by one is then little more than a list
+    lookup. The block size doesn't change which numbers are produced.
+
+    The generator itself is available for bulk draws (e.g.
+    LocationArea.sample_encounters), those are taken from the stream
+    following the current block.
+    """
+
+    def __init__(
+        self,
+        seed: int | Sequence[int] | np.random.SeedSequence | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        """
+        :param seed: An int, a sequence of ints (e.g. a run seed and a job
+        number) or a SeedSequence. None for a fresh seed from the OS.
+        :param block_size: How many numbers to generate at a time.
+        """
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.generator = np.random.default_rng(self.seed_sequence)
+        self.block_size = block_size
+        self._next = iter(()).__next__
+
+    def _refill(self):
+        self._next = iter(self.generator.random(self.block_size).tolist()).__next__
+
+    def random(self) -> float:
+        """
+        A float in the range [0, 1).
+        """
+        try:
+            return self._next()
+        except StopIteration:
+            self._refill()
+            return self._next()
+
+    def randint(self, a: int, b: int) -> int:
+        """
+        An int in the range [a, b], including both end points.
+        """
+        if b < a:
+            raise ValueError(f"Empty range for randint({a}, {b})")
+
+        return a + int(self.random() * (b - a + 1))
+
+    def randrange(self, start: int, stop: int | None = None) -> int:
+        """
+        An int in the range [start, stop) or [0, start) if stop isn't
+        passed.
+        """
+        if stop is None:
+            start, stop = 0, start
+
+        return self.randint(start, stop - 1)
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def choice(self, seq: Sequence):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+
+        return seq[int(self.random() * len(seq))]
+
+    def getrandbits(self, k: int) -> int:
+        """
+        An int with k random bits, e.g. for seeding another generator.
+        Built up 32 bits at a time from random() so it stays part of the
+        same stream.
+        """
+        bits = 0
+        for _ in range((k + 31) // 32):
+            bits = (bits << 32) | int(self.random() * (1 << 32))
+
+        return bits >> (-k % 32)
+
+    def spawn(self, n: int) -> list["RandomStream"]:
+        """
+        Independent child streams, for example one per worker or per
+        simulated battle. They are deterministic given this stream's seed
+        but don't overlap with it or with each other.
+        """
+        return [RandomStream(child, self.block_size) for child in self.seed_sequence.spawn(n)]
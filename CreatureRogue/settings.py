@@ -10,7 +10,13 @@ TITLE = "Creature Rogue"
 FONT = "terminal16x16_gs_ro.png"
 
 DB_FILE = "pokedex.db3"
+SNAPSHOT_FILE = "pokedex.snapshot"
+LAZY_STATIC_DATA = False  # Load species, moves and location areas on first access
+LAZY_CACHE_SIZE = 256  # Max cached entries per lazily loaded table
 LOCATION_AREA_RECTS_FILE = "location_area_rects.txt"
+RANDOM_SEED = None  # Seed for encounters and battles, None for a different game every time
+RECORD_BATTLES = False  # Write a replayable log of every battle to BATTLE_LOG_DIR
+BATTLE_LOG_DIR = "battle_logs"
 
 # Colors
 BACKGROUND_COLOR = (0, 0, 0)
@@ -5,13 +5,17 @@ in a battle.
 It is responsible for rendering and input processing.
 """
 
+from __future__ import annotations
+
 import collections
-import random
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from CreatureRogue.game import Game
     from CreatureRogue.models.game_data import GameData
+    from CreatureRogue.models.move import Move
     from CreatureRogue.renderer.battle_renderer import (
         BattleRenderer,
         CatchGraphicRenderer,
@@ -22,7 +26,6 @@ import tcod
 from tcod import libtcodpy
 
 import CreatureRogue.battle_calculations as battle_calculations
-import CreatureRogue.data_layer.data as data
 
 
 class BattleState:
@@ -32,16 +35,16 @@ class BattleState:
     Handles input and rendering.
     """
 
-    number_catch_checks = 4
+    number_catch_checks = battle_calculations.NUMBER_CATCH_CHECKS
     ms_per_percent_complete = 50
 
     def __init__(
         self,
-        game: "Game",
-        game_data: "GameData",
-        renderer: "BattleRenderer",
-        level_up_renderer: "LevelUpRenderer",
-        catch_graphic_renderer: "CatchGraphicRenderer",
+        game: Game,
+        game_data: GameData,
+        renderer: BattleRenderer,
+        level_up_renderer: LevelUpRenderer,
+        catch_graphic_renderer: CatchGraphicRenderer,
     ):
         self.renderer = renderer
         self.level_up_renderer = level_up_renderer
@@ -55,6 +58,8 @@ class BattleState:
         self.catching_with_pokeball = None
         self.percent_of_creature_caught = 0
         self.time_started_catching_ms = 0
+        self.displayed_catch_percent = None
+        self.pending_turn: tuple[Move, Future[Move | None]] | None = None
 
     def _percent_of_catch_to_display(self):
         """
@@ -70,13 +75,35 @@ class BattleState:
             self.percent_of_creature_caught,
         )
 
+    def thinking(self) -> bool:
+        """
+        Whether the computer is still selecting its move for this turn.
+        """
+        return self.pending_turn is not None
+
+    def needs_redraw(self) -> bool:
+        """
+        The catch graphic animates so whilst catching the screen needs
+        redrawing every frame until the final percentage has been shown.
+
+        Whilst the computer is selecting its move the frame is redrawn
+        every frame so that render can pick up the move as soon as it's
+        ready.
+        """
+        return self.thinking() or (
+            self.catching_with_pokeball is not None
+            and self.displayed_catch_percent != self.percent_of_creature_caught
+        )
+
     def render(self):
         """
         Render the current state of the battle. Called as many times as
         required by the game loop.
         """
+        self._poll_computer_move()
+
         console = self.renderer.render(
-            self.game_data.battle_data, self.messages, self.selecting_pokeball
+            self.game_data.battle_data, self.messages, self.selecting_pokeball, self.thinking()
         )
 
         if len(self.messages) == 0 and self.display_level_up is not None:
@@ -90,6 +117,7 @@ class BattleState:
         # extra step which renders the catch graphics on top of the screen.
         if self.catching_with_pokeball:
             percent_to_display = self._percent_of_catch_to_display()
+            self.displayed_catch_percent = percent_to_display
             message = None
             if percent_to_display == self.percent_of_creature_caught:
                 message = battle_calculations.get_catch_message(
@@ -128,6 +156,9 @@ class BattleState:
         elif self.display_level_up:
             if event.sym == tcod.event.KeySym.SPACE or event.sym == tcod.event.KeySym.RETURN:
                 self.display_level_up = None
+        elif self.thinking():
+            # Nothing can be selected until the turn has been performed.
+            pass
         elif self.selecting_pokeball:
             self._selecting_pokeball_input(event)
         elif self.catching_with_pokeball:
@@ -175,10 +206,15 @@ class BattleState:
                     self.selecting_pokeball = False
                     self.catching_with_pokeball = pokeball
                     self.time_started_catching_ms = libtcodpy.sys_elapsed_milli()
+                    self.displayed_catch_percent = None
+                    battle_data = self.game_data.battle_data
+                    if battle_data.battle_log is not None:
+                        battle_data.battle_log.record_catch(pokeball.pokeball_id)
                     num_checks_passed = battle_calculations.num_catch_checks_passed(
-                        self.game_data.battle_data.defending_creature(),
+                        battle_data.defending_creature(),
                         pokeball,
                         BattleState.number_catch_checks,
+                        battle_data.rng,
                     )
 
                     self.percent_of_creature_caught = (
@@ -187,91 +223,58 @@ class BattleState:
                     self.game_data.player.use_pokeball(pokeball)
                     break
 
-    def _handle_move_select(self, move):
+    def _handle_move_select(self, move: Move):
         """
         Given that the player has selected a move to perform this function
-        is called to allow the computer to select a move and then actually
-        perform the moves in the correct order.
-
-        It may exit early if a creature faints.
+        starts the computer selecting its move on the game's AI executor so
+        that a slow AI doesn't hold up the game loop. The turn is performed
+        by render once the computer's move is ready.
         """
         battle_data = self.game_data.battle_data
-        computer_move = battle_data.computer_move()
-        speed_stat = self.game.static_game_data.stats[data.SPEED_STAT]
-
-        if battle_data.player_creature.stat_value(
-            speed_stat
-        ) > battle_data.defending_creature().stat_value(speed_stat):
-            first_move = (
-                move,
-                battle_data.player_creature,
-                battle_data.defending_creature(),
+        if battle_data.battle_log is not None:
+            battle_data.battle_log.record_move(
+                battle_data.player_creature.creature.moves.index(move)
             )
-            second_move = (
-                computer_move,
-                battle_data.defending_creature(),
-                battle_data.player_creature,
-            )
-        elif battle_data.player_creature.stat_value(
-            speed_stat
-        ) < battle_data.defending_creature().stat_value(speed_stat):
-            first_move = (
-                computer_move,
-                battle_data.defending_creature(),
-                battle_data.player_creature,
-            )
-            second_move = (
-                move,
-                battle_data.player_creature,
-                battle_data.defending_creature(),
-            )
-        else:
-            if random.randint(0, 1) == 0:
-                first_move = (
-                    move,
-                    battle_data.player_creature,
-                    battle_data.defending_creature(),
-                )
-                second_move = (
-                    computer_move,
-                    battle_data.defending_creature(),
-                    battle_data.player_creature,
-                )
-            else:
-                first_move = (
-                    computer_move,
-                    battle_data.defending_creature(),
-                    battle_data.player_creature,
-                )
-                second_move = (
-                    move,
-                    battle_data.player_creature,
-                    battle_data.defending_creature(),
-                )
 
-        for move, aggressor, defender in [first_move, second_move]:
-            # The move can actually be None if there were no valid
-            # moves to select from.
-            if move:
-                messages = battle_calculations.perform_move(
-                    move, aggressor, defender, self.game.static_game_data
-                )
+        self.pending_turn = (move, self.game.ai_executor.submit(battle_data.computer_move))
 
-                for message in messages:
-                    self.messages.append(message)
+    def _poll_computer_move(self):
+        """
+        Performs the pending turn if the computer has finished selecting
+        its move. Any exception raised by the AI is raised here.
+        """
+        if self.pending_turn is None or not self.pending_turn[1].done():
+            return
 
-                # Check the state of the creatures, we don't end the battle
-                # immediately because we still want to process any
-                # remaining messages.
-                #
-                # We do need to break out though so that the fainted
-                # creature can't have it's turn.
-                if defender.creature.fainted:
-                    self._creature_fainted(aggressor, defender)
+        move, future = self.pending_turn
+        self.pending_turn = None
+        self._perform_turn(move, future.result())
 
-                if aggressor.creature.fainted or defender.creature.fainted:
-                    self.end_battle = True
-                    break
+    def _perform_turn(self, move: Move, computer_move: Move | None):
+        """
+        Actually perform the moves in the correct order.
+
+        It may exit early if a creature faints.
+        """
+        battle_data = self.game_data.battle_data
+        messages, fainted = battle_calculations.perform_turn(
+            move,
+            battle_data.player_creature,
+            computer_move,
+            battle_data.defending_creature(),
+            self.game.static_game_data,
+            battle_data.rng,
+        )
+        self.messages.extend(messages)
+
+        # We don't end the battle immediately when a creature faints
+        # because we still want to process any remaining messages.
+        if fainted is not None:
+            aggressor, defender = fainted
+            if defender.creature.fainted:
+                self._creature_fainted(aggressor, defender)
+
+            self.end_battle = True
 
     def _creature_fainted(self, aggressor, defender):
         """
@@ -302,3 +305,4 @@ class BattleState:
             self.catching_with_pokeball = None
             self.percent_of_creature_caught = 0
             self.time_started_catching_ms = 0
+            self.displayed_catch_percent = None
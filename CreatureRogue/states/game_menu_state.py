@@ -51,6 +51,12 @@ class InGameMenuState:
         elif event.sym == ord("p"):
             self.game.load_pokedex()
 
+    def needs_redraw(self) -> bool:
+        """
+        The menu only changes on input.
+        """
+        return False
+
     def render(self):
         """
         Combine the map view and the menu view by blitting one onto the
@@ -49,13 +49,21 @@ class MapState:
             )
 
             try:
-                _, caused_wild_encounter = self.game_data.player.move_to_cell(new_x, new_y)
+                _, caused_wild_encounter = self.game_data.player.move_to_cell(
+                    new_x, new_y, self.game.rng
+                )
 
                 if caused_wild_encounter:
                     self.game.start_wild_battle()
             except KeyError:
                 pass
 
+    def needs_redraw(self) -> bool:
+        """
+        Nothing on the map animates so it only changes on input.
+        """
+        return False
+
     def render(self) -> tcod.console.Console:
         """
         Handles rendering whilst in this state
@@ -105,6 +105,12 @@ class PokedexState:
             elif event.sym == tcod.event.KeySym.ESCAPE:
                 self.game.close_pokedex()
 
+    def needs_redraw(self) -> bool:
+        """
+        The pokedex only changes on input.
+        """
+        return False
+
     def render(self) -> tcod.console.Console:
         """
         Passes control off to the pokedex renderer to display the current
@@ -0,0 +1,90 @@
+"""
+Measures how long each battle AI takes to choose a move, compared with the
+time available for a frame at settings.FPS_LIMIT. Decisions are timed
+across whole simulated battles so later turns benefit from the per battle
+expected damage cache just as they would in game:
+
+    python -m benchmarks.ai_latency [species a] [species b] [level] [battles]
+"""
+
+import argparse
+import statistics
+import time
+
+import CreatureRogue.creature_creator as creature_creator
+import CreatureRogue.data_layer.snapshot as snapshot
+import CreatureRogue.settings as settings
+from CreatureRogue.battle_ai import GreedyMoveAi, LookaheadAi, RandomMoveAi
+from CreatureRogue.battle_search import ExpectiminimaxAi
+from CreatureRogue.battle_simulator import simulate_battle
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+from CreatureRogue.rng import RandomStream
+
+
+class TimedAi:
+    """
+    Wraps an AI, recording how long each select_move call takes.
+    """
+
+    def __init__(self, ai, times: list[float]):
+        self.ai = ai
+        self.times = times
+
+    def select_move(self, opponent=None):
+        start = time.perf_counter()
+        move = self.ai.select_move(opponent)
+        self.times.append(time.perf_counter() - start)
+
+        return move
+
+
+def decision_times(static_game_data, ai_class, creature_a, creature_b, battles: int) -> list[float]:
+    """
+    The time taken by every decision creature a's AI made in the battles.
+    """
+    times = []
+    for seed in range(battles):
+        simulate_battle(
+            static_game_data,
+            creature_a,
+            creature_b,
+            ai_a=lambda battle_creature, rng: TimedAi(ai_class(battle_creature, rng), times),
+            seed=seed,
+        )
+
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("species_a", type=int, nargs="?", default=1)
+    parser.add_argument("species_b", type=int, nargs="?", default=4)
+    parser.add_argument("level", type=int, nargs="?", default=50)
+    parser.add_argument("battles", type=int, nargs="?", default=500)
+    args = parser.parse_args()
+
+    static_game_data = snapshot.load_static_data(
+        settings.DB_FILE, settings.SNAPSHOT_FILE, LocationAreaRectCollection()
+    )
+    rng = RandomStream(0)
+    creature_a = creature_creator.create_wild_creature(
+        static_game_data, static_game_data.species[args.species_a], args.level, rng
+    )
+    creature_b = creature_creator.create_wild_creature(
+        static_game_data, static_game_data.species[args.species_b], args.level, rng
+    )
+
+    frame_us = 1e6 / settings.FPS_LIMIT
+    print(f"{creature_a.nickname} vs {creature_b.nickname} at level {args.level}")
+    print(f"Frame budget at {settings.FPS_LIMIT} FPS: {frame_us:,.0f}us")
+    for ai_class in (RandomMoveAi, GreedyMoveAi, LookaheadAi, ExpectiminimaxAi):
+        times = sorted(
+            decision_times(static_game_data, ai_class, creature_a, creature_b, args.battles)
+        )
+        mean_us = statistics.fmean(times) * 1e6
+        p99_us = times[int(len(times) * 0.99)] * 1e6
+        print(
+            f"{ai_class.__name__:<16} {len(times):6} decisions, mean {mean_us:7.1f}us,"
+            f" p99 {p99_us:7.1f}us, max {times[-1] * 1e6:7.1f}us"
+            f" ({times[-1] * 1e6 / frame_us:.1%} of a frame)"
+        )
@@ -0,0 +1,51 @@
+"""
+Measures how many headless battles can be simulated per minute between
+two wild creatures loaded from the pokedex database:
+
+    python -m benchmarks.battle_throughput [species a] [species b] [level] [battles]
+"""
+
+import argparse
+import time
+
+import CreatureRogue.creature_creator as creature_creator
+import CreatureRogue.data_layer.snapshot as snapshot
+import CreatureRogue.settings as settings
+from CreatureRogue.battle_simulator import simulate_battle
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+from CreatureRogue.rng import RandomStream
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("species_a", type=int, nargs="?", default=1)
+    parser.add_argument("species_b", type=int, nargs="?", default=4)
+    parser.add_argument("level", type=int, nargs="?", default=20)
+    parser.add_argument("battles", type=int, nargs="?", default=20000)
+    args = parser.parse_args()
+
+    static_game_data = snapshot.load_static_data(
+        settings.DB_FILE, settings.SNAPSHOT_FILE, LocationAreaRectCollection()
+    )
+    rng = RandomStream(0)
+    creature_a = creature_creator.create_wild_creature(
+        static_game_data, static_game_data.species[args.species_a], args.level, rng
+    )
+    creature_b = creature_creator.create_wild_creature(
+        static_game_data, static_game_data.species[args.species_b], args.level, rng
+    )
+
+    wins = [0, 0]
+    turns = 0
+    start = time.perf_counter()
+    for seed in range(args.battles):
+        outcome = simulate_battle(static_game_data, creature_a, creature_b, seed=seed)
+        turns += outcome.turns
+        if outcome.winner is not None:
+            wins[outcome.winner] += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{creature_a.nickname} vs {creature_b.nickname} at level {args.level}")
+    print(
+        f"{args.battles} battles in {elapsed:.2f}s ({args.battles / elapsed * 60:,.0f} per minute)"
+    )
+    print(f"Wins: {wins[0]} - {wins[1]}, average turns {turns / args.battles:.1f}")
@@ -0,0 +1,126 @@
+"""
+Compares the memory used by creatures (and their battle wrappers) held
+with a dict per stat table (how creatures used to be stored) with the
+slotted, stat array backed Creature and BattleCreature.
+
+Doesn't need the database, the creatures are all of one made up species:
+
+    python -m benchmarks.creature_memory [creatures]
+"""
+
+import argparse
+import random
+
+from benchmarks.map_memory import measure
+from CreatureRogue.data_layer.data import (
+    ACCURACY_STAT,
+    ATTACK_STAT,
+    DEFENSE_STAT,
+    EVASION_STAT,
+    HP_STAT,
+    SP_ATTACK_STAT,
+    SP_DEFENSE_STAT,
+    SPEED_STAT,
+)
+from CreatureRogue.data_layer.growth_rate import GrowthRate
+from CreatureRogue.data_layer.species import Species
+from CreatureRogue.data_layer.stat import Stat
+from CreatureRogue.models.battle_creature import BattleCreature
+from CreatureRogue.models.creature import Creature
+
+
+class DictCreature:
+    """
+    The attributes the old Creature kept in its instance dict, with a dict
+    keyed by Stat for each stat table.
+    """
+
+    def __init__(self, species, level, individual_values, effort_values):
+        self.species = species
+        self.level = level
+        self.nickname = species.name
+        self.trainer = None
+        self.individual_values = individual_values
+        self.effort_values = effort_values
+        self.was_traded = False
+        self.moves = []
+        self.stats = {stat: base * 2 for stat, base in species.base_stats.items()}
+        self.current_xp = 0
+        self.fainted = False
+        self.ailments = []
+
+
+class DictBattleCreature:
+    def __init__(self, creature, static_game_data):
+        self.static_game_data = static_game_data
+        self.creature = creature
+        self.stat_adjusts = dict.fromkeys(creature.species.base_stats, 0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("creatures", type=int, nargs="?", default=100_000)
+    args = parser.parse_args()
+
+    stat_ids = [
+        HP_STAT,
+        ATTACK_STAT,
+        DEFENSE_STAT,
+        SP_ATTACK_STAT,
+        SP_DEFENSE_STAT,
+        SPEED_STAT,
+        ACCURACY_STAT,
+        EVASION_STAT,
+    ]
+    stats = [Stat(f"stat {stat_id}", f"s{stat_id}", stat_id) for stat_id in stat_ids]
+    species = Species(
+        pokedex_number=1,
+        name="Benchmark",
+        height=7,
+        weight=69,
+        types=[],
+        base_stats=dict.fromkeys(stats, 50),
+        base_xp_yield=64,
+        growth_rate=GrowthRate("medium"),
+        display_character="b",
+        display_color=None,
+        level_moves={},
+        flavor_text="",
+        genus="",
+        capture_rate=45,
+    )
+    rng = random.Random(0)
+    individual_values = [
+        {stat: rng.randint(0, 31) for stat in stats} for _ in range(args.creatures)
+    ]
+
+    def build_dict_creatures():
+        return [
+            DictBattleCreature(
+                DictCreature(species, 50, ivs, dict.fromkeys(stats, 0)), static_game_data=None
+            )
+            for ivs in individual_values
+        ]
+
+    def build_creatures():
+        return [
+            BattleCreature(
+                Creature(species, 50, None, None, ivs, dict.fromkeys(stats, 0), False, [], 0),
+                static_game_data=None,
+            )
+            for ivs in individual_values
+        ]
+
+    # The individual value dicts are shared input so aren't counted, the
+    # dict based creatures keep hold of theirs whereas Creature copies
+    # them into an array.
+    _, dict_bytes = measure(build_dict_creatures)
+    _, array_bytes = measure(build_creatures)
+
+    print(f"{args.creatures} creatures in battle")
+    print(
+        f"Dict based:   {dict_bytes / 1024 / 1024:8.2f} MiB ({dict_bytes / args.creatures:.0f} bytes/creature)"
+    )
+    print(
+        f"Array backed: {array_bytes / 1024 / 1024:8.2f} MiB ({array_bytes / args.creatures:.0f} bytes/creature)"
+    )
@@ -0,0 +1,68 @@
+"""
+Compares the memory used by a region map held as one MapDataTile object
+per cell (how maps used to be loaded) with the array backed MapData.
+
+Doesn't need the database, a random map of the given size is generated
+from a handful of tile types:
+
+    python -m benchmarks.map_memory [rows] [columns]
+"""
+
+import argparse
+import random
+import tracemalloc
+
+import numpy as np
+
+from CreatureRogue.data_layer.map_data_tile_type import MapDataTileType
+from CreatureRogue.data_layer.map_loader import MapData, MapDataTile
+from CreatureRogue.data_layer.region import Region
+
+
+def measure(build):
+    """
+    Returns the object built and the number of bytes allocated whilst
+    building it which are still held afterwards.
+    """
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, current
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("rows", type=int, nargs="?", default=600)
+    parser.add_argument("columns", type=int, nargs="?", default=800)
+    args = parser.parse_args()
+
+    region = Region(region_id=1, identifier="benchmark", name="Benchmark")
+    tile_types = [
+        MapDataTileType(f"tile {i}", chr(ord("a") + i), i * 20, 255 - i * 20, 100, i % 2 == 0)
+        for i in range(12)
+    ]
+    rng = random.Random(0)
+    cell_types = [
+        [rng.randrange(len(tile_types)) for _ in range(args.columns)] for _ in range(args.rows)
+    ]
+
+    objects, object_bytes = measure(
+        lambda: [
+            [MapDataTile(tile_types[cell_types[y][x]], y, x) for x in range(args.columns)]
+            for y in range(args.rows)
+        ]
+    )
+    array_map, array_bytes = measure(
+        lambda: MapData(region, tile_types, np.array(cell_types, dtype=np.uint8))
+    )
+
+    cells = args.rows * args.columns
+    print(f"{args.rows}x{args.columns} map ({cells} cells)")
+    print(
+        f"MapDataTile objects: {object_bytes / 1024 / 1024:8.2f} MiB ({object_bytes / cells:.1f} bytes/cell)"
+    )
+    print(
+        f"Array backed:        {array_bytes / 1024 / 1024:8.2f} MiB ({array_bytes / cells:.1f} bytes/cell)"
+    )
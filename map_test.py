@@ -25,6 +25,7 @@ if __name__ == "__main__":
         region=kanto_region,
         tile_types=game.static_game_data.map_data_tile_types,
         default_tile_type=game.static_game_data.map_data_tile_types[11],
+        location_area_rects=game.static_game_data.location_area_rects,
     )
     game.game_data.player = Player("Test Player", game.static_game_data, map_data, args.x, args.y)
     game.state = MapState(game, game.game_data, game.map_renderer)
@@ -0,0 +1,74 @@
+from CreatureRogue.battle_ai import GreedyMoveAi, LookaheadAi, RandomMoveAi
+from CreatureRogue.battle_simulator import simulate_battle
+from CreatureRogue.data_layer.data import ATTACK_STAT
+from CreatureRogue.models.battle_creature import BattleCreature
+
+
+def _move_names(battle_creature: BattleCreature) -> list[str]:
+    return [move.move_data.name for move in battle_creature.creature.moves]
+
+
+def test_greedy_picks_most_damaging_move(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    assert set(_move_names(charmander)) == {"Tackle", "Growl", "Ember"}
+
+    assert GreedyMoveAi(charmander).select_move(bulbasaur).move_data.name == "Ember"
+
+
+def test_greedy_skips_moves_without_pp(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    ai = GreedyMoveAi(charmander)
+
+    for move in charmander.creature.moves:
+        if move.move_data.name == "Ember":
+            move.pp = 0
+    assert ai.select_move(bulbasaur).move_data.name == "Tackle"
+
+    for move in charmander.creature.moves:
+        move.pp = 0
+    assert ai.select_move(bulbasaur) is None
+
+
+def test_greedy_without_opponent_picks_any_move(make_battle_creature):
+    charmander = make_battle_creature(4)
+
+    assert GreedyMoveAi(charmander).select_move() in charmander.creature.moves
+
+
+def test_repeat_decisions_use_cache(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    ai = LookaheadAi(charmander)
+
+    ai.select_move(bulbasaur)
+    misses = ai.cache.misses
+    ai.select_move(bulbasaur)
+
+    assert misses > 0
+    assert ai.cache.misses == misses
+    assert ai.cache.hits >= misses
+
+
+def test_lookahead_sees_growl_weakens_reply(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    ai = LookaheadAi(charmander)
+
+    assert ai._best_reply(bulbasaur, opponent_adjusts={ATTACK_STAT: -1}) < ai._best_reply(bulbasaur)
+
+
+def test_lookahead_beats_random(static_game_data, make_battle_creature):
+    charmander = make_battle_creature(4).creature
+    rival = make_battle_creature(4).creature
+
+    wins = [0, 0]
+    for seed in range(40):
+        outcome = simulate_battle(
+            static_game_data, charmander, rival, ai_a=LookaheadAi, ai_b=RandomMoveAi, seed=seed
+        )
+        if outcome.winner is not None:
+            wins[outcome.winner] += 1
+
+    assert wins[0] > wins[1]
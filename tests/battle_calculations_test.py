@@ -0,0 +1,116 @@
+import random
+
+import numpy as np
+
+import CreatureRogue.creature_creator as creature_creator
+from CreatureRogue.battle_calculations import (
+    damage_calculation,
+    damage_distributions,
+    move_damage_distribution,
+    turn_order,
+)
+from CreatureRogue.data_layer.data import ATTACK_STAT
+from CreatureRogue.data_layer.stat import Stat
+from CreatureRogue.models.battle_creature import BattleCreature
+from tests.data_layer.db_layer_test import load_test_static_data
+
+
+class _FixedSpeedCreature:
+    def __init__(self, speed: int):
+        self.speed = speed
+
+    def stat_value(self, stat: Stat) -> int:
+        return self.speed
+
+
+def test_faster_creature_moves_first():
+    speed = Stat("Speed", "Spd")
+    fast, slow = _FixedSpeedCreature(10), _FixedSpeedCreature(5)
+
+    assert turn_order("a", fast, "b", slow, speed) == [("a", fast, slow), ("b", slow, fast)]
+    assert turn_order("a", slow, "b", fast, speed) == [("b", fast, slow), ("a", slow, fast)]
+
+
+def test_speed_tie_decided_by_rng():
+    speed = Stat("Speed", "Spd")
+    a, b = _FixedSpeedCreature(7), _FixedSpeedCreature(7)
+
+    firsts = {turn_order("a", a, "b", b, speed, random.Random(seed))[0][0] for seed in range(20)}
+    assert firsts == {"a", "b"}
+
+
+class _FixedCriticalRng:
+    """
+    Stands in for the random module in damage_calculation so that the
+    critical hit roll can be forced.
+    """
+
+    def __init__(self, critical: bool):
+        self.critical = critical
+
+    def uniform(self, a: float, b: float) -> float:
+        return a if self.critical else b
+
+
+def test_damage_distribution_matches_damage_calculation(tmp_path):
+    static_game_data = load_test_static_data(tmp_path)
+    rng = random.Random(5)
+    creatures = [
+        BattleCreature(
+            creature_creator.create_wild_creature(
+                static_game_data, static_game_data.species[species_id], level, rng
+            ),
+            static_game_data,
+        )
+        for species_id in (1, 4, 7)
+        for level in (3, 27, 100)
+    ]
+    attack_stat = static_game_data.stats[ATTACK_STAT]
+    creatures[0].adjust_stat_adjusts(attack_stat, 2)
+    creatures[4].adjust_stat_adjusts(attack_stat, -3)
+
+    for attacker in creatures:
+        for defender in creatures:
+            for move in attacker.creature.moves:
+                if not move.move_data.damage_move():
+                    continue
+
+                distribution = move_damage_distribution(
+                    move, attacker, defender, static_game_data.type_chart
+                )
+                _, damage = damage_calculation(
+                    move, attacker, defender, static_game_data.type_chart, _FixedCriticalRng(False)
+                )
+                _, critical_damage = damage_calculation(
+                    move, attacker, defender, static_game_data.type_chart, _FixedCriticalRng(True)
+                )
+
+                assert distribution.damage == distribution.minimum == damage
+                assert distribution.critical_damage == distribution.maximum == critical_damage
+                assert damage <= distribution.mean <= critical_damage
+
+
+def test_damage_distributions_batched():
+    levels = np.array([5, 50, 100, 100])
+    distribution = damage_distributions(
+        levels,
+        attack_stats=np.array([10.0, 80.0, 200.0, 50.0]),
+        defence_stats=np.array([12.0, 40.0, 100.0, 50.0]),
+        base_powers=np.array([40, 90, 120, 40]),
+        same_type=np.array([False, True, True, False]),
+        type_modifiers=np.array([1, 2, 0.5, 0]),
+    )
+
+    expected = [
+        int((((2 * level + 10) / 250) * (attack / defence) * power + 2) * modifier)
+        for level, attack, defence, power, modifier in (
+            (5, 10.0, 12.0, 40, 1),
+            (50, 80.0, 40.0, 90, 1.5 * 2),
+            (100, 200.0, 100.0, 120, 1.5 * 0.5),
+            (100, 50.0, 50.0, 40, 0),
+        )
+    ]
+    assert distribution.damage.tolist() == expected
+    assert distribution.critical_damage[3] == 0
+    assert (distribution.critical_damage >= distribution.damage).all()
+    assert distribution.mean.shape == (4,)
@@ -0,0 +1,124 @@
+import pytest
+
+import CreatureRogue.battle_calculations as battle_calculations
+import CreatureRogue.battle_probabilities as battle_probabilities
+from CreatureRogue.data_layer.data import HP_STAT
+from CreatureRogue.rng import RandomStream
+
+
+def _move(battle_creature, name: str):
+    return next(move for move in battle_creature.creature.moves if move.move_data.name == name)
+
+
+def test_shake_chance_bounds():
+    assert battle_probabilities.shake_chance(255) == 1.0
+    assert battle_probabilities.shake_chance(0) == 1 / 65536
+    assert 0 < battle_probabilities.shake_chance(30) < battle_probabilities.shake_chance(60) < 1
+
+
+def test_catch_distribution_matches_sampling(static_game_data, make_battle_creature):
+    bulbasaur = make_battle_creature(1)
+    pokeball = static_game_data.pokeballs[1]
+    num_shakes = battle_calculations.NUMBER_CATCH_CHECKS
+    distribution = battle_probabilities.catch_checks_distribution(
+        bulbasaur.modified_catch_rate(pokeball), num_shakes
+    )
+
+    rng = RandomStream(0)
+    samples = 20000
+    counts = [0] * (num_shakes + 1)
+    for _ in range(samples):
+        counts[
+            battle_calculations.num_catch_checks_passed(bulbasaur, pokeball, num_shakes, rng)
+        ] += 1
+
+    assert sum(distribution) == pytest.approx(1)
+    assert battle_probabilities.catch_chance(bulbasaur, pokeball) == distribution[-1]
+    for count, chance in zip(counts, distribution, strict=True):
+        assert count / samples == pytest.approx(chance, abs=0.02)
+
+
+def test_catch_chance_rises_as_hp_falls(static_game_data, make_battle_creature):
+    bulbasaur = make_battle_creature(1)
+    pokeball = static_game_data.pokeballs[1]
+    full_hp_chance = battle_probabilities.catch_chance(bulbasaur, pokeball)
+
+    hp_stat = static_game_data.stats[HP_STAT]
+    bulbasaur.creature.adjust_stat(hp_stat, bulbasaur.creature.current_stat(hp_stat) - 1)
+
+    assert battle_probabilities.catch_chances(bulbasaur, [pokeball])[pokeball] > full_hp_chance
+
+
+def test_damage_outcomes(static_game_data, make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    type_chart = static_game_data.type_chart
+    tackle = _move(charmander, "Tackle")
+
+    outcomes = battle_probabilities.damage_outcomes(tackle, charmander, bulbasaur, type_chart)
+    distribution = battle_calculations.move_damage_distribution(
+        tackle, charmander, bulbasaur, type_chart
+    )
+
+    assert [damage for damage, _ in outcomes] == [
+        int(distribution.damage),
+        int(distribution.critical_damage),
+    ]
+    assert outcomes[1][1] == pytest.approx(battle_calculations.CRITICAL_HIT_PERCENT / 100)
+
+    # Lower accuracy adds a chance of doing no damage.
+    charmander.adjust_stat_adjusts(tackle.move_data.accuracy_stat, -6)
+    outcomes = battle_probabilities.damage_outcomes(tackle, charmander, bulbasaur, type_chart)
+    miss_chance = 1 - battle_calculations.hit_chance(
+        tackle.move_data.base_accuracy,
+        charmander.stat_value(tackle.move_data.accuracy_stat),
+        bulbasaur.stat_value(tackle.move_data.evasion_stat),
+    )
+    assert outcomes[0] == (0, pytest.approx(miss_chance))
+    assert sum(chance for _, chance in outcomes) == pytest.approx(1)
+    assert battle_probabilities.damage_outcomes(
+        _move(charmander, "Growl"), charmander, bulbasaur, type_chart
+    ) == ((0, 1.0),)
+
+
+def test_ko_chance(static_game_data, make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    type_chart = static_game_data.type_chart
+    tackle = _move(charmander, "Tackle")
+    hp_stat = static_game_data.stats[HP_STAT]
+
+    charmander.adjust_stat_adjusts(tackle.move_data.accuracy_stat, -6)
+    hit = battle_calculations.hit_chance(
+        tackle.move_data.base_accuracy,
+        charmander.stat_value(tackle.move_data.accuracy_stat),
+        bulbasaur.stat_value(tackle.move_data.evasion_stat),
+    )
+
+    chances = [
+        battle_probabilities.ko_chance(tackle, charmander, bulbasaur, type_chart, turns)
+        for turns in range(1, 60)
+    ]
+    assert chances == sorted(chances)
+    assert chances[0] < 1
+    assert chances[-1] == pytest.approx(1, abs=1e-3)
+
+    bulbasaur.creature.adjust_stat(hp_stat, bulbasaur.creature.current_stat(hp_stat) - 1)
+    assert battle_probabilities.ko_chance(
+        tackle, charmander, bulbasaur, type_chart
+    ) == pytest.approx(hit)
+    assert battle_probabilities.ko_chance(
+        tackle, charmander, bulbasaur, type_chart, 2
+    ) == pytest.approx(1 - (1 - hit) ** 2)
+
+
+def test_outcomes_are_memoised(static_game_data, make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    ember = _move(charmander, "Ember")
+
+    battle_probabilities.ko_chance(ember, charmander, bulbasaur, static_game_data.type_chart, 3)
+    hits = battle_probabilities._damage_outcomes.cache_info().hits
+    battle_probabilities.ko_chance(ember, charmander, bulbasaur, static_game_data.type_chart, 3)
+
+    assert battle_probabilities._damage_outcomes.cache_info().hits == hits + 1
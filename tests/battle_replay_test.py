@@ -0,0 +1,140 @@
+import dataclasses
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+import CreatureRogue.creature_creator as creature_creator
+from CreatureRogue.battle_ai import GreedyMoveAi, RandomMoveAi
+from CreatureRogue.battle_replay import (
+    BattleLog,
+    check_replay,
+    replay_battle,
+    start_battle_log,
+)
+from CreatureRogue.battle_search import ExpectiminimaxAi, SearchBudget
+from CreatureRogue.models.battle_creature import BattleCreature
+from CreatureRogue.models.battle_data import BattleData
+from CreatureRogue.rng import RandomStream
+from CreatureRogue.states.battle_state import BattleState
+
+
+def _create_battle_state(static_game_data, seed: int, ai_type=RandomMoveAi) -> BattleState:
+    """
+    A battle between a player's charmander and a wild bulbasaur set up the
+    way Game.start_wild_battle does it, recorded to a log.
+    """
+    creation_rng = RandomStream(seed)
+    player_creature = creature_creator.create_wild_creature(
+        static_game_data, static_game_data.species[4], 12, creation_rng
+    )
+    wild_creature = creature_creator.create_wild_creature(
+        static_game_data, static_game_data.species[1], 10, creation_rng
+    )
+    battle_rng = RandomStream(seed + 1)
+    wild_battle_creature = BattleCreature(wild_creature, static_game_data)
+    computer_ai = ai_type(wild_battle_creature, battle_rng)
+    battle_data = BattleData(
+        None,
+        BattleCreature(player_creature, static_game_data),
+        computer_ai,
+        wild_creature=wild_battle_creature,
+        rng=battle_rng,
+        battle_log=start_battle_log(
+            seed + 1, player_creature, wild_creature, static_game_data, computer_ai
+        ),
+    )
+    game = SimpleNamespace(
+        static_game_data=static_game_data, ai_executor=ThreadPoolExecutor(max_workers=1)
+    )
+
+    return BattleState(game, SimpleNamespace(battle_data=battle_data), None, None, None)
+
+
+def _fight(battle_state: BattleState) -> BattleLog:
+    battle_data = battle_state.game_data.battle_data
+    moves = battle_data.player_creature.creature.moves
+    turn = 0
+    while not battle_state.end_battle and turn < 100:
+        battle_state._handle_move_select(moves[turn % len(moves)])
+        battle_state.pending_turn[1].result()
+        battle_state._poll_computer_move()
+        turn += 1
+    battle_state.game.ai_executor.shutdown()
+
+    battle_data.battle_log.finish(
+        battle_data.player_creature, battle_data.defending_creature(), False, battle_data.rng
+    )
+    return battle_data.battle_log
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_recorded_battle_replays_identically(static_game_data, seed):
+    log = _fight(_create_battle_state(static_game_data, seed))
+
+    assert log.outcome.turns == len(log.events) > 0
+    assert check_replay(static_game_data, log) == log.outcome
+    assert check_replay(static_game_data, BattleLog.from_bytes(log.to_bytes())) == log.outcome
+
+
+def test_recorded_ai_used_in_replay(static_game_data):
+    log = _fight(_create_battle_state(static_game_data, 1, GreedyMoveAi))
+
+    assert (log.ai, log.ai_budget) == ("greedy", None)
+    assert check_replay(static_game_data, BattleLog.from_bytes(log.to_bytes())) == log.outcome
+    with pytest.raises(AssertionError):
+        check_replay(static_game_data, dataclasses.replace(log, ai="random"))
+
+
+def test_search_budget_recorded(static_game_data):
+    budget = SearchBudget(max_depth=1, time_ms=1000.0)
+    log = _fight(
+        _create_battle_state(
+            static_game_data, 2, functools.partial(ExpectiminimaxAi, budget=budget)
+        )
+    )
+    read_log = BattleLog.from_bytes(log.to_bytes())
+
+    assert (read_log.ai, read_log.ai_budget) == ("expectiminimax", budget)
+    assert check_replay(static_game_data, read_log) == log.outcome
+
+
+def test_unregistered_ai_not_recorded(static_game_data):
+    class CustomAi(RandomMoveAi):
+        pass
+
+    with pytest.raises(ValueError):
+        _create_battle_state(static_game_data, 0, CustomAi)
+
+
+def test_log_round_trips_through_bytes(static_game_data, tmp_path):
+    log = _fight(_create_battle_state(static_game_data, 3))
+    log.record_catch(1)
+    log_file = tmp_path / "logs" / "battle.battle"
+
+    log.write(log_file)
+
+    assert BattleLog.read(log_file) == log
+    assert len(log_file.read_bytes()) < 200
+
+
+def test_changed_log_fails_check(static_game_data):
+    log = _fight(_create_battle_state(static_game_data, 2))
+
+    with pytest.raises(AssertionError):
+        check_replay(static_game_data, dataclasses.replace(log, seed=log.seed + 1))
+
+
+def test_catch_replayed(static_game_data):
+    log = _create_battle_state(static_game_data, 0).game_data.battle_data.battle_log
+    log.record_catch(1)
+
+    outcome = replay_battle(static_game_data, log)
+    assert outcome.turns == 0
+    assert outcome == replay_battle(static_game_data, log)
+
+
+def test_bad_log_rejected():
+    with pytest.raises(ValueError):
+        BattleLog.from_bytes(b"NOPE" + bytes(20))
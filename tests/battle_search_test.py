@@ -0,0 +1,104 @@
+from CreatureRogue.battle_ai import RandomMoveAi
+from CreatureRogue.battle_search import DIFFICULTY_BUDGETS, ExpectiminimaxAi, SearchBudget
+from CreatureRogue.battle_simulator import simulate_battle
+
+
+def test_picks_most_damaging_move(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+
+    assert ExpectiminimaxAi(charmander).select_move(bulbasaur).move_data.name == "Ember"
+
+
+def test_skips_moves_without_pp(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    ai = ExpectiminimaxAi(charmander)
+
+    for move in charmander.creature.moves:
+        if move.move_data.name == "Ember":
+            move.pp = 0
+    assert ai.select_move(bulbasaur).move_data.name != "Ember"
+
+    for move in charmander.creature.moves:
+        move.pp = 0
+    assert ai.select_move(bulbasaur) is None
+
+
+def test_search_does_not_change_creatures(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    before = [
+        (
+            bc.creature.stats.by_stat_id(),
+            bc.stat_adjusts.by_stat_id(),
+            [move.pp for move in bc.creature.moves],
+        )
+        for bc in (charmander, bulbasaur)
+    ]
+
+    ExpectiminimaxAi(charmander, difficulty="hard").select_move(bulbasaur)
+
+    assert before == [
+        (
+            bc.creature.stats.by_stat_id(),
+            bc.stat_adjusts.by_stat_id(),
+            [move.pp for move in bc.creature.moves],
+        )
+        for bc in (charmander, bulbasaur)
+    ]
+
+
+def test_deepens_up_to_max_depth(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    ai = ExpectiminimaxAi(charmander, budget=SearchBudget(max_depth=3, time_ms=10_000))
+
+    ai.select_move(bulbasaur)
+
+    assert ai.completed_depth == 3
+
+
+def test_first_depth_completes_without_time(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    ai = ExpectiminimaxAi(charmander, budget=SearchBudget(max_depth=10, time_ms=0))
+
+    assert ai.select_move(bulbasaur).move_data.name == "Ember"
+    assert ai.completed_depth == 1
+
+
+def test_repeat_decisions_use_transpositions(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    ai = ExpectiminimaxAi(charmander, budget=SearchBudget(max_depth=2, time_ms=10_000))
+
+    ai.select_move(bulbasaur)
+    assert ai.nodes > 0
+    ai.select_move(bulbasaur)
+
+    assert ai.nodes == 0
+
+
+def test_difficulties_search_deeper(static_game_data):
+    budgets = [DIFFICULTY_BUDGETS[difficulty] for difficulty in ("easy", "normal", "hard")]
+
+    assert [budget.max_depth for budget in budgets] == sorted(
+        budget.max_depth for budget in budgets
+    )
+    assert [budget.time_ms for budget in budgets] == sorted(budget.time_ms for budget in budgets)
+
+
+def test_beats_random(static_game_data, make_battle_creature):
+    charmander = make_battle_creature(4).creature
+    rival = make_battle_creature(4).creature
+
+    wins = [0, 0]
+    for seed in range(20):
+        outcome = simulate_battle(
+            static_game_data, charmander, rival, ai_a=ExpectiminimaxAi, ai_b=RandomMoveAi, seed=seed
+        )
+        if outcome.winner is not None:
+            wins[outcome.winner] += 1
+
+    assert wins[0] > wins[1]
@@ -0,0 +1,72 @@
+import random
+
+import CreatureRogue.creature_creator as creature_creator
+from CreatureRogue.battle_simulator import simulate_battle
+from CreatureRogue.data_layer.data import HP_STAT
+
+
+def _create_creature(static_game_data, species_id: int, level: int):
+    random.seed(species_id * 1000 + level)
+    return creature_creator.create_wild_creature(
+        static_game_data, static_game_data.species[species_id], level
+    )
+
+
+def test_same_seed_same_outcome(static_game_data):
+    bulbasaur = _create_creature(static_game_data, 1, 10)
+    charmander = _create_creature(static_game_data, 4, 10)
+
+    outcomes = [simulate_battle(static_game_data, bulbasaur, charmander, seed=42) for _ in range(3)]
+    assert outcomes[0] == outcomes[1] == outcomes[2]
+    assert (
+        len({simulate_battle(static_game_data, bulbasaur, charmander, seed=s) for s in range(20)})
+        > 1
+    )
+
+
+def test_original_creatures_unchanged(static_game_data):
+    bulbasaur = _create_creature(static_game_data, 1, 10)
+    squirtle = _create_creature(static_game_data, 7, 10)
+    hp_stat = static_game_data.stats[HP_STAT]
+    hp_before = bulbasaur.current_stat(hp_stat), squirtle.current_stat(hp_stat)
+    pp_before = [move.pp for move in bulbasaur.moves + squirtle.moves]
+
+    outcome = simulate_battle(static_game_data, bulbasaur, squirtle, seed=1)
+
+    assert outcome.winner is not None
+    assert (bulbasaur.current_stat(hp_stat), squirtle.current_stat(hp_stat)) == hp_before
+    assert [move.pp for move in bulbasaur.moves + squirtle.moves] == pp_before
+    assert not bulbasaur.fainted and not squirtle.fainted
+
+
+def test_outcome_consistent(static_game_data):
+    strong = _create_creature(static_game_data, 4, 50)
+    weak = _create_creature(static_game_data, 1, 5)
+
+    for seed in range(20):
+        outcome = simulate_battle(static_game_data, weak, strong, seed=seed)
+        assert outcome.winner == 1
+        assert outcome.fainted == (True, False)
+        assert outcome.hp_remaining[0] == 0
+        assert outcome.hp_remaining[1] > 0
+        assert outcome.turns >= 1
+
+
+def test_turn_limit(static_game_data):
+    bulbasaur = _create_creature(static_game_data, 1, 10)
+    charmander = _create_creature(static_game_data, 4, 10)
+
+    outcome = simulate_battle(static_game_data, bulbasaur, charmander, seed=3, max_turns=1)
+    assert outcome.turns == 1
+    assert outcome.winner is None
+
+
+def test_no_moves_ends_battle(static_game_data):
+    bulbasaur = _create_creature(static_game_data, 1, 10)
+    charmander = _create_creature(static_game_data, 4, 10)
+    bulbasaur.moves = []
+    charmander.moves = []
+
+    outcome = simulate_battle(static_game_data, bulbasaur, charmander, seed=3)
+    assert outcome.turns == 0
+    assert outcome.winner is None
@@ -0,0 +1,27 @@
+import pytest
+
+import CreatureRogue.creature_creator as creature_creator
+from CreatureRogue.models.battle_creature import BattleCreature
+from CreatureRogue.rng import RandomStream
+from tests.data_layer.db_layer_test import load_test_static_data
+
+
+@pytest.fixture
+def static_game_data(tmp_path):
+    return load_test_static_data(tmp_path)
+
+
+@pytest.fixture
+def make_battle_creature(static_game_data):
+    """
+    Creates wild battle creatures from the test static data, the same
+    species and level always give the same creature.
+    """
+
+    def make(species_id: int, level: int = 10) -> BattleCreature:
+        creature = creature_creator.create_wild_creature(
+            static_game_data, static_game_data.species[species_id], level, RandomStream(species_id)
+        )
+        return BattleCreature(creature, static_game_data)
+
+    return make
@@ -0,0 +1,430 @@
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import CreatureRogue.settings as settings
+from CreatureRogue.data_layer.data import (
+    ACCURACY_STAT,
+    ATTACK_STAT,
+    EVASION_STAT,
+    HP_STAT,
+    StaticGameData,
+)
+from CreatureRogue.data_layer.db_layer import Loader
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+from CreatureRogue.models.player import Player
+
+LANGUAGE = settings.LOCAL_LANGUAGE_ID
+VERSION_GROUP = settings.VERSION_GROUP_ID
+
+_SCHEMA = """
+CREATE TABLE move_meta_ailments (id INTEGER PRIMARY KEY);
+CREATE TABLE move_meta_ailment_names (move_meta_ailment_id INTEGER, local_language_id INTEGER, name TEXT);
+CREATE TABLE stats (id INTEGER PRIMARY KEY, identifier TEXT);
+CREATE TABLE stat_names (stat_id INTEGER, local_language_id INTEGER, name TEXT, short_name TEXT);
+CREATE TABLE pokemon_colors (id INTEGER PRIMARY KEY, red INTEGER, green INTEGER, blue INTEGER);
+CREATE TABLE pokemon_color_names (pokemon_color_id INTEGER, local_language_id INTEGER, name TEXT);
+CREATE TABLE growth_rates (id INTEGER PRIMARY KEY, identifier TEXT);
+CREATE TABLE experience (growth_rate_id INTEGER, level INTEGER, experience INTEGER);
+CREATE TABLE pokeballs (id INTEGER PRIMARY KEY, name TEXT, catch_rate REAL, top_color TEXT, bottom_color TEXT, display_char TEXT);
+CREATE TABLE move_targets (id INTEGER PRIMARY KEY, identifier TEXT);
+CREATE TABLE move_target_prose (move_target_id INTEGER, local_language_id INTEGER, name TEXT, description TEXT);
+CREATE TABLE types (id INTEGER PRIMARY KEY, identifier TEXT);
+CREATE TABLE type_names (type_id INTEGER, local_language_id INTEGER, name TEXT);
+CREATE TABLE type_efficacy (damage_type_id INTEGER, target_type_id INTEGER, damage_factor INTEGER);
+CREATE TABLE move_data (id INTEGER PRIMARY KEY, name TEXT, pp INTEGER, type_id INTEGER, power INTEGER, damage_class_id INTEGER, accuracy INTEGER, min_hits INTEGER, max_hits INTEGER, target_id INTEGER, ailment_id INTEGER);
+CREATE TABLE move_meta_stat_changes (move_id INTEGER, stat_id INTEGER, change INTEGER);
+CREATE TABLE creature_species_data (species_id INTEGER, creature_id INTEGER, pokedex_number INTEGER, name TEXT, height INTEGER, weight INTEGER, base_experience INTEGER, color_id INTEGER, growth_rate_id INTEGER, flavor_text TEXT, genus TEXT, capture_rate INTEGER, pokedex_id INTEGER, local_language_id INTEGER);
+CREATE TABLE pokemon_types (pokemon_id INTEGER, type_id INTEGER, slot INTEGER);
+CREATE TABLE pokemon_stats (pokemon_id INTEGER, stat_id INTEGER, base_stat INTEGER);
+CREATE TABLE pokemon_moves (pokemon_id INTEGER, version_group_id INTEGER, move_id INTEGER, pokemon_move_method_id INTEGER, level INTEGER);
+CREATE TABLE regions (id INTEGER PRIMARY KEY, identifier TEXT);
+CREATE TABLE region_names (region_id INTEGER, local_language_id INTEGER, name TEXT);
+CREATE TABLE locations (id INTEGER PRIMARY KEY, region_id INTEGER, identifier TEXT);
+CREATE TABLE location_names (location_id INTEGER, local_language_id INTEGER, name TEXT);
+CREATE TABLE location_areas (id INTEGER PRIMARY KEY, location_id INTEGER, identifier TEXT);
+CREATE TABLE location_area_prose (location_area_id INTEGER, local_language_id INTEGER, name TEXT);
+CREATE TABLE location_area_encounter_rates (location_area_id INTEGER, encounter_method_id INTEGER, version_id INTEGER, rate INTEGER);
+CREATE TABLE pokemon (id INTEGER PRIMARY KEY, species_id INTEGER);
+CREATE TABLE encounter_slots (id INTEGER PRIMARY KEY, encounter_method_id INTEGER, rarity INTEGER);
+CREATE TABLE encounters (id INTEGER PRIMARY KEY, version_id INTEGER, location_area_id INTEGER, encounter_slot_id INTEGER, pokemon_id INTEGER, min_level INTEGER, max_level INTEGER);
+CREATE TABLE region_map_data_cell_types (id INTEGER PRIMARY KEY, display_character TEXT, red INTEGER, green INTEGER, blue INTEGER, traversable INTEGER, name TEXT);
+CREATE TABLE region_map_data (region_id INTEGER, row INTEGER, "column" INTEGER, cell_type_id INTEGER);
+"""
+
+_STATS = (
+    (1, "HP", "HP"),
+    (2, "Attack", "Atk"),
+    (3, "Defense", "Def"),
+    (4, "Special Attack", "SpAtk"),
+    (5, "Special Defense", "SpDef"),
+    (6, "Speed", "Spd"),
+    (7, "Accuracy", ""),
+    (8, "Evasion", ""),
+)
+
+# (id, name, base stats, types, (move id, level) pairs)
+_SPECIES = (
+    (1, "Bulbasaur", (45, 49, 49, 65, 65, 45), (12, 4), ((33, 1), (45, 3), (22, 7))),
+    (4, "Charmander", (39, 52, 43, 60, 50, 65), (10,), ((33, 1), (45, 1), (52, 7))),
+    (7, "Squirtle", (44, 48, 65, 50, 64, 43), (11,), ((33, 1), (55, 7))),
+)
+
+# (id, name, pp, type, power, damage class, accuracy, target, stat changes)
+_MOVES = (
+    (22, "Vine Whip", 25, 12, 45, 2, 100, 10, ()),
+    (33, "Tackle", 35, 1, 35, 2, 95, 10, ()),
+    (45, "Growl", 40, 1, None, 1, 100, 11, ((ATTACK_STAT, -1),)),
+    (52, "Ember", 25, 10, 40, 3, 100, 10, ()),
+    (55, "Water Gun", 25, 11, 40, 3, 100, 10, ()),
+)
+
+
+def create_test_database(path: Path) -> Path:
+    """
+    Creates a small database which follows the schema of the real
+    pokedex database closely enough for the loaders to run against it.
+
+    It contains three species (Bulbasaur, Charmander and Squirtle), a
+    handful of their moves and a single region with two location areas.
+    """
+    db_file = path / "test_pokedex.db3"
+    with sqlite3.connect(db_file) as conn:
+        conn.executescript(_SCHEMA)
+
+        conn.executemany("INSERT INTO move_meta_ailments VALUES (?)", [(0,), (4,)])
+        conn.executemany(
+            "INSERT INTO move_meta_ailment_names VALUES (?, ?, ?)",
+            [(0, LANGUAGE, "none"), (4, LANGUAGE, "Burn")],
+        )
+
+        for stat_id, name, short_name in _STATS:
+            conn.execute("INSERT INTO stats VALUES (?, ?)", (stat_id, name.lower()))
+            conn.execute(
+                "INSERT INTO stat_names VALUES (?, ?, ?, ?)", (stat_id, LANGUAGE, name, short_name)
+            )
+
+        for color_id, name, rgb in (
+            (5, "Green", (0, 255, 0)),
+            (8, "Red", (255, 0, 0)),
+            (2, "Blue", (0, 0, 255)),
+        ):
+            conn.execute("INSERT INTO pokemon_colors VALUES (?, ?, ?, ?)", (color_id, *rgb))
+            conn.execute(
+                "INSERT INTO pokemon_color_names VALUES (?, ?, ?)", (color_id, LANGUAGE, name)
+            )
+
+        conn.executemany(
+            "INSERT INTO growth_rates VALUES (?, ?)", [(2, "medium"), (4, "medium-slow")]
+        )
+        for level in range(1, 101):
+            medium_slow = int(1.2 * level**3 - 15 * level**2 + 100 * level - 140)
+            conn.execute(
+                "INSERT INTO experience VALUES (?, ?, ?)", (2, level, 0 if level == 1 else level**3)
+            )
+            conn.execute(
+                "INSERT INTO experience VALUES (?, ?, ?)",
+                (4, level, 0 if level == 1 else medium_slow),
+            )
+
+        conn.execute(
+            "INSERT INTO pokeballs VALUES (1, 'Pokeball', 1, '255,0,0', '255,255,255', 'P')"
+        )
+
+        for target_id, identifier, name in (
+            (7, "user", "User"),
+            (10, "selected-pokemon", "Selected Pokemon"),
+            (11, "all-opponents", "All Opponents"),
+        ):
+            conn.execute("INSERT INTO move_targets VALUES (?, ?)", (target_id, identifier))
+            conn.execute(
+                "INSERT INTO move_target_prose VALUES (?, ?, ?, ?)",
+                (target_id, LANGUAGE, name, f"Targets {name}"),
+            )
+
+        for type_id, name in (
+            (1, "Normal"),
+            (4, "Poison"),
+            (10, "Fire"),
+            (11, "Water"),
+            (12, "Grass"),
+        ):
+            conn.execute("INSERT INTO types VALUES (?, ?)", (type_id, name.lower()))
+            conn.execute("INSERT INTO type_names VALUES (?, ?, ?)", (type_id, LANGUAGE, name))
+        conn.executemany(
+            "INSERT INTO type_efficacy VALUES (?, ?, ?)",
+            [
+                (1, 1, 100),
+                (10, 10, 50),
+                (10, 12, 200),
+                (10, 11, 50),
+                (11, 10, 200),
+                (11, 11, 50),
+                (11, 12, 50),
+                (12, 10, 50),
+                (12, 11, 200),
+                (12, 12, 50),
+                (12, 4, 50),
+                (4, 12, 200),
+            ],
+        )
+
+        for move_id, name, pp, type_id, power, damage_class, accuracy, target, changes in _MOVES:
+            conn.execute(
+                "INSERT INTO move_data VALUES (?, ?, ?, ?, ?, ?, ?, NULL, NULL, ?, 0)",
+                (move_id, name, pp, type_id, power, damage_class, accuracy, target),
+            )
+            for stat_id, change in changes:
+                conn.execute(
+                    "INSERT INTO move_meta_stat_changes VALUES (?, ?, ?)",
+                    (move_id, stat_id, change),
+                )
+
+        for species_id, name, base_stats, types, level_moves in _SPECIES:
+            conn.execute(
+                "INSERT INTO creature_species_data VALUES (?, ?, ?, ?, 7, 69, 64, 5, 4, ?, 'Seed', 45, ?, ?)",
+                (
+                    species_id,
+                    species_id,
+                    species_id,
+                    name,
+                    f"A strange seed was planted on {name}'s back at birth.",
+                    settings.POKEDEX_ID,
+                    LANGUAGE,
+                ),
+            )
+            conn.execute("INSERT INTO pokemon VALUES (?, ?)", (species_id, species_id))
+            for slot, type_id in enumerate(types, start=1):
+                conn.execute(
+                    "INSERT INTO pokemon_types VALUES (?, ?, ?)", (species_id, type_id, slot)
+                )
+            for stat_id, base_stat in enumerate(base_stats, start=1):
+                conn.execute(
+                    "INSERT INTO pokemon_stats VALUES (?, ?, ?)", (species_id, stat_id, base_stat)
+                )
+            for move_id, level in level_moves:
+                conn.execute(
+                    "INSERT INTO pokemon_moves VALUES (?, ?, ?, 1, ?)",
+                    (species_id, VERSION_GROUP, move_id, level),
+                )
+                # Moves from other version groups must not be loaded.
+                conn.execute(
+                    "INSERT INTO pokemon_moves VALUES (?, ?, ?, 1, ?)",
+                    (species_id, VERSION_GROUP + 1, move_id, level + 1),
+                )
+
+        conn.execute("INSERT INTO regions VALUES (1, 'kanto')")
+        conn.execute("INSERT INTO region_names VALUES (1, ?, 'Kanto')", (LANGUAGE,))
+        conn.execute("INSERT INTO locations VALUES (1, 1, 'route-1')")
+        conn.execute("INSERT INTO location_names VALUES (1, ?, 'Route 1')", (LANGUAGE,))
+        conn.executemany(
+            "INSERT INTO location_areas VALUES (?, 1, ?)",
+            [(1, "route-1-area"), (2, "route-1-lake")],
+        )
+        conn.executemany(
+            "INSERT INTO location_area_prose VALUES (?, ?, ?)",
+            [(1, LANGUAGE, "Route 1"), (2, LANGUAGE, "Route 1 Lake")],
+        )
+        conn.executemany(
+            "INSERT INTO location_area_encounter_rates VALUES (?, ?, ?, ?)",
+            [(1, 1, 1, 20), (1, 1, 2, 25), (1, 5, 2, 10), (2, 1, 1, 15)],
+        )
+        conn.executemany(
+            "INSERT INTO encounter_slots VALUES (?, ?, ?)",
+            [(1, 1, 20), (2, 1, 30), (3, 1, 10), (4, 5, 60)],
+        )
+        conn.executemany(
+            "INSERT INTO encounters VALUES (?, 1, ?, ?, ?, ?, ?)",
+            [
+                (1, 1, 1, 1, 3, 5),
+                (2, 1, 2, 1, 2, 4),
+                (3, 1, 3, 4, 5, 5),
+                (4, 1, 4, 7, 10, 20),
+                (5, 2, 1, 7, 8, 9),
+            ],
+        )
+
+        conn.executemany(
+            "INSERT INTO region_map_data_cell_types VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (1, ".", 0, 200, 0, 1, "Grass"),
+                (2, "~", 0, 0, 255, 0, "Water"),
+                (11, " ", 0, 0, 0, 0, "Nothing"),
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO region_map_data VALUES (1, ?, ?, ?)",
+            [(row, column, 2 if column == 3 else 1) for row in range(3) for column in range(4)],
+        )
+
+    return db_file
+
+
+def load_test_static_data(path: Path) -> StaticGameData:
+    """
+    Creates the test database in the given directory and loads the
+    static game data from it.
+    """
+    return Loader(str(create_test_database(path))).load_static_data(LocationAreaRectCollection())
+
+
+def test_species_assembled_from_child_tables(tmp_path):
+    """
+    Types, stats and level moves for each species come from separate
+    tables and should all be attached to the right species.
+    """
+    static_game_data = load_test_static_data(tmp_path)
+
+    bulbasaur = static_game_data.species[1]
+    assert bulbasaur.name == "Bulbasaur"
+    assert [t.name for t in bulbasaur.types] == ["Grass", "Poison"]
+    assert bulbasaur.base_stats[static_game_data.stats[HP_STAT]] == 45
+    assert bulbasaur.base_stats[static_game_data.stats[ACCURACY_STAT]] == 1
+    assert bulbasaur.base_stats[static_game_data.stats[EVASION_STAT]] == 1
+    assert [m.name for m in bulbasaur.level_moves[1]] == ["Tackle"]
+    assert [m.name for m in bulbasaur.level_moves[7]] == ["Vine Whip"]
+    assert bulbasaur.level_moves[2] == []
+
+    charmander = static_game_data.species[4]
+    assert [t.name for t in charmander.types] == ["Fire"]
+    assert [m.name for m in charmander.level_moves[1]] == ["Tackle", "Growl"]
+
+
+def test_records_keep_their_ids(tmp_path):
+    static_game_data = load_test_static_data(tmp_path)
+
+    for species_id, species in static_game_data.species.items():
+        assert species.species_id == species_id
+    for move_id, move_data in static_game_data.moves.items():
+        assert move_data.move_id == move_id
+    for type_id, species_type in static_game_data.types.items():
+        assert species_type.type_id == type_id
+
+
+def test_record_names_are_interned(tmp_path):
+    static_game_data = load_test_static_data(tmp_path)
+
+    poison = static_game_data.species[1].types[1]
+    assert poison.name is sys.intern("Poison")
+    assert static_game_data.moves[22].type.name is static_game_data.species[1].types[0].name
+    assert not hasattr(static_game_data.moves[22], "__dict__")
+
+
+def test_move_stat_changes_loaded(tmp_path):
+    static_game_data = load_test_static_data(tmp_path)
+    attack = static_game_data.stats[ATTACK_STAT]
+
+    assert static_game_data.moves[45].stat_changes[attack] == -1
+    assert static_game_data.moves[45].stat_change_move()
+    assert not static_game_data.moves[33].stat_change_move()
+    assert static_game_data.moves[33].damage_move()
+
+
+def test_location_area_encounters_grouped(tmp_path):
+    """
+    Encounters are grouped by species and encounter method. Encounter
+    rates come from the most recent version.
+    """
+    static_game_data = load_test_static_data(tmp_path)
+
+    area = static_game_data.location_areas[1]
+    assert [(e.species.name, e.min_level, e.max_level, e.rarity) for e in area.walk_encounters] == [
+        ("Bulbasaur", 2, 5, 30),
+        ("Charmander", 5, 5, 10),
+    ]
+    assert area.encounter_rates == {1: 25, 5: 10}
+    assert area.walk_encounter_rate == 25
+    assert [e.species.name for e in area.encounters[5]] == ["Squirtle"]
+
+    lake = static_game_data.location_areas[2]
+    assert [e.species.name for e in lake.walk_encounters] == ["Squirtle"]
+    assert lake.encounter_rates == {1: 15}
+
+
+def test_timings_recorded_per_table(tmp_path):
+    loader = Loader(str(create_test_database(tmp_path)))
+    loader.load_static_data(LocationAreaRectCollection())
+
+    for table in (
+        "creature_species_data",
+        "pokemon_types",
+        "pokemon_stats",
+        "pokemon_moves",
+        "move_data",
+        "move_meta_stat_changes",
+        "location_areas",
+        "encounters",
+    ):
+        assert table in loader.timings
+        assert loader.timings[table] >= 0
+
+
+def test_lazy_static_data_matches_eager(tmp_path):
+    """
+    Lazily loaded tables should contain the same data as the eagerly
+    loaded ones, fetched one row at a time.
+    """
+    loader = Loader(str(create_test_database(tmp_path)))
+    eager = loader.load_static_data(LocationAreaRectCollection())
+    lazy = loader.load_lazy_static_data(LocationAreaRectCollection(), cache_size=2)
+
+    assert list(lazy.species) == list(eager.species)
+    assert list(lazy.moves) == list(eager.moves)
+    assert list(lazy.location_areas) == list(eager.location_areas)
+    assert lazy.species.cached_ids() == []
+
+    bulbasaur = lazy.species[1]
+    assert bulbasaur.name == "Bulbasaur"
+    assert [t.name for t in bulbasaur.types] == ["Grass", "Poison"]
+    assert bulbasaur.base_stats[lazy.stats[HP_STAT]] == 45
+    assert [m.name for m in bulbasaur.level_moves[7]] == ["Vine Whip"]
+    assert lazy.moves[45].stat_changes[lazy.stats[ATTACK_STAT]] == -1
+
+    area = lazy.location_areas[1]
+    assert [(e.species.name, e.min_level, e.max_level, e.rarity) for e in area.walk_encounters] == [
+        ("Bulbasaur", 2, 5, 30),
+        ("Charmander", 5, 5, 10),
+    ]
+    assert area.encounter_rates == {1: 25, 5: 10}
+    assert len(lazy.species.cached_ids()) <= 2
+
+
+def test_records_equal_by_id(tmp_path):
+    db_file = create_test_database(tmp_path)
+    first = Loader(str(db_file)).load_static_data(LocationAreaRectCollection())
+    second = Loader(str(db_file)).load_static_data(LocationAreaRectCollection())
+
+    assert first.species[1] is not second.species[1]
+    assert first.species[1] == second.species[1]
+    assert hash(first.species[1]) == hash(second.species[1])
+    assert first.species[1] != first.species[4]
+    assert first.moves[33] == second.moves[33]
+    assert {first.moves[33]: "Tackle"}[second.moves[33]] == "Tackle"
+    assert first.moves[33] != first.species[1]
+
+
+def test_player_pokedex_leaves_species_unloaded(tmp_path):
+    loader = Loader(str(create_test_database(tmp_path)))
+    lazy = loader.load_lazy_static_data(LocationAreaRectCollection(), cache_size=1)
+    player = Player("Ash", lazy, None, 0, 0)
+
+    assert player.pokedex == {1: (0, 1), 4: (0, 4), 7: (0, 7)}
+    assert lazy.species.cached_ids() == []
+
+    bulbasaur = lazy.species[1]
+    lazy.species[4]
+    assert lazy.species.cached_ids() == [4]
+    assert lazy.species[1] is not bulbasaur
+    assert lazy.species[1] == bulbasaur
+    assert hash(lazy.species[1]) == hash(bulbasaur)
+
+
+def test_lazy_static_data_usable_from_other_threads(tmp_path):
+    loader = Loader(str(create_test_database(tmp_path)))
+    lazy = loader.load_lazy_static_data(LocationAreaRectCollection(), cache_size=1)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        names = list(executor.map(lambda species_id: lazy.species[species_id].name, [1, 4, 7, 1]))
+
+    assert names == ["Bulbasaur", "Charmander", "Squirtle", "Bulbasaur"]
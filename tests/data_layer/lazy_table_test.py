@@ -0,0 +1,54 @@
+import pytest
+
+from CreatureRogue.data_layer.lazy_table import LazyTable
+
+
+def _create_counting_table(max_size: int) -> tuple[LazyTable, list[int]]:
+    """
+    Creates a lazy table of ids 1-5 which records every fetch made.
+    """
+    fetched = []
+
+    def fetch(key):
+        fetched.append(key)
+        return f"value {key}"
+
+    return LazyTable([1, 2, 3, 4, 5], fetch, max_size), fetched
+
+
+def test_values_only_fetched_on_access():
+    table, fetched = _create_counting_table(10)
+    assert len(table) == 5
+    assert list(table) == [1, 2, 3, 4, 5]
+    assert 3 in table
+    assert 6 not in table
+    assert fetched == []
+
+    assert table[3] == "value 3"
+    assert table[3] == "value 3"
+    assert fetched == [3]
+
+
+def test_missing_key_not_fetched():
+    table, fetched = _create_counting_table(10)
+    with pytest.raises(KeyError):
+        table[6]
+    assert table.get(6) is None
+    assert fetched == []
+
+
+def test_least_recently_used_evicted():
+    table, fetched = _create_counting_table(2)
+    table[1]
+    table[2]
+    table[1]
+    table[3]
+    assert table.cached_ids() == [1, 3]
+
+    table[2]
+    assert fetched == [1, 2, 3, 2]
+
+
+def test_cache_size_must_be_positive():
+    with pytest.raises(ValueError):
+        LazyTable([1], lambda key: key, 0)
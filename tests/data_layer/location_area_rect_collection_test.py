@@ -0,0 +1,96 @@
+from CreatureRogue.data_layer.location_area_rect import LocationAreaRect
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+
+
+def _create_collection(*rects: tuple[int, int, int, int, int]) -> LocationAreaRectCollection:
+    collection = LocationAreaRectCollection(cell_size=8)
+    for location_area_id, x1, y1, x2, y2 in rects:
+        collection.add_location_area_rect(LocationAreaRect(location_area_id, x1, y1, x2, y2))
+
+    return collection
+
+
+def test_empty_collection():
+    collection = _create_collection()
+    assert collection.get_location_area_by_position(0, 0) is None
+    assert collection.get_location_areas_in_rect(0, 0, 100, 100) == []
+
+
+def test_position_lookup_inclusive_edges():
+    """
+    Rectangle coordinates are inclusive and rectangles can span several
+    grid cells.
+    """
+    collection = _create_collection((1, 5, 5, 20, 12))
+    assert collection.get_location_area_by_position(5, 5) == 1
+    assert collection.get_location_area_by_position(20, 12) == 1
+    assert collection.get_location_area_by_position(15, 9) == 1
+    assert collection.get_location_area_by_position(4, 5) is None
+    assert collection.get_location_area_by_position(21, 12) is None
+    assert collection.get_location_area_by_position(20, 13) is None
+
+
+def test_overlap_resolved_by_insertion_order():
+    collection = _create_collection((2, 10, 10, 30, 30), (1, 0, 0, 15, 15))
+    assert collection.get_location_area_by_position(12, 12) == 2
+    assert collection.get_location_area_by_position(5, 5) == 1
+
+
+def test_replacing_rect_keeps_precedence_and_moves_area():
+    collection = _create_collection((2, 10, 10, 30, 30), (1, 0, 0, 15, 15))
+    collection.add_location_area_rect(LocationAreaRect(2, 12, 12, 40, 40))
+
+    assert collection.get_location_area_by_position(10, 10) == 1
+    assert collection.get_location_area_by_position(12, 12) == 2
+    assert collection.get_location_area_by_position(35, 35) == 2
+    assert collection.get_location_area_by_position(11, 20) is None
+
+
+def test_areas_in_rect():
+    collection = _create_collection(
+        (3, 50, 50, 60, 60), (1, 0, 0, 9, 9), (2, 5, 5, 20, 20), (4, 100, 0, 110, 5)
+    )
+    assert collection.get_location_areas_in_rect(0, 0, 79, 49) == [1, 2]
+    assert collection.get_location_areas_in_rect(0, 0, 79, 50) == [3, 1, 2]
+    assert collection.get_location_areas_in_rect(21, 21, 49, 49) == []
+    assert collection.get_location_areas_in_rect(90, 0, 200, 200) == [4]
+
+
+def test_matches_linear_scan():
+    """
+    The grid lookup should give exactly the same answer as checking every
+    rectangle in the order they were added.
+    """
+    rects = [
+        (location_area_id, x, y, x + 3 + location_area_id % 17, y + 2 + location_area_id % 11)
+        for location_area_id, (x, y) in enumerate(
+            (i * 37 % 200, i * 53 % 150) for i in range(1, 120)
+        )
+    ]
+    collection = _create_collection(*rects)
+
+    for y in range(0, 170, 3):
+        for x in range(0, 230, 3):
+            expected = next((r[0] for r in rects if r[3] >= x >= r[1] and r[4] >= y >= r[2]), None)
+            assert collection.get_location_area_by_position(x, y) == expected
+
+
+def test_raster_matches_position_lookup():
+    collection = _create_collection((2, 10, 10, 30, 30), (1, 0, 0, 15, 15), (3, 35, 0, 60, 5))
+    raster = collection.to_raster(40, 32)
+
+    assert raster.shape == (32, 40)
+    for y in range(32):
+        for x in range(40):
+            expected = collection.get_location_area_by_position(x, y)
+            assert raster[y, x] == (-1 if expected is None else expected)
+
+
+def test_raster_clips_rects_outside_bounds():
+    collection = _create_collection((1, -5, -5, 2, 2), (2, 8, 8, 100, 100))
+    raster = collection.to_raster(10, 10)
+
+    assert raster[0, 0] == 1
+    assert raster[2, 2] == 1
+    assert raster[3, 3] == -1
+    assert raster[9, 9] == 2
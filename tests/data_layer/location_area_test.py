@@ -1,6 +1,11 @@
+import random
+
+import numpy as np
+import pytest
+
 from CreatureRogue.data_layer.encounter import Encounter
 from CreatureRogue.data_layer.location import Location
-from CreatureRogue.data_layer.location_area import LocationArea
+from CreatureRogue.data_layer.location_area import WALK_ENCOUNTER_METHOD, LocationArea
 from CreatureRogue.data_layer.region import Region
 from tests.data_layer.species_test import create_blank_species
 
@@ -99,3 +104,73 @@ def test_encounter_returned_if_multiple_exist():
         ],
     )
     assert location_area.get_encounter() is not None
+
+
+def _create_location_area(**kwargs) -> LocationArea:
+    return LocationArea(
+        identifier="",
+        name="test",
+        location=Location(
+            identifier="", name="", region=Region(region_id=1, identifier="", name="")
+        ),
+        **kwargs,
+    )
+
+
+def _create_encounters(*rarities: int) -> list[Encounter]:
+    return [
+        Encounter(species=create_blank_species(str(i)), min_level=1, max_level=5, rarity=rarity)
+        for i, rarity in enumerate(rarities)
+    ]
+
+
+def test_encounter_selection_matches_linear_walk():
+    """
+    The same random numbers select the same encounters as walking the
+    encounters and summing their rarities.
+    """
+    encounters = _create_encounters(20, 0, 35, 5, 40)
+    location_area = _create_location_area(walk_encounters=encounters)
+    total_rarity = sum(encounter.rarity for encounter in encounters)
+
+    for rand in range(total_rarity):
+        total = 0
+        expected = None
+        for encounter in encounters:
+            total += encounter.rarity
+            if total > rand:
+                expected = encounter
+                break
+
+        rng = random.Random()
+        rng.randint = lambda a, b, rand=rand: rand
+        assert location_area.get_encounter(rng=rng) is expected
+
+
+def test_encounter_methods():
+    walk, surf = _create_encounters(10), _create_encounters(5, 5)
+    location_area = _create_location_area(
+        encounters={WALK_ENCOUNTER_METHOD: walk, 5: surf}, encounter_rates={1: 25, 5: 10}
+    )
+
+    assert location_area.walk_encounters is walk
+    assert location_area.walk_encounter_rate == 25
+    assert location_area.get_encounter() is walk[0]
+    assert location_area.get_encounter(method=5) in surf
+    assert location_area.get_encounter(method=2) is None
+
+
+def test_sample_encounters():
+    encounters = _create_encounters(10, 0, 30, 60)
+    location_area = _create_location_area(walk_encounters=encounters)
+
+    samples = location_area.sample_encounters(20000, np.random.default_rng(1))
+
+    counts = np.bincount(samples, minlength=4) / len(samples)
+    assert counts[1] == 0
+    assert np.allclose(counts, [0.1, 0, 0.3, 0.6], atol=0.02)
+
+
+def test_sample_encounters_none_available():
+    with pytest.raises(ValueError):
+        _create_location_area(walk_encounters=[]).sample_encounters(5)
@@ -0,0 +1,90 @@
+import sqlite3
+
+import pytest
+
+from CreatureRogue.data_layer.location_area_rect import LocationAreaRect
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+from CreatureRogue.data_layer.map_loader import MapLoader
+from tests.data_layer.db_layer_test import load_test_static_data
+
+
+def _load_test_map(tmp_path, location_area_rects=None):
+    static_game_data = load_test_static_data(tmp_path)
+    return MapLoader(str(tmp_path / "test_pokedex.db3")).load_map(
+        region=static_game_data.regions[1],
+        tile_types=static_game_data.map_data_tile_types,
+        default_tile_type=static_game_data.map_data_tile_types[11],
+        location_area_rects=location_area_rects,
+    )
+
+
+def test_load_map_tiles(tmp_path):
+    map_data = _load_test_map(tmp_path)
+
+    assert len(map_data.tiles) == 3
+    assert len(map_data.tiles[0]) == 4
+    assert map_data.tiles[1][0].display_character == "."
+    assert map_data.tiles[1][3].display_character == "~"
+    assert map_data.location_area_ids is None
+
+
+def test_load_map_bakes_location_areas(tmp_path):
+    rects = LocationAreaRectCollection()
+    rects.add_location_area_rect(LocationAreaRect(1, 0, 0, 1, 2))
+    rects.add_location_area_rect(LocationAreaRect(2, 3, 1, 10, 10))
+    map_data = _load_test_map(tmp_path, rects)
+
+    assert map_data.location_area_ids.shape == (3, 4)
+    assert map_data.location_area_at(0, 0) == 1
+    assert map_data.location_area_at(1, 2) == 1
+    assert map_data.location_area_at(2, 2) is None
+    assert map_data.location_area_at(3, 1) == 2
+    assert map_data.location_area_at(3, 0) is None
+    assert map_data.location_area_at(4, 1) is None
+    assert map_data.location_area_at(-1, 0) is None
+
+
+def test_map_arrays_and_lookup_tables(tmp_path):
+    map_data = _load_test_map(tmp_path)
+
+    assert map_data.tile_type_indices.shape == (3, 4)
+    assert map_data.width == 4
+    assert map_data.height == 3
+    assert map_data.tile_type_at(3, 0).name == "Water"
+    assert map_data.is_traversable(0, 0)
+    assert not map_data.is_traversable(3, 2)
+
+    water_index = map_data.tile_type_indices[0, 3]
+    assert map_data.glyphs[water_index] == ord("~")
+    assert tuple(map_data.colors[water_index]) == (0, 0, 255)
+
+
+def test_tiles_view_behaves_like_nested_lists(tmp_path):
+    map_data = _load_test_map(tmp_path)
+
+    tile = map_data.tiles[2][3]
+    assert (tile.row, tile.column) == (2, 3)
+    assert tile.tile_type.name == "Water"
+    assert tile.color == (0, 0, 255)
+    assert [len(row) for row in map_data.tiles] == [4, 4, 4]
+    with pytest.raises(IndexError):
+        map_data.tiles[3]
+    with pytest.raises(IndexError):
+        map_data.tiles[0][4]
+
+
+def test_missing_tiles_use_default_type(tmp_path):
+    static_game_data = load_test_static_data(tmp_path)
+    with sqlite3.connect(tmp_path / "test_pokedex.db3") as conn:
+        conn.execute('DELETE FROM region_map_data WHERE row = 1 AND "column" = 1')
+        conn.execute('UPDATE region_map_data SET cell_type_id = 99 WHERE row = 0 AND "column" = 0')
+
+    map_data = MapLoader(str(tmp_path / "test_pokedex.db3")).load_map(
+        region=static_game_data.regions[1],
+        tile_types=static_game_data.map_data_tile_types,
+        default_tile_type=static_game_data.map_data_tile_types[11],
+    )
+
+    assert map_data.tile_type_at(1, 1).name == "Nothing"
+    assert map_data.tile_type_at(0, 0).name == "Nothing"
+    assert map_data.tile_type_at(0, 1).name == "Grass"
@@ -0,0 +1,128 @@
+import sqlite3
+
+import pytest
+
+import CreatureRogue.data_layer.snapshot as snapshot
+import CreatureRogue.settings as settings
+from CreatureRogue.data_layer.location_area_rect import LocationAreaRect
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+from tests.data_layer.db_layer_test import create_test_database
+
+
+def test_snapshot_round_trip(tmp_path):
+    """
+    Static data read back from a snapshot should keep the links between
+    objects (e.g. encounters referencing the loaded species).
+    """
+    db_file = str(create_test_database(tmp_path))
+    snapshot_file = str(tmp_path / "test.snapshot")
+    loaded = snapshot.load_static_data(db_file, snapshot_file, LocationAreaRectCollection())
+
+    rects = LocationAreaRectCollection()
+    rects.add_location_area_rect(LocationAreaRect(1, 0, 0, 2, 2))
+    restored = snapshot.read_snapshot(db_file, snapshot_file, rects)
+
+    assert restored is not None
+    assert restored.location_area_rects is rects
+    assert sorted(restored.species) == sorted(loaded.species)
+    assert restored.species[1].name == "Bulbasaur"
+    assert restored.location_areas[1].walk_encounters[0].species is restored.species[1]
+    assert restored.species[4].level_moves[1][0] is restored.moves[33]
+    assert (
+        restored.type_chart.damage_modifier(restored.types[10], restored.types[12])
+        == loaded.type_chart.damage_modifier(loaded.types[10], loaded.types[12])
+        == 200
+    )
+
+
+def test_no_snapshot_returns_none(tmp_path):
+    db_file = str(create_test_database(tmp_path))
+    assert (
+        snapshot.read_snapshot(db_file, str(tmp_path / "missing"), LocationAreaRectCollection())
+        is None
+    )
+
+
+def test_snapshot_stale_when_database_changes(tmp_path):
+    db_file = str(create_test_database(tmp_path))
+    snapshot_file = str(tmp_path / "test.snapshot")
+    snapshot.load_static_data(db_file, snapshot_file, LocationAreaRectCollection())
+
+    with sqlite3.connect(db_file) as conn:
+        conn.execute("UPDATE creature_species_data SET name = 'Ivysaur' WHERE species_id = 1")
+
+    assert snapshot.read_snapshot(db_file, snapshot_file, LocationAreaRectCollection()) is None
+    reloaded = snapshot.load_static_data(db_file, snapshot_file, LocationAreaRectCollection())
+    assert reloaded.species[1].name == "Ivysaur"
+
+
+def test_snapshot_stale_when_settings_change(tmp_path, monkeypatch):
+    db_file = str(create_test_database(tmp_path))
+    snapshot_file = str(tmp_path / "test.snapshot")
+    snapshot.load_static_data(db_file, snapshot_file, LocationAreaRectCollection())
+
+    monkeypatch.setattr(settings, "VERSION_GROUP_ID", settings.VERSION_GROUP_ID + 1)
+
+    assert snapshot.read_snapshot(db_file, snapshot_file, LocationAreaRectCollection()) is None
+
+
+def test_not_a_snapshot_file_ignored(tmp_path):
+    db_file = str(create_test_database(tmp_path))
+    snapshot_file = tmp_path / "test.snapshot"
+    snapshot_file.write_bytes(b"definitely not a snapshot")
+
+    assert snapshot.read_snapshot(db_file, str(snapshot_file), LocationAreaRectCollection()) is None
+
+
+@pytest.mark.parametrize("truncate", [lambda length: 8, lambda length: length // 2])
+def test_truncated_snapshot_rebuilt_from_database(tmp_path, truncate):
+    db_file = str(create_test_database(tmp_path))
+    snapshot_file = tmp_path / "test.snapshot"
+    snapshot.load_static_data(db_file, str(snapshot_file), LocationAreaRectCollection())
+    contents = snapshot_file.read_bytes()
+    snapshot_file.write_bytes(contents[: truncate(len(contents))])
+
+    assert snapshot.read_snapshot(db_file, str(snapshot_file), LocationAreaRectCollection()) is None
+    reloaded = snapshot.load_static_data(db_file, str(snapshot_file), LocationAreaRectCollection())
+    assert reloaded.species[1].name == "Bulbasaur"
+    assert snapshot_file.read_bytes() == contents
+
+
+def test_failed_write_keeps_previous_snapshot(tmp_path, monkeypatch):
+    db_file = str(create_test_database(tmp_path))
+    snapshot_file = tmp_path / "test.snapshot"
+    static_game_data = snapshot.load_static_data(
+        db_file, str(snapshot_file), LocationAreaRectCollection()
+    )
+    contents = snapshot_file.read_bytes()
+
+    def fail(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(snapshot.Path, "replace", fail)
+    with pytest.raises(OSError):
+        snapshot.write_snapshot(static_game_data, db_file, str(snapshot_file))
+
+    assert snapshot_file.read_bytes() == contents
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".tmp"] == []
+
+
+@pytest.mark.parametrize("pickled", ["header", "payload"])
+def test_bad_pickle_protocol_rebuilt_from_database(tmp_path, pickled):
+    db_file = str(create_test_database(tmp_path))
+    snapshot_file = tmp_path / "test.snapshot"
+    snapshot.load_static_data(db_file, str(snapshot_file), LocationAreaRectCollection())
+    contents = snapshot_file.read_bytes()
+
+    # Each pickle starts with the PROTO opcode followed by the protocol.
+    header_start = len(snapshot._MAGIC) + snapshot._HEADER_LENGTH.size
+    (header_length,) = snapshot._HEADER_LENGTH.unpack_from(contents, len(snapshot._MAGIC))
+    protocol_offset = (header_start if pickled == "header" else header_start + header_length) + 1
+    damaged = bytearray(contents)
+    damaged[protocol_offset] = 9
+    snapshot_file.write_bytes(bytes(damaged))
+
+    assert snapshot.read_snapshot(db_file, str(snapshot_file), LocationAreaRectCollection()) is None
+    reloaded = snapshot.load_static_data(db_file, str(snapshot_file), LocationAreaRectCollection())
+    assert reloaded.species[1].name == "Bulbasaur"
+    assert snapshot_file.read_bytes() == contents
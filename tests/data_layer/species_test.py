@@ -162,3 +162,43 @@ def test_move_data_discard_move():
     assert moves[1].name == "4"
     assert moves[2].name == "3"
     assert moves[3].name == "2"
+
+
+def test_move_data_matches_level_scan():
+    """
+    The learnset table gives the same moves as scanning down from the
+    level, including for levels past the last move learnt.
+    """
+    s = create_blank_species("")
+    s.level_moves = {
+        1: [create_default_move_data("1a"), create_default_move_data("1b")],
+        6: [create_default_move_data("6")],
+        9: [],
+        13: [create_default_move_data("13a"), create_default_move_data("13b")],
+        20: [create_default_move_data(f"20{c}") for c in "abcde"],
+        31: [create_default_move_data("31")],
+    }
+
+    for level in range(1, 101):
+        expected = []
+        for lvl in range(level, 0, -1):
+            expected.extend(s.level_moves.get(lvl, []))
+        assert s.move_data_at_level(level) == expected[:4]
+
+
+def test_move_data_replacing_level_moves():
+    s = create_blank_species("")
+    s.level_moves = {1: [create_default_move_data("1")]}
+    assert [m.name for m in s.move_data_at_level(3)] == ["1"]
+
+    s.level_moves = {2: [create_default_move_data("2")]}
+    assert [m.name for m in s.move_data_at_level(3)] == ["2"]
+    assert s.move_data_at_level(1) == []
+
+
+def test_species_without_id_equal_only_to_itself():
+    s = create_blank_species("test")
+
+    assert s == s
+    assert s != create_blank_species("test")
+    assert len({s, create_blank_species("test")}) == 2
@@ -36,3 +36,61 @@ def test_type_chart_not_commutative():
     t2 = Type("2")
     type_chart = TypeChart({t1: {t2: 50}})
     assert type_chart.damage_modifier(t2, t1) == 100
+
+
+def _create_type_chart():
+    fire, water, grass, poison = Type("Fire"), Type("Water"), Type("Grass"), Type("Poison")
+    type_chart = TypeChart(
+        {
+            fire: {grass: 200, water: 50, fire: 50},
+            water: {fire: 200, grass: 50},
+            grass: {water: 200, fire: 50, poison: 50},
+            poison: {grass: 200},
+        },
+        [fire, water, grass, poison, Type("Normal")],
+    )
+
+    return type_chart, fire, water, grass, poison
+
+
+def test_combined_modifier_multiplies_defending_types():
+    type_chart, fire, water, grass, poison = _create_type_chart()
+
+    assert type_chart.combined_modifier(fire, [grass, poison]) == 2
+    assert type_chart.combined_modifier(grass, [grass, poison]) == 0.5
+    assert type_chart.combined_modifier(water, [grass]) == 0.5
+    assert type_chart.combined_modifier(Type("unknown"), [fire]) == 1
+    assert type_chart.combined_modifier(fire, []) == 1
+
+
+def test_batched_modifiers_match_scalar():
+    type_chart, fire, water, grass, poison = _create_type_chart()
+    unknown = Type("unknown")
+    attacking_types = [fire, water, grass, poison, unknown]
+    defenders = [[grass, poison], [fire], [water], [poison, water], [unknown], [grass, unknown]]
+
+    modifiers = type_chart.combined_modifiers(
+        attacking_types, type_chart.defender_indices(defenders)
+    )
+
+    assert modifiers.shape == (5, 6)
+    for i, attacking_type in enumerate(attacking_types):
+        for j, defending_types in enumerate(defenders):
+            assert modifiers[i, j] == type_chart.combined_modifier(attacking_type, defending_types)
+
+
+def test_matrix_matches_chart():
+    type_chart, fire, water, grass, poison = _create_type_chart()
+
+    for attacking_type in (fire, water, grass, poison):
+        for defending_type in (fire, water, grass, poison):
+            assert (
+                type_chart.damage_modifier(attacking_type, defending_type)
+                == (
+                    type_chart.matrix[
+                        type_chart.type_index[attacking_type], type_chart.type_index[defending_type]
+                    ]
+                )
+            )
+    assert (type_chart.matrix[type_chart.neutral_index] == 100).all()
+    assert (type_chart.matrix[:, type_chart.neutral_index] == 100).all()
@@ -0,0 +1,63 @@
+import random
+
+from CreatureRogue.data_layer.growth_rate import GrowthRate
+from CreatureRogue.data_layer.xp_lookup import XpLookup
+from tests.data_layer.species_test import create_blank_species
+
+
+def _create_lookup():
+    fast, slow = GrowthRate("fast"), GrowthRate("slow")
+    xp_map = {
+        fast: {level: 0 if level == 1 else 4 * level**3 // 5 for level in range(1, 101)},
+        slow: {level: 0 if level == 1 else 5 * level**3 // 4 for level in range(1, 101)},
+    }
+    fast_species, slow_species = create_blank_species("fast"), create_blank_species("slow")
+    fast_species.growth_rate = fast
+    slow_species.growth_rate = slow
+
+    return XpLookup(xp_map), xp_map, fast_species, slow_species
+
+
+def _linear_level_at_xp(level_xps: dict[int, int], xp: int) -> int:
+    for level, level_xp in level_xps.items():
+        if xp < level_xp:
+            return level
+
+    return 0
+
+
+def test_level_at_xp_matches_linear_scan():
+    xp_lookup, xp_map, fast_species, slow_species = _create_lookup()
+
+    for species in (fast_species, slow_species):
+        level_xps = xp_map[species.growth_rate]
+        for xp in [-1, 0, 1, *level_xps.values(), *(x - 1 for x in level_xps.values()), 10**9]:
+            assert xp_lookup.level_at_xp(species, xp) == _linear_level_at_xp(level_xps, xp)
+
+
+def test_level_at_xp_unordered_map():
+    """
+    Thresholds are searched in level order whatever order the map is in.
+    """
+    growth_rate = GrowthRate("shuffled")
+    species = create_blank_species("shuffled")
+    species.growth_rate = growth_rate
+    xp_lookup = XpLookup({growth_rate: {3: 20, 1: 0, 2: 8}})
+
+    assert xp_lookup.level_at_xp(species, 0) == 2
+    assert xp_lookup.level_at_xp(species, 19) == 3
+    assert xp_lookup.level_at_xp(species, 20) == 0
+
+
+def test_levels_at_xp_batched():
+    xp_lookup, _, fast_species, slow_species = _create_lookup()
+    rng = random.Random(0)
+    species = [rng.choice((fast_species, slow_species)) for _ in range(500)]
+    xps = [rng.randint(0, 1_300_000) for _ in range(500)]
+
+    levels = xp_lookup.levels_at_xp(species, xps)
+
+    assert levels.tolist() == [
+        xp_lookup.level_at_xp(s, xp) for s, xp in zip(species, xps, strict=True)
+    ]
+    assert xp_lookup.levels_at_xp([], []).tolist() == []
@@ -0,0 +1,106 @@
+import logging
+from types import SimpleNamespace
+
+import tcod
+
+import CreatureRogue.settings as settings
+from CreatureRogue.game import Game, GameConfig
+
+
+class _FakeState:
+    def __init__(self):
+        self.animating = False
+        self.renders = 0
+        self.console = tcod.console.Console(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+
+    def needs_redraw(self) -> bool:
+        return self.animating
+
+    def render(self) -> tcod.console.Console:
+        self.renders += 1
+        return self.console
+
+
+def _create_game(state) -> Game:
+    game = Game(
+        config=GameConfig(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT, settings.TITLE, ""),
+        static_game_data=None,
+        game_data=None,
+        battle_renderer=None,
+        map_renderer=None,
+        pokedex_renderer=None,
+        level_up_renderer=None,
+        game_menu_renderer=None,
+        catch_graphic_renderer=None,
+    )
+    game.state = state
+
+    return game
+
+
+def test_unchanged_frames_are_skipped():
+    state = _FakeState()
+    game = _create_game(state)
+    console = tcod.console.Console(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+
+    assert game.render_frame(console)
+    assert not game.render_frame(console)
+    assert not game.render_frame(console)
+    assert state.renders == 1
+    assert (game.rendered_frames, game.skipped_frames) == (1, 2)
+
+    game.dirty = True
+    assert game.render_frame(console)
+    assert state.renders == 2
+
+
+def test_state_transition_marks_frame_dirty():
+    game = _create_game(_FakeState())
+    console = tcod.console.Console(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    game.render_frame(console)
+
+    new_state = _FakeState()
+    game.state = new_state
+    assert game.render_frame(console)
+    assert new_state.renders == 1
+
+
+def test_animating_state_redrawn_every_frame():
+    state = _FakeState()
+    game = _create_game(state)
+    console = tcod.console.Console(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    game.render_frame(console)
+
+    state.animating = True
+    assert game.render_frame(console)
+    assert game.render_frame(console)
+    state.animating = False
+    assert not game.render_frame(console)
+    assert state.renders == 3
+
+
+class _UnwritableBattleLog:
+    seed = 1
+
+    def finish(self, player_creature, wild_creature, caught, rng):
+        pass
+
+    def write(self, log_file):
+        raise OSError("Read-only file system")
+
+
+def test_battle_log_write_failure_logged(caplog):
+    game = _create_game(_FakeState())
+    game.game_data = SimpleNamespace(
+        battle_data=SimpleNamespace(
+            battle_log=_UnwritableBattleLog(),
+            player_creature=None,
+            defending_creature=lambda: None,
+            rng=None,
+        )
+    )
+
+    with caplog.at_level(logging.WARNING):
+        game._finish_battle_log(caught=False)
+
+    assert "Unable to write battle log" in caplog.text
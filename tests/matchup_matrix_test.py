@@ -0,0 +1,95 @@
+import io
+from pathlib import Path
+
+import numpy as np
+
+import CreatureRogue.data_layer.snapshot as snapshot
+from CreatureRogue.data_layer.location_area_rect_collection import LocationAreaRectCollection
+from CreatureRogue.matchup_matrix import (
+    MatchupResult,
+    matchup_pairs,
+    read_results,
+    run_matchups,
+    simulate_matchup,
+    win_rate_matrix,
+)
+from tests.data_layer.db_layer_test import create_test_database
+
+
+def _prepare(tmp_path):
+    db_file = str(create_test_database(tmp_path))
+    snapshot_file = str(tmp_path / "test.snapshot")
+    static_game_data = snapshot.load_static_data(
+        db_file, snapshot_file, LocationAreaRectCollection()
+    )
+
+    return db_file, snapshot_file, static_game_data
+
+
+def test_matchup_pairs_unordered():
+    assert matchup_pairs([1, 4, 7], [5]) == [
+        (5, 1, 1),
+        (5, 1, 4),
+        (5, 1, 7),
+        (5, 4, 4),
+        (5, 4, 7),
+        (5, 7, 7),
+    ]
+
+
+def test_simulate_matchup_reproducible(tmp_path):
+    _, _, static_game_data = _prepare(tmp_path)
+
+    result = simulate_matchup(static_game_data, 10, 1, 4, 20, seed=3)
+    assert result == simulate_matchup(static_game_data, 10, 1, 4, 20, seed=3)
+    assert result.wins_a + result.wins_b + result.draws == 20
+
+
+def test_run_matchups_matches_single_process_and_resumes(tmp_path):
+    db_file, snapshot_file, static_game_data = _prepare(tmp_path)
+    result_file = str(tmp_path / "matchups.jsonl")
+
+    first = run_matchups(
+        db_file, snapshot_file, [1, 4], [5], 10, result_file, workers=2, chunk_size=1, progress=None
+    )
+    assert sorted(first) == [(5, 1, 1), (5, 1, 4), (5, 4, 4)]
+    assert first[(5, 1, 4)] == simulate_matchup(static_game_data, 5, 1, 4, 10, seed=0)
+
+    # Simulate a run killed whilst writing a line.
+    with Path(result_file).open("a", encoding="utf-8") as f:
+        f.write('{"level": 5, "spec')
+
+    progress = io.StringIO()
+    second = run_matchups(
+        db_file, snapshot_file, [1, 4, 7], [5], 10, result_file, workers=2, progress=progress
+    )
+    assert len(second) == 6
+    assert all(second[key] == first[key] for key in first)
+    assert "3/3 pairs" in progress.getvalue()
+    assert read_results(result_file) == second
+
+
+def test_win_rate_matrix(tmp_path):
+    db_file, snapshot_file, _ = _prepare(tmp_path)
+    results = run_matchups(
+        db_file,
+        snapshot_file,
+        [1, 4],
+        [5, 30],
+        10,
+        str(tmp_path / "matchups.jsonl"),
+        workers=1,
+        progress=None,
+    )
+
+    matrix = win_rate_matrix(results, [1, 4], 30)
+    assert matrix[0, 1] == results[(30, 1, 4)].wins_a / 10
+    assert matrix[1, 0] == results[(30, 1, 4)].wins_b / 10
+    assert not np.isnan(matrix).any()
+
+
+def test_win_rate_matrix_mirror_matchup():
+    results = {(5, 1, 1): MatchupResult(5, 1, 1, 0, 10, wins_a=6, wins_b=3, turns=50)}
+
+    matrix = win_rate_matrix(results, [1], 5)
+    assert matrix[0, 0] == 0.45
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+
+import CreatureRogue.battle_calculations as battle_calculations
+from CreatureRogue.data_layer.data import ATTACK_STAT, HP_STAT
+from CreatureRogue.models.battle_snapshot import BattleRules, BattleSnapshot
+from CreatureRogue.rng import RandomStream
+
+
+def _move_index(battle_creature, name: str) -> int:
+    return [move.move_data.name for move in battle_creature.creature.moves].index(name)
+
+
+def test_snapshot_round_trips_through_battle_data(static_game_data, make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    battle_data = SimpleNamespace(player_creature=charmander, defending_creature=lambda: bulbasaur)
+    snapshot = BattleSnapshot.from_battle_data(battle_data)
+
+    battle_calculations.perform_turn(
+        charmander.creature.moves[0],
+        charmander,
+        bulbasaur.creature.moves[0],
+        bulbasaur,
+        static_game_data,
+        RandomStream(0),
+    )
+    assert BattleSnapshot.from_battle_data(battle_data) != snapshot
+
+    snapshot.restore(battle_data)
+    assert BattleSnapshot.from_battle_data(battle_data) == snapshot
+    assert hash(BattleSnapshot.from_battle_data(battle_data)) == hash(snapshot)
+
+
+def test_apply_move_matches_perform_move(static_game_data, make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    hp_stat = static_game_data.stats[HP_STAT]
+    rules = BattleRules(charmander, bulbasaur)
+    snapshot = BattleSnapshot.from_creatures(charmander, bulbasaur)
+    ember = _move_index(charmander, "Ember")
+
+    after = snapshot.apply_move(rules, 0, ember)
+    damage = battle_calculations.move_damage_distribution(
+        charmander.creature.moves[ember], charmander, bulbasaur, static_game_data.type_chart
+    ).damage
+
+    assert after.creature_b.hp == bulbasaur.creature.current_stat(hp_stat) - damage
+    assert after.creature_a.pp[ember] == snapshot.creature_a.pp[ember] - 1
+    assert after.creature_a.hp == snapshot.creature_a.hp
+    # The snapshot it was applied to is unchanged.
+    assert snapshot == BattleSnapshot.from_creatures(charmander, bulbasaur)
+
+
+def test_apply_move_changes_stats_and_faints(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    rules = BattleRules(charmander, bulbasaur)
+    snapshot = BattleSnapshot.from_creatures(charmander, bulbasaur)
+
+    growled = snapshot.apply_move(rules, 1, _move_index(bulbasaur, "Growl"))
+    assert growled.creature_a.stat_adjusts[ATTACK_STAT] == -1
+
+    missed = snapshot.apply_move(rules, 0, _move_index(charmander, "Ember"), hit=False)
+    assert missed.creature_b == snapshot.creature_b
+
+    low_hp = snapshot._replace(creature_b=snapshot.creature_b._replace(hp=1))
+    fainted = low_hp.apply_move(rules, 0, _move_index(charmander, "Ember"))
+    assert fainted.creature_b.hp == 0
+    assert fainted.creature_b.fainted
+    assert fainted.finished()
+
+
+def test_move_outcome_chances_sum_to_one(make_battle_creature):
+    charmander = make_battle_creature(4)
+    bulbasaur = make_battle_creature(1)
+    rules = BattleRules(charmander, bulbasaur)
+    snapshot = BattleSnapshot.from_creatures(charmander, bulbasaur)
+
+    for move_index in snapshot.options(0):
+        outcomes = snapshot.move_outcomes(rules, 0, move_index)
+        assert sum(chance for _, chance in outcomes) == pytest.approx(1)
@@ -0,0 +1,160 @@
+import math
+
+import pytest
+
+import CreatureRogue.creature_creator as creature_creator
+from CreatureRogue.data_layer.data import ATTACK_STAT, HP_STAT, SPEED_STAT
+from CreatureRogue.data_layer.stat import Stat
+from CreatureRogue.models.creature import Creature
+from CreatureRogue.models.stat_values import StatValues, stat_array
+
+
+def _create_creature(static_game_data, level: int = 10) -> Creature:
+    return Creature(
+        species=static_game_data.species[1],
+        level=level,
+        nickname=None,
+        trainer=None,
+        individual_values=dict.fromkeys(static_game_data.stats.values(), 10),
+        effort_values=creature_creator.zero_stat_values(static_game_data.stats),
+        current_xp=1,
+        was_traded=False,
+        moves=[],
+    )
+
+
+def _expected_max_stat(creature: Creature, stat: Stat, level: int, hp: bool) -> int:
+    base = (
+        creature.individual_values[stat]
+        + creature.species.base_stats[stat]
+        + math.sqrt(creature.effort_values[stat]) / 8
+    )
+    if hp:
+        return int((base + 50) * level / 50 + 10)
+    return int(base * level / 50 + 5)
+
+
+def test_max_stats(static_game_data):
+    creature = _create_creature(static_game_data)
+    hp_stat = static_game_data.stats[HP_STAT]
+
+    for stat in creature.species.base_stats:
+        assert creature.max_stat(stat) == _expected_max_stat(creature, stat, 10, stat is hp_stat)
+        assert creature.max_stat(stat, 40) == _expected_max_stat(
+            creature, stat, 40, stat is hp_stat
+        )
+        assert creature.current_stat(stat) == creature.max_stat(stat)
+
+
+def test_hp_identified_by_stat_id(static_game_data):
+    creature = _create_creature(static_game_data)
+    hp_stat = static_game_data.stats[HP_STAT]
+    expected = creature.max_stat(hp_stat)
+
+    hp_stat.name = "Hit Points"
+    creature.level = creature.level
+
+    assert creature.max_stat(hp_stat) == expected
+
+
+def test_max_stats_recalculated_on_change(static_game_data):
+    creature = _create_creature(static_game_data)
+    attack_stat = static_game_data.stats[ATTACK_STAT]
+    speed_stat = static_game_data.stats[SPEED_STAT]
+    original = creature.max_stat(attack_stat)
+
+    creature.level = 50
+    assert creature.max_stat(attack_stat) == _expected_max_stat(creature, attack_stat, 50, False)
+
+    creature.individual_values = {**creature.individual_values, speed_stat: 15}
+    assert creature.max_stat(speed_stat) == _expected_max_stat(creature, speed_stat, 50, False)
+
+    creature.effort_values = {**creature.effort_values, attack_stat: 6400}
+    assert creature.max_stat(attack_stat) == _expected_max_stat(creature, attack_stat, 50, False)
+    assert creature.max_stat(attack_stat, 10) > original
+
+
+def test_adjust_stat_capped(static_game_data):
+    creature = _create_creature(static_game_data)
+    hp_stat = static_game_data.stats[HP_STAT]
+    max_hp = creature.max_stat(hp_stat)
+
+    creature.adjust_stat(hp_stat, 5)
+    assert creature.current_stat(hp_stat) == max_hp - 5
+    creature.adjust_stat(hp_stat, -100)
+    assert creature.current_stat(hp_stat) == max_hp
+    creature.adjust_stat(hp_stat, 1000)
+    assert creature.current_stat(hp_stat) == 0
+
+
+def test_stat_views_behave_like_dicts(static_game_data):
+    creature = _create_creature(static_game_data)
+    attack_stat = static_game_data.stats[ATTACK_STAT]
+
+    assert list(creature.stats) == list(creature.species.base_stats)
+    assert dict(creature.individual_values) == dict.fromkeys(creature.species.base_stats, 10)
+    assert creature.stats[attack_stat] == creature.current_stat(attack_stat)
+    with pytest.raises(KeyError):
+        creature.stats[Stat("Unknown", "Unk")]
+
+    creature.stats[attack_stat] = 3
+    assert creature.current_stat(attack_stat) == 3
+
+
+@pytest.mark.parametrize("stat_id", [0, -1, ATTACK_STAT, 100])
+def test_stat_views_reject_stats_without_values(static_game_data, stat_id):
+    creature = _create_creature(static_game_data)
+    stat = Stat("Other", "Oth", stat_id)
+
+    assert stat not in creature.stats
+    with pytest.raises(KeyError):
+        creature.stats[stat]
+    assert creature.stats.get(stat) is None
+
+
+def test_stat_views_only_iterate_stats_with_slots(static_game_data):
+    attack_stat = static_game_data.stats[ATTACK_STAT]
+    padding_stat = Stat("Padding", "Pad", 0)
+    view = StatValues(stat_array(), {attack_stat: 1, padding_stat: 1})
+
+    assert list(view) == [attack_stat]
+    assert len(view) == 1
+    assert padding_stat not in view
+
+
+def test_stat_values_copied_by_stat_id(static_game_data):
+    creature = _create_creature(static_game_data)
+    attack_stat = static_game_data.stats[ATTACK_STAT]
+    stats = creature.stats.by_stat_id()
+
+    assert stats[ATTACK_STAT] == creature.current_stat(attack_stat)
+    creature.adjust_stat(attack_stat, 1)
+    assert stats[ATTACK_STAT] == creature.current_stat(attack_stat) + 1
+
+    creature.stats.set_by_stat_id(stats)
+    assert creature.stats.by_stat_id() == stats
+    with pytest.raises(ValueError):
+        creature.stats.set_by_stat_id(stats[1:])
+
+    individual_values = list(creature.individual_values.by_stat_id())
+    individual_values[ATTACK_STAT] = 60
+    creature.max_stat(attack_stat)
+    creature.individual_values.set_by_stat_id(tuple(individual_values))
+    assert creature.max_stat(attack_stat) == _expected_max_stat(creature, attack_stat, 10, False)
+
+
+def test_changing_single_iv_recalculates_max_stats(static_game_data):
+    creature = _create_creature(static_game_data)
+    attack_stat = static_game_data.stats[ATTACK_STAT]
+
+    creature.max_stat(attack_stat)
+    creature.individual_values[attack_stat] = 60
+    assert creature.max_stat(attack_stat) == _expected_max_stat(creature, attack_stat, 10, False)
+
+
+def test_creature_is_slotted(static_game_data):
+    creature = _create_creature(static_game_data)
+
+    assert not hasattr(creature, "__dict__")
+    with pytest.raises(AttributeError):
+        creature.not_an_attribute = 1
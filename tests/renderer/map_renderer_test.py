@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+import CreatureRogue.settings as settings
+from CreatureRogue.data_layer.map_data_tile_type import MapDataTileType
+from CreatureRogue.data_layer.map_loader import MapData
+from CreatureRogue.data_layer.region import Region
+from CreatureRogue.renderer.map_renderer import MapRenderer
+
+
+def _create_map(rows: int, columns: int) -> MapData:
+    tile_types = [
+        MapDataTileType("Grass", ".", 0, 255, 0, True),
+        MapDataTileType("Water", "~", 0, 0, 255, False),
+        MapDataTileType("Tree", "T", 0, 120, 0, False),
+    ]
+    tile_type_indices = (np.arange(rows * columns).reshape(rows, columns) % 7 % 3).astype(np.uint8)
+
+    return MapData(Region(1, "test", "Test"), tile_types, tile_type_indices)
+
+
+def _expected_screen(map_data: MapData, start_x: int, start_y: int):
+    """
+    What the map portion of the screen should look like, worked out one
+    cell at a time.
+    """
+    ch = np.full((settings.SCREEN_HEIGHT, settings.SCREEN_WIDTH), ord(" "))
+    fg = np.empty((settings.SCREEN_HEIGHT, settings.SCREEN_WIDTH, 3), dtype=np.uint8)
+    fg[...] = settings.FOREGROUND_COLOR
+    for y in range(settings.SCREEN_HEIGHT):
+        for x in range(settings.SCREEN_WIDTH):
+            if map_data.height > start_y + y >= 0 and map_data.width > start_x + x >= 0:
+                tile_type = map_data.tile_type_at(start_x + x, start_y + y)
+                ch[y, x] = ord(tile_type.display_character)
+                fg[y, x] = tile_type.color
+
+    return ch, fg
+
+
+def test_render_matches_cell_by_cell_render():
+    map_data = _create_map(70, 120)
+    renderer = MapRenderer()
+
+    for coords in ((0, 0), (119, 69), (60, 35), (3, 66), (117, 2)):
+        player = SimpleNamespace(map_data=map_data, coords=coords)
+        console = renderer.render(player)
+
+        ch, fg = _expected_screen(map_data, renderer.start_x, renderer.start_y)
+        player_x, player_y = coords[0] - renderer.start_x, coords[1] - renderer.start_y
+        ch[player_y, player_x] = ord("@")
+        fg[player_y, player_x] = settings.PLAYER_COLOR
+
+        assert (console.ch == ch).all()
+        assert (console.fg == fg).all()
+        assert (console.bg == settings.BACKGROUND_COLOR).all()
+
+
+def test_render_map_smaller_than_screen():
+    map_data = _create_map(3, 4)
+    console = MapRenderer().render(SimpleNamespace(map_data=map_data, coords=(1, 1)))
+
+    assert chr(console.ch[settings.SCREEN_HEIGHT // 2 - 1, settings.SCREEN_WIDTH // 2 - 1]) == "."
+    assert (console.ch != ord(" ")).sum() == 12
+
+
+def test_changing_map_rebuilds_cache():
+    renderer = MapRenderer()
+    renderer.render(SimpleNamespace(map_data=_create_map(60, 90), coords=(10, 10)))
+    small_map = _create_map(3, 4)
+    console = renderer.render(SimpleNamespace(map_data=small_map, coords=(0, 0)))
+
+    assert (console.ch != ord(" ")).sum() == 12
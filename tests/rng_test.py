@@ -0,0 +1,60 @@
+import pytest
+
+from CreatureRogue.rng import RandomStream
+
+
+def _draws(rng: RandomStream, n: int = 50) -> list:
+    return [rng.random() for _ in range(n)]
+
+
+def test_same_seed_same_stream():
+    assert _draws(RandomStream(7)) == _draws(RandomStream(7))
+    assert _draws(RandomStream(7)) != _draws(RandomStream(8))
+    assert _draws(RandomStream((7, 1))) != _draws(RandomStream((7, 2)))
+
+
+def test_block_size_does_not_change_stream():
+    assert _draws(RandomStream(3, block_size=7)) == _draws(RandomStream(3, block_size=4096))
+
+
+def test_randint_covers_inclusive_range():
+    rng = RandomStream(0)
+    values = [rng.randint(2, 5) for _ in range(1000)]
+
+    assert set(values) == {2, 3, 4, 5}
+    assert rng.randint(4, 4) == 4
+    with pytest.raises(ValueError):
+        rng.randint(1, 0)
+
+
+def test_randrange_and_uniform_bounds():
+    rng = RandomStream(0)
+
+    assert {rng.randrange(3) for _ in range(500)} == {0, 1, 2}
+    assert {rng.randrange(5, 7) for _ in range(500)} == {5, 6}
+    assert all(1.5 <= rng.uniform(1.5, 2.5) < 2.5 for _ in range(500))
+
+
+def test_choice():
+    rng = RandomStream(0)
+
+    assert {rng.choice("abc") for _ in range(500)} == {"a", "b", "c"}
+    with pytest.raises(IndexError):
+        rng.choice([])
+
+
+def test_getrandbits():
+    rng = RandomStream(0)
+    values = [rng.getrandbits(40) for _ in range(200)]
+
+    assert all(0 <= value < 1 << 40 for value in values)
+    assert max(values) >= 1 << 39
+    assert len(set(values)) == len(values)
+
+
+def test_spawned_streams_are_independent_and_reproducible():
+    children = RandomStream(11).spawn(3)
+    draws = [_draws(child) for child in children]
+
+    assert len({tuple(d) for d in draws}) == 3
+    assert draws == [_draws(child) for child in RandomStream(11).spawn(3)]
@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+import tcod
+
+from CreatureRogue.battle_ai import RandomMoveAi
+from CreatureRogue.data_layer.data import HP_STAT
+from CreatureRogue.models.battle_data import BattleData
+from CreatureRogue.rng import RandomStream
+from CreatureRogue.states.battle_state import BattleState
+
+
+class _BlockingAi(RandomMoveAi):
+    """
+    Doesn't select a move until released.
+    """
+
+    def __init__(self, battle_creature, rng):
+        super().__init__(battle_creature, rng)
+        self.release = threading.Event()
+
+    def select_move(self, opponent=None):
+        self.release.wait(timeout=5)
+        return super().select_move(opponent)
+
+
+class _FakeRenderer:
+    def __init__(self):
+        self.thinking = []
+
+    def render(self, battle_data, messages, selecting_pokeball, thinking=False):
+        self.thinking.append(thinking)
+        return tcod.console.Console(1, 1)
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
+
+def _battle_state(static_game_data, make_battle_creature, executor, ai):
+    rng = RandomStream(0)
+    wild_creature = make_battle_creature(1)
+    game_data = SimpleNamespace(battle_data=None)
+    game_data.battle_data = BattleData(
+        game_data,
+        make_battle_creature(4),
+        ai(wild_creature, rng),
+        wild_creature=wild_creature,
+        rng=rng,
+    )
+    game = SimpleNamespace(static_game_data=static_game_data, ai_executor=executor)
+    renderer = _FakeRenderer()
+
+    return BattleState(game, game_data, renderer, None, None), renderer
+
+
+def _key(sym) -> tcod.event.KeyDown:
+    return tcod.event.KeyDown(scancode=0, sym=sym, mod=tcod.event.Modifier.NONE)
+
+
+def test_turn_waits_for_computer_move(static_game_data, make_battle_creature, executor):
+    state, renderer = _battle_state(static_game_data, make_battle_creature, executor, _BlockingAi)
+    battle_data = state.game_data.battle_data
+    hp_stat = static_game_data.stats[HP_STAT]
+    wild_hp = battle_data.wild_creature.creature.current_stat(hp_stat)
+
+    state.handle_input(_key(tcod.event.KeySym.N1))
+    assert state.thinking()
+    assert state.needs_redraw()
+
+    state.render()
+    assert renderer.thinking == [True]
+    assert len(state.messages) == 0
+    assert battle_data.wild_creature.creature.current_stat(hp_stat) == wild_hp
+
+    # Further moves are ignored until the turn has been performed.
+    pending_turn = state.pending_turn
+    state.handle_input(_key(tcod.event.KeySym.N2))
+    assert state.pending_turn is pending_turn
+
+    battle_data.computer_ai.release.set()
+    pending_turn[1].result(timeout=5)
+    state.render()
+
+    assert renderer.thinking == [True, False]
+    assert not state.thinking()
+    assert not state.needs_redraw()
+    assert len(state.messages) > 0
+
+
+def test_computer_ai_errors_raised_on_render(static_game_data, make_battle_creature, executor):
+    class FailingAi(RandomMoveAi):
+        def select_move(self, opponent=None):
+            raise RuntimeError("AI failed")
+
+    state, _ = _battle_state(static_game_data, make_battle_creature, executor, FailingAi)
+
+    state.handle_input(_key(tcod.event.KeySym.N1))
+    state.pending_turn[1].exception(timeout=5)
+
+    with pytest.raises(RuntimeError, match="AI failed"):
+        state.render()